@@ -8,6 +8,7 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
 import threading
+import multiprocessing
 import queue
 import time
 import os
@@ -22,7 +23,29 @@ from extractor_independiente import ExtractorIndependiente
 from processors.excel_processor import ExcelProcessor
 from excel_processor_simple import ExcelProcessorSimple
 from utils.pdf_reader import PDFReader
+from utils.cache_texto import CacheTexto
 from ui.processing_manager import ProcessingManager
+from utils.procesamiento_paralelo import PoolExtraccion
+
+class ExtraccionPDF:
+    """Lee y extrae un PDF; definida a nivel de módulo para enviarla a los procesos"""
+    
+    def __init__(self, pdf_reader, extractor):
+        self.pdf_reader = pdf_reader
+        self.extractor = extractor
+    
+    def __call__(self, ruta_pdf):
+        # Leer y extraer PDF con extractor COMPLETO
+        texto = self.pdf_reader.extraer_texto(ruta_pdf)
+        datos = self.extractor.extract(texto, ruta_pdf)
+        
+        # Agregar metadatos
+        datos['_metadata'] = {
+            'archivo': Path(ruta_pdf).name,
+            'procesado': True,
+            'fecha_procesamiento': time.strftime('%Y-%m-%d %H:%M:%S')
+        }
+        return datos
 
 class ConvertidorDataCredito:
     """Convertidor unificado de PDFs DataCrédito a Excel - Versión 2.1"""
@@ -204,9 +227,10 @@ class ConvertidorDataCredito:
         """Configurar procesadores del sistema modular"""
         try:
             # Inicializar componentes MEJORADOS para extraer TODA la información
-            self.pdf_reader = PDFReader()
+            self.pdf_reader = PDFReader(cache=CacheTexto())  # Reprocesar no vuelve a analizar PDFs
             self.excel_processor = ExcelProcessorSimple()  # Procesador simple y robusto
             self.extractor = ExtractorIndependiente()  # Extractor independiente robusto
+            self.trabajadores = None  # Procesos en paralelo según núcleos y RAM disponible
             
             # Configurar ProcessingManager con componentes completos
             self.processing_manager = ProcessingManager(self.pdf_reader, self.excel_processor, self.extractor)
@@ -332,35 +356,27 @@ class ConvertidorDataCredito:
                 
             self.queue.put(("mensaje", f"📄 Encontrados {total_archivos} archivos PDF"))
             
-            # Procesar cada archivo
+            # Procesar cada archivo (en paralelo, resultados en el orden de entrada)
             datos_procesados = []
             exitosos = 0
+            pool = PoolExtraccion(ExtraccionPDF(self.pdf_reader, self.extractor), self.trabajadores)
             
-            for i, archivo_pdf in enumerate(archivos_pdf):
-                try:
-                    # Actualizar progreso
-                    progreso = (i / total_archivos) * 90
-                    self.queue.put(("progreso", (progreso, f"Procesando: {archivo_pdf.name}")))
-                    self.queue.put(("mensaje", f"🔄 ({i+1}/{total_archivos}) {archivo_pdf.name}"))
-                    
-                    # Leer y extraer PDF con extractor COMPLETO
-                    texto = self.pdf_reader.extraer_texto(str(archivo_pdf))
-                    datos = self.extractor.extract(texto, str(archivo_pdf))
-                    
-                    # Agregar metadatos
-                    datos['_metadata'] = {
-                        'archivo': archivo_pdf.name,
-                        'procesado': True,
-                        'fecha_procesamiento': time.strftime('%Y-%m-%d %H:%M:%S')
-                    }
-                    
+            for i, (_, ruta, datos, error) in enumerate(pool.procesar(archivos_pdf)):
+                archivo_pdf = Path(ruta)
+                
+                # Actualizar progreso
+                progreso = ((i + 1) / total_archivos) * 90
+                self.queue.put(("progreso", (progreso, f"Procesado: {archivo_pdf.name}")))
+                self.queue.put(("mensaje", f"🔄 ({i+1}/{total_archivos}) {archivo_pdf.name}"))
+                
+                if error is None:
                     datos_procesados.append(datos)
                     exitosos += 1
                     
                     self.queue.put(("mensaje", f"✅ {archivo_pdf.name} procesado correctamente"))
                     
-                except Exception as e:
-                    error_msg = f"❌ Error en {archivo_pdf.name}: {str(e)}"
+                else:
+                    error_msg = f"❌ Error en {archivo_pdf.name}: {error}"
                     self.queue.put(("mensaje", error_msg))
                     
                     # Registro de error
@@ -368,7 +384,7 @@ class ConvertidorDataCredito:
                         '_metadata': {
                             'archivo': archivo_pdf.name, 
                             'procesado': False,
-                            'error': str(e),
+                            'error': error,
                             'fecha_procesamiento': time.strftime('%Y-%m-%d %H:%M:%S')
                         }
                     }
@@ -540,4 +556,5 @@ def main():
         messagebox.showerror("Error Fatal", f"Error al iniciar la aplicación:\n{e}")
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # Pool de procesos en el ejecutable (.exe)
     main()
\ No newline at end of file
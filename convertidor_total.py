@@ -4,13 +4,16 @@ CONVERTIDOR TOTAL - Sistema completo de extracción masiva
 Captura ABSOLUTAMENTE TODOS los datos de los PDFs DataCrédito
 """
 import os
-import pdfplumber
 from typing import List, Dict, Any
 import sys
 from datetime import datetime
 
 # Importar extractores
 try:
+    import setup_paths
+    from utils.pdf_reader import PDFReader
+    from utils.cache_texto import CacheTexto
+    from utils.documento_pdf import DocumentoPDF
     from extractor_total import ExtractorTotal
     from excel_processor_total import ExcelProcessorTotal
 except ImportError as e:
@@ -20,9 +23,11 @@ except ImportError as e:
 class ConvertidorTotal:
     """Convertidor completo con extracción masiva"""
     
-    def __init__(self):
+    def __init__(self, usar_cache: bool = True):
         self.nombre = "Convertidor Total DataCrédito"
         self.version = "1.0 - EXTRACCIÓN MASIVA"
+        # Con caché, reprocesar una carpeta solo repite el trabajo de extracción
+        self.pdf_reader = PDFReader(cache=CacheTexto() if usar_cache else None)
         self.extractor = ExtractorTotal()
         self.procesador = ExcelProcessorTotal()
         
@@ -86,6 +91,9 @@ class ConvertidorTotal:
         print(f"   ✅ PDFs procesados exitosamente: {procesados}")
         print(f"   ❌ PDFs con errores: {errores}")
         print(f"   📄 Total PDFs: {len(archivos_pdf)}")
+        if self.pdf_reader.cache is not None:
+            estadisticas = self.pdf_reader.cache.estadisticas
+            print(f"   🗄️ Caché de texto: {estadisticas['aciertos']} aciertos, {estadisticas['fallos']} fallos")
         
         if procesados == 0:
             print("❌ No se procesó ningún PDF exitosamente")
@@ -123,15 +131,17 @@ class ConvertidorTotal:
         """Procesa un PDF completo extrayendo TODOS los datos"""
         
         try:
-            # Extraer texto completo
-            texto_completo = self.extraer_texto_completo(archivo_pdf)
-            
-            if not texto_completo:
-                print(f"   ⚠️ No se pudo extraer texto")
-                return {}
-            
-            # Aplicar extractor total
-            datos_extraidos = self.extractor.extract(texto_completo, archivo_pdf)
+            # Una sola sesión sirve el texto y las tablas al extractor
+            with self.pdf_reader.abrir(archivo_pdf) as documento:
+                # Extraer texto completo
+                texto_completo = self.extraer_texto_completo(documento)
+                
+                if not texto_completo:
+                    print(f"   ⚠️ No se pudo extraer texto")
+                    return {}
+                
+                # Aplicar extractor total
+                datos_extraidos = self.extractor.extract(texto_completo, archivo_pdf, documento)
             
             return datos_extraidos
             
@@ -139,25 +149,21 @@ class ConvertidorTotal:
             print(f"   ❌ Error procesando PDF: {e}")
             return {}
     
-    def extraer_texto_completo(self, archivo_pdf: str) -> str:
-        """Extrae todo el texto del PDF"""
+    def extraer_texto_completo(self, documento: DocumentoPDF) -> str:
+        """Extrae todo el texto del PDF con marcas de página"""
         
-        texto_completo = ""
+        partes = []
         
         try:
-            with pdfplumber.open(archivo_pdf) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    texto_pagina = page.extract_text()
-                    if texto_pagina:
-                        texto_completo += f"\n=== PÁGINA {page_num} ===\n"
-                        texto_completo += texto_pagina
-                        texto_completo += "\n"
+            for page_num, texto_pagina in documento.paginas():
+                if texto_pagina:
+                    partes.append(f"\n=== PÁGINA {page_num + 1} ===\n{texto_pagina}\n")
                         
         except Exception as e:
             print(f"   ❌ Error extrayendo texto: {e}")
             return ""
         
-        return texto_completo
+        return "".join(partes)
 
 def main():
     """Función principal"""
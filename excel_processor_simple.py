@@ -3,9 +3,14 @@
 Procesador de Excel Simplificado - Sin dependencias complejas
 """
 from typing import List, Dict, Any
+
+import pandas as pd
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment
 
+import setup_paths
+from utils.normalizacion import a_celda, normalizar_dataframe
+
 class ExcelProcessorSimple:
     """Procesador Excel simple y robusto"""
     
@@ -56,11 +61,14 @@ class ExcelProcessorSimple:
                 celda.fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
                 celda.alignment = Alignment(horizontal='center', wrap_text=True)
             
-            # Escribir datos
-            for fila, registro in enumerate(datos, 2):
-                for col, campo in enumerate(campos_ordenados, 1):
-                    valor = self.obtener_valor_campo(registro, campo)
-                    ws.cell(row=fila, column=col, value=valor)
+            # Escribir datos (montos, porcentajes y fechas convertidos por columna)
+            tabla = normalizar_dataframe(pd.DataFrame(
+                [[self.obtener_valor_campo(registro, campo) for campo in campos_ordenados] for registro in datos],
+                columns=campos_ordenados
+            ))
+            for fila, valores in enumerate(tabla.itertuples(index=False, name=None), 2):
+                for col, valor in enumerate(valores, 1):
+                    ws.cell(row=fila, column=col, value=a_celda(valor))
             
             # Ajustar ancho de columnas (básico)
             for col in range(1, len(campos_ordenados) + 1):
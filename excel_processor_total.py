@@ -7,6 +7,9 @@ from typing import Dict, Any, List
 import os
 from datetime import datetime
 
+import setup_paths
+from utils.normalizacion import normalizar_dataframe
+
 class ExcelProcessorTotal:
     """Procesador que maneja TODOS los campos extraídos"""
     
@@ -99,7 +102,8 @@ class ExcelProcessorTotal:
         # Reordenar DataFrame
         df = df[columnas_ordenadas]
         
-        return df
+        # Montos, porcentajes y fechas como números y fechas reales (columna por columna)
+        return normalizar_dataframe(df)
     
     def generar_excel(self, df: pd.DataFrame, carpeta_pdfs: str) -> str:
         """Genera archivo Excel con formato"""
@@ -7,9 +7,10 @@ import re
 from typing import Dict, Any
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import setup_paths
 
-from src.extractors.base_extractor import BaseExtractor
+from extractors.base_extractor import BaseExtractor
+from utils.patrones import REGISTRO
 
 class ExtractorDiagnostico(BaseExtractor):
     """Extractor que muestra diagnóstico detallado de cada extracción"""
@@ -25,11 +26,11 @@ class ExtractorDiagnostico(BaseExtractor):
         print(f"🔍 DIAGNÓSTICO DE EXTRACCIÓN: {archivo}")
         print(f"{'='*80}")
         print(f"📄 Longitud del texto: {len(texto)} caracteres")
-        print(f"📝 Líneas de texto: {len(texto.split('\\n'))}")
+        lineas = texto.split('\\n')
+        print(f"📝 Líneas de texto: {len(lineas)}")
         
         # Mostrar primeras líneas del texto
         print(f"\n📋 PRIMERAS 20 LÍNEAS DEL PDF:")
-        lineas = texto.split('\\n')
         for i, linea in enumerate(lineas[:20], 1):
             if linea.strip():
                 print(f"   {i:2d}: {linea.strip()}")
@@ -239,24 +240,86 @@ class ExtractorDiagnostico(BaseExtractor):
         """Extrae un campo con diagnóstico detallado"""
         print(f"\\n🔍 Extrayendo '{nombre_campo}':")
         
-        for i, patron in enumerate(patrones, 1):
-            print(f"   Patrón {i}: {patron}")
-            matches = re.findall(patron, texto, re.IGNORECASE | re.MULTILINE)
-            
-            if matches:
-                valor = matches[0].strip() if isinstance(matches[0], str) else str(matches[0]).strip()
-                print(f"   ✅ ENCONTRADO: '{valor}' (patrón {i})")
-                return valor
-            else:
-                print(f"   ❌ No encontrado")
+        # Con el perfil activo (--perfil) cada patrón queda medido bajo este campo
+        with REGISTRO.campo(nombre_campo):
+            for i, patron in enumerate(patrones, 1):
+                print(f"   Patrón {i}: {patron}")
+                matches = REGISTRO.encontrar_todos(patron, texto)
+                
+                if matches:
+                    valor = matches[0].strip() if isinstance(matches[0], str) else str(matches[0]).strip()
+                    print(f"   ✅ ENCONTRADO: '{valor}' (patrón {i})")
+                    return valor
+                else:
+                    print(f"   ❌ No encontrado")
         
         return ""
 
+# Extractores que se pueden perfilar desde la línea de comandos
+EXTRACTORES_PERFIL = {
+    'completo': ('extractors.extractor_completo', 'ExtractorCompleto'),
+    'total': ('extractor_total', 'ExtractorTotal'),
+    'basica': ('extractors.info_basica', 'InformacionBasicaExtractor'),
+    'diagnostico': (__name__, 'ExtractorDiagnostico')
+}
+
+def perfilar(argumentos: list):
+    """
+    Modo perfil: mide cada patrón de cada campo sobre un corpus de PDFs
+    
+    USO: python extractor_diagnostico.py --perfil [--extractor completo|total|basica|diagnostico] pdf_o_carpeta...
+    
+    Genera perfil_patrones_<fecha>.json y .xlsx con los patrones ordenados por
+    tiempo total y los que nunca aciertan.
+    """
+    import importlib
+    import io
+    import time
+    from contextlib import redirect_stdout
+    from pathlib import Path
+    from utils.perfilador import perfilar_corpus
+    
+    nombre_extractor = 'completo'
+    if '--extractor' in argumentos:
+        posicion = argumentos.index('--extractor')
+        nombre_extractor = argumentos[posicion + 1]
+        argumentos = argumentos[:posicion] + argumentos[posicion + 2:]
+    
+    archivos = []
+    for argumento in argumentos or ['.']:
+        ruta = Path(argumento)
+        archivos.extend(sorted(ruta.glob('*.pdf')) if ruta.is_dir() else [ruta])
+    if not archivos:
+        print("❌ No se encontraron archivos PDF")
+        return
+    
+    modulo, clase = EXTRACTORES_PERFIL[nombre_extractor]
+    extractor = getattr(importlib.import_module(modulo), clase)()
+    
+    print(f"⏱️ PERFILANDO {clase} SOBRE {len(archivos)} PDFs")
+    with redirect_stdout(io.StringIO()):  # Los extractores imprimen su avance
+        perfilador = perfilar_corpus(extractor, archivos)
+    
+    base = f"perfil_patrones_{time.strftime('%Y%m%d_%H%M%S')}"
+    ruta_json = perfilador.guardar_json(f"{base}.json")
+    ruta_excel = perfilador.guardar_excel(f"{base}.xlsx")
+    
+    print(f"📊 {perfilador.resumen()}")
+    print(f"\\n{'Campo':<30} {'ms total':>9} {'aciertos':>9}  Patrón")
+    for fila in perfilador.reporte()[:20]:
+        print(f"{fila['campo'][:30]:<30} {fila['tiempo_total_ms']:>9.3f} "
+              f"{fila['aciertos']:>4}/{fila['llamadas']:<4}  {fila['patron'][:60]}")
+    print(f"✅ Reporte: {ruta_json} y {ruta_excel}")
+
 def main():
     """Función principal para probar el extractor"""
     import pdfplumber
     from pathlib import Path
     
+    if len(sys.argv) > 1 and sys.argv[1] == '--perfil':
+        perfilar(sys.argv[2:])
+        return
+    
     if len(sys.argv) > 1:
         archivo_pdf = sys.argv[1]
         if not Path(archivo_pdf).exists():
@@ -6,6 +6,26 @@ Diseñado para extraer TODA la información de PDFs DataCrédito
 import re
 from typing import Dict, Any
 
+import setup_paths
+from extractors.contexto_extraccion import ContextoExtraccion
+from extractors.motor_campos import PLAN_CAMPOS
+from utils.patrones import REGISTRO
+
+# Nombre de cada campo de FIELD_SPECS en el resumen de consola
+ETIQUETAS = {
+    'fecha_consulta': "Fecha consulta",
+    'hora_consulta': "Hora consulta",
+    'tipo_documento': "Tipo documento",
+    'numero_documento': "Número documento",
+    'estado_documento': "Estado documento",
+    'lugar_expedicion': "Lugar expedición",
+    'fecha_expedicion': "Fecha expedición",
+    'nombre_completo': "Nombre",
+    'rango_edad': "Rango edad",
+    'genero': "Género",
+    'antiguedad_ubicacion': "Antigüedad ubicación"
+}
+
 class ExtractorIndependiente:
     """Extractor completamente independiente para PDFs DataCrédito"""
     
@@ -37,71 +57,11 @@ class ExtractorIndependiente:
             registro['consultado_por'] = consultado
             print(f"✅ Consultado por: {consultado}")
         
-        # 2. Fecha de consulta
-        fecha = self.extraer_fecha_consulta(texto_limpio)
-        if fecha:
-            registro['fecha_consulta'] = fecha
-            print(f"✅ Fecha consulta: {fecha}")
-        
-        # 3. Hora de consulta
-        hora = self.extraer_hora_consulta(texto_limpio)
-        if hora:
-            registro['hora_consulta'] = hora
-            print(f"✅ Hora consulta: {hora}")
-        
-        # 4. Tipo de documento
-        tipo_doc = self.extraer_tipo_documento(texto_limpio)
-        if tipo_doc:
-            registro['tipo_documento'] = tipo_doc
-            print(f"✅ Tipo documento: {tipo_doc}")
-        
-        # 5. Número de documento
-        numero = self.extraer_numero_documento(texto_limpio)
-        if numero:
-            registro['numero_documento'] = numero
-            print(f"✅ Número documento: {numero}")
-        
-        # 6. Estado documento
-        estado = self.extraer_estado_documento(texto_limpio)
-        if estado:
-            registro['estado_documento'] = estado
-            print(f"✅ Estado documento: {estado}")
-        
-        # 7. Lugar expedición
-        lugar = self.extraer_lugar_expedicion(texto_limpio)
-        if lugar:
-            registro['lugar_expedicion'] = lugar
-            print(f"✅ Lugar expedición: {lugar}")
-        
-        # 8. Fecha expedición
-        fecha_exp = self.extraer_fecha_expedicion(texto_limpio)
-        if fecha_exp:
-            registro['fecha_expedicion'] = fecha_exp
-            print(f"✅ Fecha expedición: {fecha_exp}")
-        
-        # 9. Nombre completo
-        nombre = self.extraer_nombre_completo(texto_limpio)
-        if nombre:
-            registro['nombre_completo'] = nombre
-            print(f"✅ Nombre: {nombre}")
-        
-        # 10. Rango edad
-        edad = self.extraer_rango_edad(texto_limpio)
-        if edad:
-            registro['rango_edad'] = edad
-            print(f"✅ Rango edad: {edad}")
-        
-        # 11. Género
-        genero = self.extraer_genero(texto_limpio)
-        if genero:
-            registro['genero'] = genero
-            print(f"✅ Género: {genero}")
-        
-        # 12. Antigüedad ubicación
-        antiguedad = self.extraer_antiguedad_ubicacion(texto_limpio)
-        if antiguedad:
-            registro['antiguedad_ubicacion'] = antiguedad
-            print(f"✅ Antigüedad ubicación: {antiguedad}")
+        # 2-12. Campos compartidos con la especificación declarativa (FIELD_SPECS)
+        for campo, valor in PLAN_CAMPOS.extraer_campos(ContextoExtraccion(texto)).items():
+            if valor:
+                registro[campo] = valor
+                print(f"✅ {ETIQUETAS[campo]}: {valor}")
         
         # === INFORMACIÓN ADICIONAL ===
         
@@ -172,7 +132,7 @@ class ExtractorIndependiente:
     def buscar_patron(self, patron: str, texto: str) -> str:
         """Busca un patrón en el texto"""
         try:
-            match = re.search(patron, texto, re.IGNORECASE | re.MULTILINE)
+            match = REGISTRO.buscar(patron, texto)
             if match:
                 resultado = match.group(1).strip() if match.groups() else match.group(0).strip()
                 return resultado
@@ -198,93 +158,6 @@ class ExtractorIndependiente:
         ]
         return self.buscar_multiples_patrones(patrones, texto)
     
-    def extraer_fecha_consulta(self, texto: str) -> str:
-        patrones = [
-            r"Fecha y Hora Consulta[:\\s]*([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})",
-            r"Fecha[^:]*:[\\s]*([0-9]{1,2}[/\\-][0-9]{1,2}[/\\-][0-9]{4})",
-            r"\\b([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})\\b"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_hora_consulta(self, texto: str) -> str:
-        patrones = [
-            r"Fecha y Hora Consulta[^\\n]*([0-9]{1,2}:[0-9]{2}:[0-9]{2})",
-            r"([0-9]{1,2}:[0-9]{2}:[0-9]{2})",
-            r"([0-9]{1,2}:[0-9]{2})\\s*(?:AM|PM)?"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_tipo_documento(self, texto: str) -> str:
-        patrones = [
-            r"Tipo Documento[:\\s]*([^\\n]{3,30})",
-            r"(Cédula de Ciudadanía)",
-            r"(C\\.C\\.)",
-            r"(Tarjeta de Identidad)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_numero_documento(self, texto: str) -> str:
-        patrones = [
-            r"Número Documento[:\\s]*([0-9\\.\\,]+)",
-            r"C\\.C\\.?[\\s]*:?[\\s]*([0-9\\.\\,]+)",
-            r"Documento[^:]*:[\\s]*([0-9\\.\\,]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_estado_documento(self, texto: str) -> str:
-        patrones = [
-            r"Estado Documento[:\\s]*([A-Za-záéíóúñ]+)",
-            r"\\b(Vigente|Vencido|Activo|Inactivo)\\b"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_lugar_expedicion(self, texto: str) -> str:
-        patrones = [
-            r"Lugar Expedición[:\\s]*([A-ZÁÉÍÓÚÑa-z\\s]+?)(?=\\s*Fecha|\\n)",
-            r"Expedido en[:\\s]*([A-ZÁÉÍÓÚÑa-z\\s]+)",
-            r"\\b(BOGOTA|MEDELLIN|CALI|IBAGUE|BARRANQUILLA)\\b"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_fecha_expedicion(self, texto: str) -> str:
-        patrones = [
-            r"Fecha Expedición[:\\s]*([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})",
-            r"Expedido el[:\\s]*([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_nombre_completo(self, texto: str) -> str:
-        patrones = [
-            r"Nombre:\\s*([A-ZÁÉÍÓÚÑ][A-ZÁÉÍÓÚÑ\\s]+?)(?=\\n|Rango)",
-            r"Nombres y Apellidos:\\s*([A-ZÁÉÍÓÚÑ][A-ZÁÉÍÓÚÑ\\s]+?)(?=\\n)",
-            r"Nombres:\\s*([A-ZÁÉÍÓÚÑ][A-ZÁÉÍÓÚÑ\\s]+?)(?=\\n)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_rango_edad(self, texto: str) -> str:
-        patrones = [
-            r"Rango Edad[:\\s]*([0-9\\-]+)",
-            r"Edad[:\\s]*([0-9\\-]+)",
-            r"\\b([0-9]{2}-[0-9]{2})\\b"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_genero(self, texto: str) -> str:
-        patrones = [
-            r"Género[:\\s]*([A-Za-záéíóúñ]+)",
-            r"Sexo[:\\s]*([A-Za-záéíóúñ]+)",
-            r"\\b(Masculino|Femenino|Hombre|Mujer)\\b"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_antiguedad_ubicacion(self, texto: str) -> str:
-        patrones = [
-            r"Antigüedad Ubicación[:\\s]*([^\\n]{5,50})",
-            r"Antiguedad Ubicación[:\\s]*([^\\n]{5,50})",
-            r"([0-9]+\\s*Meses\\s*[A-Za-z\\s]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
     def extraer_direccion(self, texto: str) -> str:
         patrones = [
             r"Dirección[:\\s]*([^\\n]{10,80})",
@@ -6,7 +6,17 @@ Barrido completo sin omitir ningún dato
 """
 import re
 from typing import Dict, Any, List
-import pdfplumber
+
+import setup_paths
+from extractors.contexto_extraccion import ContextoExtraccion
+from extractors.motor_campos import PLAN_CAMPOS
+from utils.pdf_reader import PDFReader
+from utils.patrones import REGISTRO
+from utils.plantilla_documento import limpiar_texto
+from utils.habito_pago import ABIERTA, LectorHabitoPago, Obligacion, extraer_obligaciones, leer_texto
+from utils.vectores_pago import decodificar_lote, estadisticas_lote
+from utils.tablas_palabras import serie_tendencia
+from utils.endeudamiento_global import extraer_endeudamiento_global, totales_trimestre
 
 class ExtractorTotal:
     """Extractor que captura TODO sin excepción"""
@@ -14,11 +24,41 @@ class ExtractorTotal:
     def __init__(self):
         self.nombre = "Extractor Total"
         
-    def extract(self, texto: str, archivo: str) -> Dict[str, Any]:
-        """Extrae TODOS los datos del PDF"""
+    def extract(self, texto: str, archivo: str, documento=None) -> Dict[str, Any]:
+        """Extrae TODOS los datos del PDF (documento: sesión DocumentoPDF ya abierta)"""
         
         print(f"\n🔍 BARRIDO TOTAL DE: {archivo}")
         
+        texto_original = texto
+        
+        # Pie de página y encabezados de tabla repetidos, aprendidos una vez del documento
+        texto = limpiar_texto(texto)
+        
+        # Presupuesto de búsqueda: agotado, se omiten las búsquedas restantes del documento
+        with REGISTRO.presupuesto(documento=archivo) as presupuesto:
+            registro = self.barrido(texto, archivo, documento)
+        
+        busqueda = presupuesto.resumen()
+        if busqueda:
+            print(f"⚠️ Búsquedas costosas en {archivo}: {busqueda['patrones_costosos'][:3]}")
+        
+        # Contar campos extraídos
+        campos_extraidos = len([v for v in registro.values() if v and str(v).strip()])
+        
+        print(f"📊 TOTAL EXTRAÍDO: {campos_extraidos} campos")
+        
+        # Metadatos
+        registro['_metadata'] = {
+            'total_campos_extraidos': campos_extraidos,
+            'texto_completo_length': len(texto_original),
+            'procesado': campos_extraidos > 0,
+            **busqueda
+        }
+        
+        return registro
+    
+    def barrido(self, texto: str, archivo: str, documento=None) -> Dict[str, Any]:
+        """Pasos de extracción sobre el texto ya limpio"""
         registro = {}
         
         # === 1. INFORMACIÓN BÁSICA ===
@@ -28,10 +68,15 @@ class ExtractorTotal:
         registro.update(self.extraer_datos_consulta(texto))
         
         # === 3. OBLIGACIONES Y CUENTAS ===
-        registro.update(self.extraer_obligaciones(texto))
+        lector = self.leer_habito_pago(texto, archivo, documento)
+        obligaciones = lector.resultado()
+        registro.update(self.extraer_obligaciones(texto, obligaciones))
+        registro['obligaciones_no_leidas'] = len(lector.descartados)
+        if lector.descartados:
+            print(f"⚠️ Obligaciones sin leer en {archivo}: {lector.descartados[:3]}")
         
         # === 4. HISTORIAL DE PAGOS ===
-        registro.update(self.extraer_historial_pagos(texto))
+        registro.update(self.extraer_historial_pagos(texto, obligaciones))
         
         # === 5. ANÁLISIS DE VECTORES ===
         registro.update(self.extraer_vectores(texto))
@@ -55,19 +100,7 @@ class ExtractorTotal:
         registro.update(self.extraccion_masiva_automatica(texto))
         
         # === 12. CAPTURA DE TABLAS ===
-        registro.update(self.extraer_datos_tablas(archivo))
-        
-        # Contar campos extraídos
-        campos_extraidos = len([v for v in registro.values() if v and str(v).strip()])
-        
-        print(f"📊 TOTAL EXTRAÍDO: {campos_extraidos} campos")
-        
-        # Metadatos
-        registro['_metadata'] = {
-            'total_campos_extraidos': campos_extraidos,
-            'texto_completo_length': len(texto),
-            'procesado': campos_extraidos > 0
-        }
+        registro.update(self.extraer_datos_tablas(archivo, documento))
         
         return registro
     
@@ -83,28 +116,15 @@ class ExtractorTotal:
         ]
         info['consultado_por'] = self.buscar_multiples_patrones(patrones_consultado, texto)
         
-        # Fecha y hora de consulta
-        patrones_fecha = [
-            r"([0-9]{4}/[0-9]{2}/[0-9]{2})\s+([0-9]{1,2}\.[0-9]{2}\s+[AP]M)",
-            r"DELAGRO SAS\s+([0-9]{4}/[0-9]{2}/[0-9]{2})\s+([0-9\.]+\s+[AP]M)"
-        ]
-        fecha_consulta = self.buscar_multiples_patrones(patrones_fecha, texto)
-        if fecha_consulta:
-            info['fecha_consulta'] = fecha_consulta
-        
-        # Información del documento
-        info['tipo_documento'] = self.extraer_campo(r"Tipo Documento\s+([^\s]+)", texto)
-        info['numero_documento'] = self.extraer_campo(r"Número Documento\s+([0-9]+)", texto)
-        info['estado_documento'] = self.extraer_campo(r"Estado Documento\s+([A-Za-z]+)", texto)
-        info['lugar_expedicion'] = self.extraer_campo(r"Lugar Expedición\s+([A-ZÁÉÍÓÚÑ\s]+)", texto)
-        info['fecha_expedicion'] = self.extraer_campo(r"Fecha Expedición\s+([0-9]{2}/[0-9]{2}/[0-9]{4})", texto)
-        
-        # Información personal
-        info['nombre_completo'] = self.extraer_campo(r"Nombre\s+([A-ZÁÉÍÓÚÑ\s]+)\s+Rango", texto)
-        info['rango_edad'] = self.extraer_campo(r"Rango Edad\s+([0-9\\-]+)", texto)
-        info['genero'] = self.extraer_campo(r"Género\s+([A-Za-z]+)", texto)
+        # Fecha de consulta, documento y datos personales: campos compartidos de FIELD_SPECS
+        compartidos = PLAN_CAMPOS.extraer_campos(ContextoExtraccion(texto))
+        if compartidos['fecha_consulta']:
+            info['fecha_consulta'] = compartidos['fecha_consulta']
+        for campo in ('tipo_documento', 'numero_documento', 'estado_documento', 'lugar_expedicion',
+                      'fecha_expedicion', 'nombre_completo', 'rango_edad', 'genero'):
+            info[campo] = compartidos[campo] or ""
         info['tiene_rut'] = self.extraer_campo(r"Tiene RUT\\?\s+([^\\s]+)", texto)
-        info['antiguedad_ubicacion'] = self.extraer_campo(r"Antiguedad Ubicación\s+([0-9]+\s+Meses)", texto)
+        info['antiguedad_ubicacion'] = compartidos['antiguedad_ubicacion'] or ""
         
         return info
     
@@ -123,33 +143,68 @@ class ExtractorTotal:
         
         return info
     
-    def extraer_obligaciones(self, texto: str) -> Dict[str, str]:
-        """Obligaciones financieras activas y cerradas"""
+    def leer_habito_pago(self, texto: str, archivo: str, documento=None) -> LectorHabitoPago:
+        """HÁBITO DE PAGO con las columnas del PDF (reutiliza la sesión si existe); sin el PDF, del texto"""
+        try:
+            pdf = documento if documento is not None else PDFReader().abrir(archivo)
+            try:
+                return pdf.habito_pago()
+            finally:
+                if documento is None:
+                    pdf.cerrar()
+        except Exception:
+            return leer_texto(texto)
+    
+    def extraer_obligaciones(self, texto: str, obligaciones: List[Obligacion] = None) -> Dict[str, Any]:
+        """Obligaciones financieras activas y cerradas (HÁBITO DE PAGO, una sola pasada)"""
         info = {}
         
-        # Buscar obligaciones del Banco Agrario
+        if obligaciones is None:
+            obligaciones = extraer_obligaciones(texto)
+        abiertas = [o for o in obligaciones if o['estado_cuenta'] == ABIERTA]
+        
+        info['obligaciones_abiertas'] = len(abiertas)
+        info['obligaciones_cerradas'] = len(obligaciones) - len(abiertas)
+        info['obligaciones_en_mora'] = sum(1 for o in abiertas if o['al_dia'] is False)
+        info['obligaciones_saldo_total'] = sum(o['saldo_actual'] or 0 for o in abiertas)
+        info['obligaciones_saldo_mora'] = sum(o['saldo_mora'] or 0 for o in abiertas)
+        
+        # Una columna por obligación abierta: entidad, cuenta, estado y saldos
+        for num, obligacion in enumerate(abiertas, 1):
+            info[f'obligacion_abierta_{num}'] = self.texto_obligacion(obligacion)[:100]
+        
+        # Columnas por entidad de versiones anteriores, conservadas para las hojas que ya las usan
         info['banco_agrario_cab'] = self.extraer_multiple_lineas(r"BCO AGRARIO\s+CAB.*?([0-9]{9})", texto)
         info['banco_agrario_fechas'] = self.extraer_multiple_lineas(r"BCO AGRARIO.*?([0-9]{8}.*?[0-9]{8})", texto)
         info['banco_agrario_valores'] = self.extraer_multiple_lineas(r"BCO AGRARIO.*?([0-9]{2,3},[0-9]{3})", texto)
-        
-        # Buscar Davivienda
         info['davivienda_cuenta'] = self.extraer_campo(r"DAVIVIENDA.*?([0-9]{9})", texto)
         info['davivienda_tipo'] = self.extraer_campo(r"DAVIVIENDA\s+(SOBREGIROS|TDC)", texto)
-        
-        # Buscar otras entidades
         info['precisagro'] = self.extraer_campo(r"PRECISAGRO S\.A\.S\.\s+([A-Z0-9]+)", texto)
         
         return info
     
-    def extraer_historial_pagos(self, texto: str) -> Dict[str, str]:
+    def extraer_historial_pagos(self, texto: str, obligaciones: List[Obligacion] = None) -> Dict[str, Any]:
         """Historial de pagos y comportamiento"""
         info = {}
         
-        # Vectores de pago (N = Normal, números = moras)
-        vectores = re.findall(r"\[([N0-9\-]+)\]\[([N0-9\-]+)", texto)
+        # Vectores de pago (N = Normal, números = moras): bloques tal como aparecen en el texto
+        bloques = REGISTRO.encontrar_todos(r"\[([N0-9\-]+)\]\[([N0-9\-]+)", texto, flags=0)
+        if bloques:
+            info['vectores_pago_total'] = len(bloques)
+            info['vectores_encontrados'] = str(bloques[:5])  # Primeros 5
+        
+        # Un vector de 48 meses por obligación, decodificados en lote
+        if obligaciones is None:
+            obligaciones = extraer_obligaciones(texto)
+        vectores = [o['vector'] for o in obligaciones if o['vector']]
         if vectores:
-            info['vectores_pago_total'] = len(vectores)
-            info['vectores_encontrados'] = str(vectores[:5])  # Primeros 5
+            estadisticas = estadisticas_lote(decodificar_lote(vectores))
+            info['vectores_obligaciones'] = len(vectores)
+            info['vectores_meses_mora'] = int(estadisticas['meses_mora'].sum())
+            info['vectores_mora_maxima'] = int(estadisticas['mora_maxima'].max())
+            info['vectores_racha_al_dia'] = int(estadisticas['racha_al_dia'].max())
+            info['vectores_mora_ultimos_12'] = int(estadisticas['mora_ultimos_12'].sum())
+            info['vectores_mora_previos_12'] = int(estadisticas['mora_previos_12'].sum())
         
         # Moras máximas
         info['moras_maximas_sf'] = self.extraer_campo(r"Moras Máximas Sector Financiero\s+([0-9\s]+)", texto)
@@ -173,35 +228,50 @@ class ExtractorTotal:
         ]
         
         for i, entidad in enumerate(entidades_vectores, 1):
-            patron = f"{entidad}.*?([0-9N\\s\\-]+)"
+            patron = f"{re.escape(entidad)}.*?([0-9N\\s\\-]+)"
             valor = self.extraer_campo(patron, texto)
             if valor:
                 info[f'vector_entidad_{i}'] = f"{entidad}: {valor}"
         
         return info
     
-    def extraer_endeudamiento(self, texto: str) -> Dict[str, str]:
-        """Endeudamiento global por trimestres"""
+    def extraer_endeudamiento(self, texto: str) -> Dict[str, Any]:
+        """Endeudamiento global por trimestres (filas tipadas, una sola pasada)"""
         info = {}
         
-        # Trimestres encontrados
-        trimestres = re.findall(r"TRIMESTRE\s+([0-9]{4}/[0-9]{2})", texto)
-        if trimestres:
-            info['trimestres_reportados'] = ", ".join(trimestres)
-        
-        # Valores de endeudamiento
-        valores_deuda = re.findall(r"\\$([0-9,]+)", texto)
-        if valores_deuda:
-            info['valores_deuda_encontrados'] = len(valores_deuda)
-            info['deuda_mayor'] = max(valores_deuda, key=lambda x: int(x.replace(',', '')))
-        
-        # Tipos de crédito
-        info['tipos_credito'] = self.extraer_campo(r"(Consumo y Tarjeta de\s+Comercial Hipotecario Microcrédito)", texto)
-        
-        # Entidades reportantes
-        entidades = re.findall(r"(BANCO AGRARIO|DAVIVIENDA).*?BC", texto)
+        filas = extraer_endeudamiento_global(texto)
+        detalle = [fila for fila in filas if fila['tipo'] == 'detalle']
+        
+        # Totales por trimestre (1 = más reciente) y variación frente al anterior
+        totales = totales_trimestre(filas)
+        if totales:
+            info['trimestres_reportados'] = ", ".join(totales)
+            for num, (trimestre, total) in enumerate(totales.items(), 1):
+                info[f'endeudamiento_global_{num}_trimestre'] = trimestre
+                info[f'endeudamiento_global_{num}_saldo_total'] = total['saldo_total']
+                info[f'endeudamiento_global_{num}_obligaciones'] = total['num']
+            saldos = [total['saldo_total'] for total in totales.values()]
+            if len(saldos) > 1:
+                info['endeudamiento_global_variacion'] = saldos[0] - saldos[1]
+        
+        # Valores de endeudamiento por entidad
+        if detalle:
+            info['valores_deuda_encontrados'] = len(detalle)
+            mayor = max(fila['saldo_total'] or 0 for fila in detalle)
+            info['deuda_mayor'] = f"{mayor:,}"  # Texto como en el reporte ("38,459"), como en versiones anteriores
+            info['deuda_mayor_miles'] = mayor
+        
+        # Tipos de crédito con obligaciones en el trimestre más reciente (el
+        # encabezado "Comercial Hipotecario Microcrédito" ya no está en el texto limpio)
+        if totales:
+            reciente = next(iter(totales.values()))
+            tipos = [tipo for tipo in ('comercial', 'hipotecario', 'consumo', 'microcredito') if reciente[f'{tipo}_nro']]
+            info['tipos_credito'] = ", ".join(tipos)
+        
+        # Entidades reportantes del sector financiero
+        entidades = dict.fromkeys(fila['entidad'] for fila in detalle if fila['sector'] == 'Financiero')
         if entidades:
-            info['entidades_financieras'] = ", ".join(set(entidades))
+            info['entidades_financieras'] = ", ".join(entidades)
         
         return info
     
@@ -218,7 +288,7 @@ class ExtractorTotal:
         ]
         
         for patron in patrones_dir:
-            matches = re.findall(patron, texto)
+            matches = REGISTRO.encontrar_todos(patron, texto, flags=0)
             direcciones.extend(matches)
         
         if direcciones:
@@ -226,12 +296,12 @@ class ExtractorTotal:
             info['total_direcciones'] = len(direcciones)
         
         # Ciudades y departamentos
-        ciudades = re.findall(r"(SAN LUIS|IBAGUE)\s+(TOLIMA|ANTIOQUIA)?", texto)
+        ciudades = REGISTRO.encontrar_todos(r"(SAN LUIS|IBAGUE)\s+(TOLIMA|ANTIOQUIA)?", texto, flags=0)
         if ciudades:
             info['ciudades_reportadas'] = " | ".join([f"{c[0]} {c[1]}".strip() for c in ciudades])
         
         # Estratos
-        estratos = re.findall(r"Estrato\s+([0-9\\-]+)", texto)
+        estratos = REGISTRO.encontrar_todos(r"Estrato\s+([0-9\\-]+)", texto, flags=0)
         if estratos:
             info['estratos'] = ", ".join(set(estratos))
         
@@ -242,12 +312,12 @@ class ExtractorTotal:
         info = {}
         
         # Tipos de cuenta
-        tipos_cuenta = re.findall(r"(SBG|TDC|CAB|AGR)", texto)
+        tipos_cuenta = REGISTRO.encontrar_todos(r"(SBG|TDC|CAB|AGR)", texto, flags=0)
         if tipos_cuenta:
             info['tipos_cuenta'] = ", ".join(set(tipos_cuenta))
         
         # Estados de obligaciones
-        estados = re.findall(r"(Pago Vol|Cancelada Vol|Normal)", texto)
+        estados = REGISTRO.encontrar_todos(r"(Pago Vol|Cancelada Vol|Normal)", texto, flags=0)
         if estados:
             info['estados_obligaciones'] = ", ".join(set(estados))
         
@@ -261,12 +331,12 @@ class ExtractorTotal:
         info = {}
         
         # Fechas de última consulta
-        fechas_consulta = re.findall(r"Fecha Ult\. Consulta.*?([0-9]{4}/[0-9]{2}/[0-9]{2})", texto)
+        fechas_consulta = REGISTRO.encontrar_todos(r"Fecha Ult\. Consulta.*?([0-9]{4}/[0-9]{2}/[0-9]{2})", texto, flags=0)
         if fechas_consulta:
             info['ultima_consulta'] = fechas_consulta[0]
         
         # Número de consultas
-        num_consultas = re.findall(r"No\. de Consultas mes.*?([0-9]+)", texto)
+        num_consultas = REGISTRO.encontrar_todos(r"No\. de Consultas mes.*?([0-9]+)", texto, flags=0)
         if num_consultas:
             info['consultas_mes'] = num_consultas[0]
         
@@ -277,12 +347,12 @@ class ExtractorTotal:
         info = {}
         
         # Tipo de zona
-        zonas = re.findall(r"(RES|LAB|CRR|URB|RUR)", texto)
+        zonas = REGISTRO.encontrar_todos(r"(RES|LAB|CRR|URB|RUR)", texto, flags=0)
         if zonas:
             info['tipos_zona'] = ", ".join(set(zonas))
         
         # Fuentes de información
-        fuentes = re.findall(r"Fuente.*?([A-Z]{3})", texto)
+        fuentes = REGISTRO.encontrar_todos(r"Fuente.*?([A-Z]{3})", texto, flags=0)
         if fuentes:
             info['fuentes_info'] = ", ".join(set(fuentes))
         
@@ -293,34 +363,34 @@ class ExtractorTotal:
         info = {}
         
         # Buscar TODOS los números de cuenta/documento
-        numeros = re.findall(r"\b([0-9]{7,12})\b", texto)
+        numeros = REGISTRO.encontrar_todos(r"\b([0-9]{7,12})\b", texto, flags=0)
         if numeros:
             numeros_unicos = list(set(numeros))
             info['numeros_identificados'] = " | ".join(numeros_unicos[:10])  # Primeros 10
             info['total_numeros'] = len(numeros_unicos)
         
         # Buscar TODAS las fechas
-        fechas = re.findall(r"([0-9]{2}/[0-9]{2}/[0-9]{4}|[0-9]{4}/[0-9]{2}/[0-9]{2})", texto)
+        fechas = REGISTRO.encontrar_todos(r"([0-9]{2}/[0-9]{2}/[0-9]{4}|[0-9]{4}/[0-9]{2}/[0-9]{2})", texto, flags=0)
         if fechas:
             fechas_unicas = list(set(fechas))
             info['fechas_identificadas'] = " | ".join(fechas_unicas)
             info['total_fechas'] = len(fechas_unicas)
         
         # Buscar TODOS los valores monetarios
-        valores = re.findall(r"\$([0-9,]+)", texto)
+        valores = REGISTRO.encontrar_todos(r"\$([0-9,]+)", texto, flags=0)
         if valores:
             info['valores_monetarios'] = " | ".join(valores[:15])  # Primeros 15
             info['total_valores'] = len(valores)
         
         # Buscar códigos y referencias
-        codigos = re.findall(r"\b([A-Z0-9]{5,15})\b", texto)
+        codigos = REGISTRO.encontrar_todos(r"\b([A-Z0-9]{5,15})\b", texto, flags=0)
         if codigos:
             codigos_unicos = list(set([c for c in codigos if len(c) >= 5]))
             info['codigos_identificados'] = " | ".join(codigos_unicos[:10])
             info['total_codigos'] = len(codigos_unicos)
         
         # Buscar entidades/empresas mencionadas
-        entidades = re.findall(r"\b([A-Z]{3,}(?:\s+[A-Z]{3,})*(?:\s+S\.A\.S\.?|\s+LTDA|\s+S\.A\.)?)", texto)
+        entidades = REGISTRO.encontrar_todos(r"\b([A-Z]{3,}(?:\s+[A-Z]{3,})*(?:\s+S\.A\.S\.?|\s+LTDA|\s+S\.A\.)?)", texto, flags=0)
         if entidades:
             entidades_filtradas = [e for e in set(entidades) if len(e) > 4 and e not in ['INFORMACIÓN', 'BÁSICA']]
             info['entidades_mencionadas'] = " | ".join(entidades_filtradas[:10])
@@ -328,48 +398,67 @@ class ExtractorTotal:
         
         return info
     
-    def extraer_datos_tablas(self, archivo: str) -> Dict[str, str]:
-        """Extrae datos específicos de las tablas del PDF"""
+    def extraer_datos_tablas(self, archivo: str, documento=None) -> Dict[str, Any]:
+        """Extrae los datos de las tablas de endeudamiento (reutiliza la sesión si existe)
+        
+        Las tablas se arman con las coordenadas de las palabras (columnas fijas del
+        reporte) en lugar de la detección genérica de tablas de pdfplumber.
+        """
         info = {}
         
         try:
-            with pdfplumber.open(archivo) as pdf:
-                tabla_count = 0
-                
-                for page_num, page in enumerate(pdf.pages, 1):
-                    tablas = page.extract_tables()
-                    
-                    for tabla_num, tabla in enumerate(tablas, 1):
-                        if tabla and len(tabla) > 0:
-                            tabla_count += 1
-                            
-                            # Procesar tabla
-                            for fila_num, fila in enumerate(tabla):
-                                if fila and any(cell for cell in fila if cell):
-                                    # Buscar datos específicos en cada fila
-                                    fila_texto = " ".join([str(cell) if cell else "" for cell in fila])
-                                    
-                                    # Extraer valores específicos encontrados
-                                    if "BCO AGRARIO" in fila_texto:
-                                        info[f'tabla_banco_agrario_{tabla_count}'] = fila_texto[:100]
-                                    
-                                    if "DAVIVIENDA" in fila_texto:
-                                        info[f'tabla_davivienda_{tabla_count}'] = fila_texto[:100]
-                                    
-                                    if any(char.isdigit() for char in fila_texto) and "$" in fila_texto:
-                                        info[f'tabla_valores_{tabla_count}_{fila_num}'] = fila_texto[:100]
-                
-                info['total_tablas_procesadas'] = tabla_count
+            pdf = documento if documento is not None else PDFReader().abrir(archivo)
+            try:
+                tablas = pdf.tablas_palabras()
+            finally:
+                if documento is None:
+                    pdf.cerrar()
+            
+            # Endeudamiento Actual: una fila por cartera y estado
+            for num, fila in enumerate(tablas.get('endeudamiento_actual', []), 1):
+                if fila['tipo'] == 'total':
+                    info['endeudamiento_actual_saldo_total'] = fila['saldo_actual']
+                    info['endeudamiento_actual_mora_total'] = fila['saldo_mora']
+                    info['endeudamiento_actual_cuota_total'] = fila['valor_cuota']
+                else:
+                    info[f'tabla_actual_{num}'] = self.texto_fila(fila)[:100]
+            
+            # Endeudamiento Global: una fila por entidad en cada trimestre
+            for num, fila in enumerate(tablas.get('endeudamiento_global', []), 1):
+                if fila['tipo'] == 'detalle':
+                    info[f"tabla_global_{fila['trimestre']}_{num}"] = self.texto_fila(fila)[:100]
+            
+            # Tendencia de endeudamiento: una columna por concepto y mes (1 = más reciente)
+            for nombre, valores in serie_tendencia(tablas.get('tendencia_endeudamiento', [])).items():
+                for num, valor in enumerate(valores, 1):
+                    info[f'tendencia_{nombre}_{num}'] = valor
+            
+            info['total_tablas_procesadas'] = len({
+                (seccion, fila.get('trimestre'), fila['sector'])
+                for seccion, filas in tablas.items() for fila in filas
+            })
                 
         except Exception as e:
             info['error_tablas'] = str(e)
         
         return info
     
+    def texto_fila(self, fila: Dict[str, Any]) -> str:
+        """Une los valores de una fila tipada como texto"""
+        return " ".join(
+            str(valor) for columna, valor in fila.items()
+            if valor is not None and columna not in ('tipo', 'pagina', 'trimestre')
+        )
+    
+    def texto_obligacion(self, obligacion: Dict[str, Any]) -> str:
+        """Resumen de una obligación de HÁBITO DE PAGO"""
+        campos = ('entidad', 'tipo_cuenta', 'numero_cuenta', 'estado', 'saldo_actual', 'saldo_mora', 'oficina')
+        return " ".join(str(obligacion[campo]) for campo in campos if obligacion[campo] is not None)
+    
     def extraer_campo(self, patron: str, texto: str) -> str:
         """Extrae un campo específico"""
         try:
-            match = re.search(patron, texto, re.IGNORECASE | re.MULTILINE)
+            match = REGISTRO.buscar(patron, texto)
             if match:
                 return match.group(1).strip()
         except:
@@ -379,7 +468,7 @@ class ExtractorTotal:
     def extraer_multiple_lineas(self, patron: str, texto: str) -> str:
         """Extrae múltiples coincidencias de un patrón"""
         try:
-            matches = re.findall(patron, texto, re.IGNORECASE | re.MULTILINE)
+            matches = REGISTRO.encontrar_todos(patron, texto)
             if matches:
                 return " | ".join([str(m).strip() for m in matches[:5]])  # Primeras 5
         except:
@@ -5,6 +5,7 @@ Procesa archivos PDF y los almacena para aprendizaje continuo
 """
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Configurar paths
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -12,6 +13,7 @@ import setup_paths
 
 from extractors.info_basica import InformacionBasicaExtractor
 from utils.pdf_reader import PDFReader
+from utils.pdf_backends import FuentePDF, es_ruta, nombre_fuente
 from learning.pdf_memory import PDFMemorySystem
 
 class PDFAnalyzer:
@@ -22,17 +24,20 @@ class PDFAnalyzer:
         self.extractor = InformacionBasicaExtractor()
         self.memory = PDFMemorySystem()
         
-    def analyze_pdf_file(self, pdf_path: str) -> dict:
+    def analyze_pdf_file(self, pdf_path: FuentePDF, nombre: Optional[str] = None) -> dict:
         """
         Analizar un archivo PDF y guardarlo en memoria
         
         Args:
-            pdf_path: Ruta al archivo PDF
+            pdf_path: Ruta al archivo PDF o su contenido en memoria (bytes,
+                objeto tipo archivo)
+            nombre: Nombre del archivo cuando el PDF llega en memoria
             
         Returns:
             Diccionario con análisis completo
         """
-        pdf_path = Path(pdf_path)
+        fuente = pdf_path
+        pdf_path = Path(nombre or nombre_fuente(fuente))
         
         print(f"\n🔍 ANALIZANDO: {pdf_path.name}")
         print("="*60)
@@ -40,7 +45,7 @@ class PDFAnalyzer:
         try:
             # Extraer texto del PDF
             print("📄 Extrayendo texto del PDF...")
-            extracted_text = self.pdf_reader.extraer_texto(str(pdf_path))
+            extracted_text = self.pdf_reader.extraer_texto(fuente)
             
             if not extracted_text:
                 print("❌ No se pudo extraer texto del PDF")
@@ -54,7 +59,7 @@ class PDFAnalyzer:
                 'informacion_basica': self.extractor.extract(extracted_text, pdf_path.name),
                 '_metadata': {
                     'archivo': pdf_path.name,
-                    'ruta': str(pdf_path),
+                    'ruta': str(fuente) if es_ruta(fuente) else None,
                     'tamaño_texto': len(extracted_text),
                     'procesado': True
                 }
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Compara la capa de texto entre motores PDF (PyMuPDF / pypdfium2 / pdfplumber)
+Verifica que los extractores obtienen los mismos campos con cada motor
+
+USO: python scripts/comparar_backends.py archivo1.pdf [archivo2.pdf ...]
+"""
+import sys
+from pathlib import Path
+
+# Configurar paths de importación
+sys.path.insert(0, str(Path(__file__).parent))
+import setup_paths
+
+from extractors.info_basica import InformacionBasicaExtractor
+from utils.pdf_reader import PDFReader
+from utils.pdf_backends import backends_disponibles
+
+def comparar_archivo(ruta_pdf: str) -> bool:
+    """Compara todos los motores instalados para un PDF"""
+    print(f"\n🔍 COMPARANDO MOTORES: {Path(ruta_pdf).name}")
+    print("-" * 60)
+    
+    resultados = PDFReader().comparar_backends(ruta_pdf, extractor=InformacionBasicaExtractor())
+    equivalente = True
+    
+    for nombre, resultado in resultados.items():
+        iguales = resultado['texto_identico'] and not resultado['campos_diferentes']
+        equivalente = equivalente and iguales
+        estado = "✅" if iguales else "⚠️"
+        print(f"{estado} {nombre:<11} {resultado['tiempo']:.3f}s | "
+              f"{resultado['caracteres']} caracteres | "
+              f"{resultado['lineas_diferentes']} líneas diferentes")
+        for campo in resultado['campos_diferentes']:
+            print(f"     - Campo diferente: {campo}")
+    
+    return equivalente
+
+def main():
+    """Función principal"""
+    archivos = sys.argv[1:] or [str(p) for p in Path('.').glob('*.pdf')]
+    
+    if not archivos:
+        print("❌ No se encontraron archivos PDF")
+        print("💡 USO: python scripts/comparar_backends.py archivo.pdf")
+        return
+    
+    print(f"⚙️  Motores instalados: {', '.join(backends_disponibles())}")
+    
+    equivalentes = [comparar_archivo(archivo) for archivo in archivos]
+    
+    print("\n" + "=" * 60)
+    if all(equivalentes):
+        print("✅ Todos los motores producen los mismos campos")
+    else:
+        print(f"⚠️  {equivalentes.count(False)} archivo(s) con diferencias entre motores")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
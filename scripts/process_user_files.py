@@ -4,8 +4,6 @@ Utilidad para procesar archivos PDF enviados por el usuario
 """
 import sys
 from pathlib import Path
-import tempfile
-import os
 
 # Configurar paths
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,26 +22,15 @@ def process_uploaded_pdf(pdf_content: bytes, filename: str) -> dict:
     Returns:
         Resultado del análisis
     """
-    # Crear archivo temporal
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-        temp_file.write(pdf_content)
-        temp_path = temp_file.name
+    # El contenido se analiza directamente en memoria, sin archivo temporal
+    analyzer = PDFAnalyzer()
+    result = analyzer.analyze_pdf_file(pdf_content, filename)
     
-    try:
-        # Analizar con el sistema de memoria
-        analyzer = PDFAnalyzer()
-        result = analyzer.analyze_pdf_file(temp_path)
-        
-        # Agregar nombre original
-        if result.get('success'):
-            result['original_filename'] = filename
-        
-        return result
-        
-    finally:
-        # Limpiar archivo temporal
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+    # Agregar nombre original
+    if result.get('success'):
+        result['original_filename'] = filename
+    
+    return result
 
 def analyze_sample_text(text_content: str, filename: str) -> dict:
     """
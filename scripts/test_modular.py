@@ -71,12 +71,661 @@ def test_extractor():
         print(f"❌ Error en test extractor: {e}")
         return False
 
+def test_extraccion_paginada():
+    """Prueba que la extracción página por página coincide con la del texto completo"""
+    try:
+        from extractors.info_basica import InformacionBasicaExtractor
+        
+        extractor = InformacionBasicaExtractor()
+        
+        # "Consultado por" queda partido por el salto de página
+        paginas = [
+            (0, "Fecha y Hora Consulta: 2024/01/15 2.30 PM\nNombre: JUAN CARLOS PEREZ LOPEZ\n"
+                "Rango Edad: 30-35\nConsultado por: DELAGRO SAS"),
+            (1, "MARIA GOMEZ RUIZ - 12345\nTipo Documento: C.C.\nNúmero Documento: 12345678\n"
+                "Estado Documento: Vigente\nGénero: Masculino"),
+        ]
+        
+        completo = extractor.extract("\n".join(texto for _, texto in paginas), "test.pdf")
+        paginado = extractor.extract_paginas(iter(paginas), "test.pdf")
+        
+        assert paginado == completo, f"Diferencias: {paginado} != {completo}"
+        print("✓ Extracción paginada equivalente a la del texto completo")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test extracción paginada: {e}")
+        return False
+
+def test_rastreador_secciones():
+    """Prueba el cierre de secciones por encabezados para lectura parcial"""
+    try:
+        from utils.secciones import RastreadorSecciones
+        
+        rastreador = RastreadorSecciones(['informacion_basica', 'endeudamiento_actual'])
+        
+        pagina_1 = ("INFORMACIÓN BÁSICA 1ZS2855\nTipo Documento C.C.\n"
+                    "RESUMEN 1ZS2855\nPerfil General\nEndeudamiento Actual 1ZS2855\n"
+                    "TOTAL 99,377 66,776")
+        pagina_2 = "HÁBITO DE PAGO DE OBLIGACIONES ABIERTAS / VIGENTES 1ZS2855"
+        
+        assert not rastreador.procesar_texto(pagina_1), "Endeudamiento Actual aún no termina"
+        assert rastreador.procesar_texto(pagina_2), "Todas las secciones deberían estar cerradas"
+        print("✓ Secciones cerradas tras la página 2")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test rastreador de secciones: {e}")
+        return False
+
+def test_tablas_palabras():
+    """Prueba las filas tipadas de Endeudamiento Actual a partir de coordenadas"""
+    try:
+        from utils.tablas_palabras import extraer_tablas
+        
+        def renglon(top, *palabras):
+            return [(x, top, x + 10 * len(texto), top + 9, texto) for x, texto in palabras]
+        
+        palabras = (
+            renglon(659, (25, "Endeudamiento"), (103, "Actual"), (915, "1ZS2855"))
+            + renglon(702, (25, "Sector"), (59, "Financiero"))
+            + renglon(751, (380, "Al"), (391, "día"), (525, "0"), (607, "0"), (688, "0"), (769, "0"))
+            + renglon(766, (86, "Cartera"), (119, "Sobregiro"), (240, "Principal"), (314, "2"),
+                      (380, "Al"), (391, "día"), (517, "9,377"), (599, "1,277"), (688, "0"), (769, "0"))
+            + renglon(874, (107, "TOTAL"), (514, "99,377"), (596, "66,776"), (840, "100.0%"))
+        )
+        filas = extraer_tablas([(0, palabras)])['endeudamiento_actual']
+        
+        assert [f['cartera'] for f in filas] == ['Cartera Sobregiro', 'Cartera Sobregiro', 'TOTAL']
+        assert filas[1]['saldo_actual'] == 1277 and filas[0]['sector'] == 'Financiero'
+        assert filas[2]['tipo'] == 'total' and filas[2]['participacion'] == 100.0
+        print("✓ Filas tipadas y sub-filas asignadas a su cartera")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test tablas por coordenadas: {e}")
+        return False
+
+def test_tendencia_endeudamiento():
+    """Prueba las series de 12 meses de la Tendencia de endeudamiento"""
+    try:
+        from utils.tablas_palabras import MESES_TENDENCIA, extraer_tablas, serie_tendencia
+        
+        def renglon(top, etiqueta, valores):
+            # Columnas de los meses centradas en x = 339 + 55 * i; None deja la celda vacía
+            palabras = [(30, top, 30 + 6 * len(etiqueta), top + 9, etiqueta)]
+            palabras += [(334 + 55 * i, top, 344 + 55 * i, top + 9, valor)
+                         for i, valor in enumerate(valores) if valor is not None]
+            return palabras
+        
+        meses = [f"M{numero:02d}" for numero in range(1, MESES_TENDENCIA + 1)]
+        palabras = (
+            [(25, 100, 90, 109, "Tendencia"), (92, 100, 100, 109, "de"), (102, 100, 160, 109, "endeudamiento")]
+            + renglon(115, "Saldos y Moras", meses)
+            + renglon(130, "Saldo Deuda Total (en miles)", ["57,399"] + ["66,548"] * 11)
+            + renglon(145, "Moras máx Sector Real", [None] + ["6"] * 10 + ["N"])
+        )
+        serie = serie_tendencia(extraer_tablas([(0, palabras)])['tendencia_endeudamiento'])
+        
+        assert serie['mes'] == meses
+        assert serie['saldo_total'][:2] == [57399, 66548] and len(serie['saldo_total']) == MESES_TENDENCIA
+        assert serie['mora_maxima_real'][0] is None and serie['mora_maxima_real'][-1] == 0, "Celda vacía en su mes"
+        print(f"✓ Series de tendencia: {sorted(serie)}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test tendencia de endeudamiento: {e}")
+        return False
+
+def test_registro_patrones():
+    """Prueba que los patrones se compilan una vez y cuentan aciertos y fallos"""
+    try:
+        from utils.patrones import RegistroPatrones
+        
+        registro = RegistroPatrones()
+        patron = r"Género\s+(\w+)"
+        
+        assert registro.buscar(patron, "Género Masculino").group(1) == "Masculino"
+        assert registro.buscar(patron, "Rango Edad 46-55") is None
+        assert registro.compilar(patron) is registro.compilar(patron), "Debe reutilizar el compilado"
+        assert registro.contadores(patron) == {'aciertos': 1, 'fallos': 1}
+        print("✓ Patrón compilado una vez con 1 acierto y 1 fallo")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test registro de patrones: {e}")
+        return False
+
+def test_escaner_etiquetas():
+    """Prueba que las etiquetas se leen en una pasada y cada valor termina en la siguiente"""
+    try:
+        from utils.etiquetas import ESCANER_INFORMACION_BASICA
+        
+        texto = ("Tipo Documento C.C. Número Documento 14106202 Estado Documento Vigente "
+                 "Lugar Expedición SAN LUIS Fecha Expedición 22/06/1995\n"
+                 "Nombre MONTAÑA MIRANDA ELKIN Rango Edad 46-55 Género Masculino Tiene RUT? - "
+                 "Antiguedad Ubicación 189 Meses -\n"
+                 "Nombre OTRO NOMBRE")
+        valores = ESCANER_INFORMACION_BASICA.escanear(texto)
+        
+        assert valores['lugar_expedicion'] == "SAN LUIS"
+        assert valores['fecha_expedicion'] == "22/06/1995", "El valor debe terminar con el renglón"
+        assert valores['nombre'] == "MONTAÑA MIRANDA ELKIN", "Debe conservar la primera aparición"
+        assert valores['genero'] == "Masculino", "Los delimitadores cortan el valor anterior"
+        assert valores['antiguedad_ubicacion'] == "189 Meses"
+        assert 'consultado_por' not in valores
+        print(f"✓ {len(valores)} campos leídos en una pasada")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test escáner de etiquetas: {e}")
+        return False
+
+def test_indice_secciones():
+    """Prueba que el índice corta cada sección una vez, uniendo sus tramos"""
+    try:
+        from utils.secciones import PREAMBULO, IndiceSecciones
+        
+        texto = ("Consultado por: DELAGRO SAS\n"
+                 "INFORMACIÓN BÁSICA 1ZS2855\nNombre PEREZ\n"
+                 "HÁBITO DE PAGO DE OBLIGACIONES ABIERTAS / VIGENTES 1ZS2855\nabiertas\n"
+                 "HÁBITO DE PAGO DE OBLIGACIONES CERRADAS / INACTIVAS 1ZS2855\ncerradas\n"
+                 "DEMANDAS JUDICIALES 1ZS2855\nsin procesos\n"
+                 "INFORMACIÓN BÁSICA 1ZS2855\nNombre PEREZ\n")
+        indice = IndiceSecciones(texto)
+        
+        assert indice.seccion(PREAMBULO) == "Consultado por: DELAGRO SAS\n"
+        assert [clave for clave, _, _ in indice.tramos].count('habito_pago') == 1, "Abiertas y cerradas son una sección"
+        assert indice.seccion('habito_pago').endswith("cerradas\n")
+        assert indice.seccion('informacion_basica').count("Nombre PEREZ") == 2, "Debe unir los tramos repetidos"
+        assert indice.seccion('endeudamiento_global') == ""
+        assert indice.seccion('demandas_judiciales') is indice.seccion('demandas_judiciales'), "Debe memorizar el corte"
+        print(f"✓ {len(indice.tramos)} tramos para {len(indice.claves)} secciones")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test índice de secciones: {e}")
+        return False
+
+def test_contexto_extraccion():
+    """Prueba que el contexto calcula cada valor derivado una sola vez por documento"""
+    try:
+        from extractors.contexto_extraccion import ContextoExtraccion
+        
+        texto = "INFORMACIÓN BÁSICA 1ZS2855\nNombre MONTAÑA MIRANDA ELKIN Rango Edad 46-55\n"
+        contexto = ContextoExtraccion(texto)
+        llamadas = []
+        
+        def calcular():
+            llamadas.append(1)
+            return contexto.etiquetas['nombre'].split()
+        
+        assert contexto.memorizar('partes', calcular) is contexto.memorizar('partes', calcular)
+        assert len(llamadas) == 1, "Debe calcular una sola vez"
+        assert contexto.lineas(texto) is contexto.lineas(texto)
+        assert contexto.seccion('endeudamiento_global') == texto, "Sin la sección se usa el texto completo"
+        print(f"✓ Valores derivados memorizados: {contexto.memorizar('partes', calcular)}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test contexto de extracción: {e}")
+        return False
+
+def test_plan_campos():
+    """Prueba que una especificación declarativa se compila y ejecuta como plan"""
+    try:
+        from extractors.contexto_extraccion import ContextoExtraccion
+        from extractors.motor_campos import PlanExtraccion
+        
+        plan = PlanExtraccion({
+            'prueba': {
+                'secciones': ['informacion_basica'],
+                'campos': {
+                    'nombre_completo': {'etiqueta': 'nombre'},
+                    'segundo_apellido': {'campo_base': 'nombre_completo', 'post': ['segundo_apellido']},
+                    'saldo': {'secciones': ['endeudamiento_actual'], 'tipo': 'miles',
+                              'patrones': [r"^TOTAL [\d,]+ ([\d,]+)"]},
+                    'pendiente': {}
+                }
+            }
+        })
+        texto = ("INFORMACIÓN BÁSICA 1ZS2855\nNombre MONTAÑA MIRANDA ELKIN Rango Edad 46-55\n"
+                 "Endeudamiento Actual 1ZS2855\nTOTAL 99,377 66,776 9,510\n")
+        valores = plan.extraer_grupo('prueba', ContextoExtraccion(texto))
+        
+        assert valores == {'nombre_completo': 'MONTAÑA MIRANDA ELKIN', 'segundo_apellido': 'ELKIN',
+                           'saldo': 66776, 'pendiente': None}, valores
+        
+        # Fecha y hora de consulta en el formato del reporte
+        from config.field_mappings import FIELD_SPECS
+        consulta = PlanExtraccion(FIELD_SPECS).extraer_grupo('informacion_consulta', ContextoExtraccion(
+            "Consultado por: DELAGRO SAS 2025/08/26 4.01 PM\nINFORMACIÓN BÁSICA 1ZS2855\n"))
+        assert (consulta['fecha_consulta'], consulta['hora_consulta']) == ("2025/08/26", "4.01 PM"), consulta
+        
+        # Campos sueltos: el campo base se extrae aunque no se pida
+        sueltos = plan.extraer_campos(ContextoExtraccion(texto), ['segundo_apellido', 'saldo'])
+        assert sueltos == {'segundo_apellido': 'ELKIN', 'saldo': 66776}, sueltos
+        print(f"✓ Plan con {len(plan.campos)} campos ejecutado")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test plan de campos: {e}")
+        return False
+
+def test_habito_pago():
+    """Prueba que el autómata arma obligaciones abiertas y cerradas en una pasada"""
+    try:
+        from datetime import date
+        from utils.habito_pago import ABIERTA, CERRADA, a_fecha, extraer_obligaciones, leer_palabras, leer_texto
+        
+        texto = ("HÁBITO DE PAGO DE OBLIGACIONES ABIERTAS / VIGENTES 1ZS2855\n"
+                 "Sector Financiero\n"
+                 "Tipo Num Cta 9 Estado de la Fecha Fecha Fecha Mora\n"
+                 "[NNNN-NNNNNNN][NNNNN-NNNNNN]\n"
+                 "+ Al día\n"
+                 "BCO DAVIVIENDA LIBRE INVERS. CAB 600269117 - 20250731 20200117 20270117 [NNNNNNNNNNNN][NNNNNNNNNNNN]\n"
+                 "Orig: Normal\n"
+                 "MURILLO TORO /\n"
+                 "Normal ADMIS 50,000 18,475 0 11,452 - - - - 6 de 7/A/D 36.0%\n"
+                 "Principal\n"
+                 "HÁBITO DE PAGO DE OBLIGACIONES CERRADAS / INACTIVAS 1ZS2855\n"
+                 "Sector Financiero\n"
+                 "BANCOLOMBIA CCB Saldada A 718157525 20040622 20230430 - - EL GUAMO / -\n"
+                 "[NNNNNNNNNNNN][NNNNNNNNNNNN]\n"
+                 "BCO DAVIVIENDA LIBRE + Pago Vol MURILLO TORO /\n"
+                 "CAB - 700100709 20150713 20200630 50,000 20200713 [NNNNNNNNNNNN][NNNNNNNNNNNN]\n"
+                 "INVERS. Orig: Normal Principal\n")
+        abierta, cuenta, cerrada = extraer_obligaciones(texto)
+        
+        assert abierta['estado_cuenta'] == ABIERTA and abierta['al_dia'] is True
+        assert abierta['entidad'] == "BCO DAVIVIENDA LIBRE INVERS." and abierta['numero_cuenta'] == "600269117"
+        assert abierta['saldo_actual'] == 18475 and abierta['porcentaje_deuda'] == 36.0
+        assert abierta['oficina'] == "MURILLO TORO" and abierta['tipo_deudor'] == "Principal"
+        assert len(abierta['vector']) == 48 and abierta['vector'].startswith("NNNN-")
+        assert cuenta['estado_cuenta'] == CERRADA and cuenta['detalle'] == "Saldada" and cuenta['vector'] is None
+        assert cerrada['entidad'] == "BCO DAVIVIENDA LIBRE INVERS.", cerrada['entidad']
+        assert cerrada['fecha_cierre'] == date(2020, 6, 30) and cerrada['valor_inicial'] == 50000
+        assert a_fecha("00000000") is None and a_fecha("20251301") is None, "Una fecha inválida no detiene el barrido"
+        
+        # Renglones de "25-08-26 MONTAÑA MIRANDA ELKIN.pdf" como (texto, x0, x1)
+        montaña = [
+            [("HÁBITO DE PAGO DE OBLIGACIONES CERRADAS / INACTIVAS", 52, 449)],
+            [("Sector", 25, 56), ("Financiero", 59, 109)],
+            [("+", 182, 187), ("Cancelada", 192, 234), ("[N-----NN-N--][------------]", 796, 947)],
+            [("BANCOLOMBIA", 30, 96), ("AME.", 106, 128), ("NO", 632, 646), ("INFORMO", 648, 691), ("/", 693, 696)],
+            [("TDC", 144, 162), ("Vol", 187, 200), ("Orig:", 203, 222), ("-", 253, 256), ("037781673", 339, 385),
+             ("20050401", 402, 442), ("20060731", 456, 497), ("-", 530, 532), ("20080430", 567, 607),
+             ("[------------][-----------N]", 796, 947)],
+            [("EXP.", 69, 89), ("Principal", 647, 681)],
+            [("Normal", 180, 210)],
+            [("Sector", 25, 56), ("Real", 59, 80)],
+            [("[------------][------------]", 796, 947)],
+            [("NATURA", 38, 75), ("ORIG", 97, 120), ("+", 182, 187), ("Pago", 192, 213), ("Vol", 215, 228)],
+            [("LAB", 144, 162), ("-", 253, 256), ("014106202", 339, 385), ("20221101", 402, 442),
+             ("20221126", 456, 497), ("0", 528, 534), ("20221125", 567, 607), ("AVON", 630, 656), ("/", 658, 661),
+             ("Principal", 663, 698), ("[------------][-----------N]", 796, 947)],
+            [(":AVON", 65, 93), ("Orig:", 180, 199), ("Normal", 202, 231)],
+            [("Sector", 25, 56), ("Telcos", 59, 92)],
+            [("[NNN---------][------------]", 796, 947)],
+            [("+", 182, 187), ("Pago", 192, 213), ("Vol", 215, 228)],
+            [("CLARO", 38, 69), ("SERV", 72, 97), ("MOV", 99, 120), ("CTC", 144, 162), ("A", 252, 258),
+             (".49214796", 341, 383), ("20221123", 402, 442), ("20230228", 456, 497), ("-", 530, 532),
+             ("20230112", 567, 607), ("Principal", 647, 681), ("[------------][-----------N]", 796, 947)],
+            [("Orig:", 180, 199), ("Normal", 202, 231)]
+        ]
+        palabras = [(x0, 10 * num, x1, 10 * num + 8, texto)
+                    for num, renglon in enumerate(montaña) for texto, x0, x1 in renglon]
+        tarjeta, natura, claro = leer_palabras([(0, palabras)]).resultado()
+        assert (tarjeta['entidad'], tarjeta['oficina']) == ("BANCOLOMBIA AME. EXP.", "NO INFORMO"), tarjeta
+        assert tarjeta['numero_cuenta'] == "037781673" and tarjeta['tipo_deudor'] == "Principal"
+        assert (natura['entidad'], natura['oficina']) == ("NATURA ORIG:AVON", "AVON"), natura
+        assert (claro['entidad'], claro['numero_cuenta']) == ("CLARO SERV MOV", ".49214796"), claro
+        assert claro['oficina'] is None and claro['tipo_deudor'] == "Principal" and claro['sector'] == "Telcos"
+        
+        # Solo con el texto: la cuenta con punto se lee; un principal ilegible se cuenta
+        lector = leer_texto("HÁBITO DE PAGO DE OBLIGACIONES CERRADAS / INACTIVAS\nSector Telcos\n+ Pago Vol\n"
+                            "CLARO SERV MOV CTC A .49214796 20221123 20230228 - 20230112 Principal\n"
+                            "[NNN---------][------------]\n+ Pago Vol\n"
+                            "CLARO SERV MOV CTC A ?? 20221123 20230228 - 20230112 Principal\n")
+        obligaciones = lector.resultado()
+        assert [o['numero_cuenta'] for o in obligaciones] == [".49214796"], obligaciones
+        assert len(lector.descartados) == 1 and "??" in lector.descartados[0]
+        print(f"✓ {len([abierta, cuenta, cerrada]) + 3} obligaciones tipadas, {len(lector.descartados)} descartada")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test hábito de pago: {e}")
+        return False
+
+def test_vectores_pago():
+    """Prueba la decodificación de vectores a int8 y las estadísticas por lote"""
+    try:
+        import numpy as np
+        from utils.vectores_pago import SIN_INFORMACION, decodificar_lote, estadisticas_lote
+        
+        matriz = decodificar_lote(["NNNN-NNNNNNN" + "321NN-------" + "N" * 24, None, "NNN4" + "N" * 20])
+        estadisticas = estadisticas_lote(matriz)
+        
+        assert matriz.dtype == np.int8 and matriz.shape == (3, 48)
+        assert matriz[0, 4] == SIN_INFORMACION and matriz[0, 12] == 3 and (matriz[1] == SIN_INFORMACION).all()
+        assert estadisticas['meses_mora'].tolist() == [3, 0, 1]
+        assert estadisticas['mora_maxima'].tolist() == [3, 0, 4]
+        assert estadisticas['racha_al_dia'].tolist() == [24, 0, 20]
+        assert estadisticas['mora_ultimos_12'].tolist() == [0, 0, 1]
+        assert estadisticas['mora_previos_12'].tolist() == [3, 0, 0]
+        print(f"✓ {len(matriz)} vectores decodificados: {estadisticas['tendencia_12'].tolist()}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test vectores de pago: {e}")
+        return False
+
+def test_endeudamiento_global():
+    """Prueba las filas por trimestre de ENDEUDAMIENTO GLOBAL leídas del texto"""
+    try:
+        from utils.endeudamiento_global import extraer_endeudamiento_global, totales_trimestre
+        
+        texto = ("ENDEUDAMIENTO GLOBAL CLASIFICADO 7K9JBGE\n"
+                 "TRIMESTRE 2023/12\nSector Financiero\n"
+                 "Nro Miles $ Nro Miles $ Nro Miles $ Nro Miles $ Tipo Fecha Avalúo Valor\n"
+                 "BANCOLOMBIA - 9 $280,617 0 $0 0 $0 9 $280,617 0 $0 OTR GAR - $0 ML DC\n"
+                 "FINANDINA - BC 0 A 1 $14,896 1 $14,896 0 $0 0 $0 0 $0 OTR PREND 27/12/2019 $74,000 ML S\n"
+                 "TOTAL 10 $295,513 1 $14,896 0 $0 9 $280,617 0 $0 - - - - -\n"
+                 "TRIMESTRE 2023/09\nSector Telcos\n"
+                 "DIRECTV COL. - 1 $39 0 $0 0 $0 1 $39 0 $0 SIN GAR - $0 MC DC\n"
+                 "TOTAL 1 $39 0 $0 0 $0 1 $39 0 $0 - - - - -\n"
+                 "Endeudamiento Actual 7K9JBGE\n"
+                 "TOTAL 99,377 66,776 9,510 16,505 100.0% 67.2%\n")
+        filas = extraer_endeudamiento_global(texto)
+        
+        assert len(filas) == 5, "Solo las filas de la sección"
+        finandina = filas[1]
+        assert finandina['entidad'] == "FINANDINA" and finandina['calf'] == "A"
+        assert (finandina['tipo_entidad'], finandina['codigo_entidad']) == ("BC", "0")
+        assert filas[0]['entidad'] == "BANCOLOMBIA" and filas[0]['tipo_entidad'] is None and filas[0]['calf'] is None
+        assert finandina['comercial_miles'] == 14896 and finandina['garantia_valor'] == 74000
+        assert finandina['trimestre'] == "2023/12" and finandina['sector'] == "Financiero"
+        assert filas[2]['tipo'] == 'total_sector' and filas[2]['calf'] is None
+        totales = totales_trimestre(filas)
+        assert list(totales) == ["2023/12", "2023/09"] and totales["2023/09"]['saldo_total'] == 39
+        print(f"✓ {len(filas)} filas en {len(totales)} trimestres")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test endeudamiento global: {e}")
+        return False
+
+def test_plantilla_documento():
+    """Prueba que el pie de página y los encabezados de tabla repetidos se quiten"""
+    try:
+        from utils.plantilla_documento import PlantillaDocumento
+        
+        encabezado = ("Tipo Num Cta 9 Estado de la Fecha Fecha Fecha Mora\n"
+                      "Entidad Informante Calf Adjetivo-fecha 47 meses\n"
+                      "Cuenta dígitos Obligación Actualización Apertura Vencimiento Máxima\n")
+        obligacion = ("+ Al día\nBANCOLOMBIA CAB 110098502 - 20240131 20220901 20250901\n"
+                      "Orig: Normal\nOrig: Normal\n")
+        texto = ("HÁBITO DE PAGO DE OBLIGACIONES ABIERTAS / VIGENTES 7K9JBGE\nSector Financiero\n"
+                 + encabezado + obligacion
+                 + "DELAGRO SAS 2024/02/27 18:07:22 Página 1 de 9\n"
+                 + encabezado + obligacion + "Sector Financiero\n"
+                 + encabezado + obligacion
+                 + "DELAGRO SAS 2024/02/27 18:07:22 Página\n")
+        plantilla = PlantillaDocumento.aprender(texto)
+        limpio = plantilla.limpiar(texto)
+        
+        assert plantilla.pie == "DELAGRO SAS 2024/02/27 18:07:22"
+        assert "Página" not in limpio and "Entidad Informante" not in limpio
+        assert limpio.count("Sector Financiero") == 2, "Los sectores se conservan"
+        assert limpio.count("Orig: Normal") == 6, "Los datos repetidos se conservan"
+        print(f"✓ {len(plantilla.repetidos)} renglones repetidos, texto de {len(texto)} a {len(limpio)} caracteres")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test plantilla documento: {e}")
+        return False
+
+def test_normalizacion():
+    """Prueba la conversión por columnas de montos, porcentajes y fechas"""
+    try:
+        import pandas as pd
+        from utils.normalizacion import a_celda, normalizar_dataframe
+        
+        tabla = pd.DataFrame({
+            'saldo_total': ["57,399", "$38,357", "-", ""],
+            'porcentaje_deuda': ["37.0%", "0.0%", "-", "100.0%"],
+            'mora_maxima': [">120", "30", "", "-"],
+            'fecha': ["20250731", "22/06/1995", "2025/08/26", "-"],
+            'numero_documento': ["0012345", "1", "2", "3"],
+            'Teléfono Celular': ["3001234567", "-", "", "3109876543"],
+            'vectores_pago_total': ["42", "8", "0", "-"],
+            'total_codigos': ["3", "1", "", "0"],
+            'estado': ["Al día", "1", "-", ""]
+        })
+        normalizada = normalizar_dataframe(tabla)
+        
+        assert str(normalizada['saldo_total'].dtype) == 'Int64'
+        assert normalizada['saldo_total'].tolist()[:2] == [57399, 38357]
+        assert normalizada['saldo_total'].isna().tolist() == [False, False, True, True]
+        assert normalizada['porcentaje_deuda'].dtype == 'float64' and normalizada['porcentaje_deuda'][0] == 37.0
+        assert normalizada['mora_maxima'][0] == 120
+        assert str(normalizada['fecha'].dtype).startswith('datetime64')
+        assert normalizada['fecha'][1] == pd.Timestamp(1995, 6, 22) and pd.isna(normalizada['fecha'][3])
+        assert normalizada['numero_documento'][0] == "0012345", "Los identificadores quedan como texto"
+        assert normalizada['Teléfono Celular'][0] == "3001234567"
+        assert str(normalizada['vectores_pago_total'].dtype) == 'Int64', "Contiene 'vector' pero es una cantidad"
+        assert str(normalizada['total_codigos'].dtype) == 'Int64'
+        assert normalizada['estado'][0] == "Al día"
+        assert a_celda(normalizada['saldo_total'][2]) is None and a_celda(normalizada['saldo_total'][0]) == 57399
+        print(f"✓ Columnas normalizadas: {dict(normalizada.dtypes.astype(str))}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test normalizacion: {e}")
+        return False
+
+def test_presupuesto_busqueda():
+    """Prueba la ventana de búsqueda y el presupuesto de tiempo por documento"""
+    try:
+        import re
+        from utils.patrones import FLAGS_EXTRACTORES, RegistroPatrones
+        
+        registro = RegistroPatrones(ventana=100, solape=20)
+        texto = "\n".join(f"renglon {i:03d}" for i in range(40)) + "\nfin"
+        with registro.presupuesto(documento="largo.pdf") as largo:
+            fin = registro.buscar(r"^fin$", texto)
+            assert fin is not None, "Un texto largo se busca por tramos, completo"
+            assert fin.start() == texto.index("fin") and fin.string is texto, "Posiciones del texto completo"
+            assert len(registro.encontrar_todos(r"^renglon \d+$", texto)) == 40
+        tramos = registro._tramos(texto)
+        assert all(fin - inicio <= 100 for inicio, fin in tramos)
+        assert [inicio for inicio, _ in tramos[1:]] == [fin for _, fin in tramos[:-1]] and tramos[-1][1] == len(texto)
+        assert largo.resumen()['busquedas_fraccionadas'] == 2
+        
+        # Lo mismo que sobre el texto completo, también con coincidencias que cruzan los cortes
+        for patron in (r"\d+\nrenglon", r"(\d)(\d)\n", r"renglon 0(3\d)\n[^$]+", r"7\nrenglon 0(\d)"):
+            esperado = re.findall(patron, texto, FLAGS_EXTRACTORES)
+            assert registro.encontrar_todos(patron, texto) == esperado, patron
+            assert registro.buscar(patron, texto).span() == re.search(patron, texto, FLAGS_EXTRACTORES).span()
+        assert largo.resumen()['textos_fraccionados'] == [f"^fin$ ({len(texto)} caracteres)",
+                                                        f"^renglon \\d+$ ({len(texto)} caracteres)"]
+        
+        # Los párrafos de secciones_especiales no retroceden sobre espacios sin fin
+        import time
+        from config.field_mappings import FIELD_SPECS
+        notas = FIELD_SPECS['informacion_adicional']['campos']['secciones_especiales']['patrones'][2]
+        assert registro.buscar(notas, "NOTAS: primera\nsegunda\n\notra").group(1) == "primera\nsegunda"
+        inicio = time.perf_counter()
+        assert registro.buscar(notas, "NOTAS" + " " * 3000 + "$") is None
+        assert time.perf_counter() - inicio < 1.0, "Antes eran minutos de retroceso"
+        
+        catastrofico = r"(a+)+$"  # Retroceso exponencial sobre "aaaa...!"
+        with registro.presupuesto(segundos=0.001, documento="malformado.pdf") as presupuesto:
+            registro.buscar(catastrofico, "a" * 18 + "!")
+            assert presupuesto.agotado
+            assert registro.buscar(r"a", "a") is None, "Con el presupuesto agotado no se busca"
+        
+        resumen = presupuesto.resumen()
+        assert resumen['patron_agotado'] == catastrofico and resumen['busquedas_omitidas'] == 1
+        assert registro.excesos() == {catastrofico: 1}
+        assert registro.buscar(r"a", "a") is not None, "Fuera del presupuesto se busca normalmente"
+        print(f"✓ Presupuesto agotado por {resumen['patron_agotado']} en {resumen['tiempo_busqueda']}s")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test presupuesto busqueda: {e}")
+        return False
+
+def test_perfilador():
+    """Prueba el perfil de tiempo y aciertos por campo y patrón"""
+    try:
+        from utils.patrones import RegistroPatrones
+        from utils.perfilador import perfilar
+        
+        registro = RegistroPatrones()
+        texto = "Nombre: ANA PEREZ\nDocumento 12345"
+        with perfilar(registro) as perfilador:
+            for documento in ("a.pdf", "b.pdf"):
+                with perfilador.documento(documento):
+                    with registro.campo("nombre"):
+                        registro.buscar(r"Nombres?:\s*([A-Z ]+)", texto)
+                        registro.buscar(r"Titular:\s*(\w+)", texto)
+                    with registro.campo("documento"):
+                        registro.encontrar_todos(r"\d{5}", texto)
+        assert registro.perfilador is None, "El perfil se desactiva al salir"
+        
+        reporte = perfilador.reporte()
+        filas = {(fila['campo'], fila['patron']): fila for fila in reporte}
+        assert [fila['tiempo_total_ms'] for fila in reporte] == sorted(
+            (fila['tiempo_total_ms'] for fila in reporte), reverse=True), "Reporte ordenado por costo"
+        assert filas[("nombre", r"Titular:\s*(\w+)")]['nunca_acierta']
+        assert filas[("documento", r"\d{5}")]['posicion_minima'] == texto.index("12345")
+        assert all(fila['llamadas'] == 2 and fila['documentos'] == 2 for fila in reporte)
+        
+        resumen = perfilador.resumen()
+        assert resumen['documentos'] == 2 and resumen['busquedas'] == 6 and resumen['patrones_sin_acierto'] == 1
+        print(f"✓ Perfil de {resumen['patrones']} patrones en {resumen['tiempo_busqueda_ms']} ms")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test perfilador: {e}")
+        return False
+
+def test_anclas_literales():
+    """Prueba el descarte de patrones cuyas anclas literales no están en el texto"""
+    try:
+        import re
+        from utils.anclas import anclas_literales
+        from utils.patrones import MIN_TEXTO_ANCLAS, RegistroPatrones
+        
+        registro = RegistroPatrones()
+        assert anclas_literales(registro.compilar(r"^Estado Civil[:\s]*(\w+)")) == (("estado civil",),)
+        assert anclas_literales(registro.compilar(r"Sexo|Género")) == (("sexo",), ("género",))
+        assert anclas_literales(registro.compilar(r"(?:Expedido en|Lugar)\s+(\w+) OBSERVACIONES")) == ((" observaciones",),)
+        assert anclas_literales(registro.compilar(r"\d{2}/\d{2}/\d{4}")) is None, "Sin literales no se descarta"
+        
+        relleno = "x" * MIN_TEXTO_ANCLAS
+        assert registro.buscar(r"Nacionalidad[:\s]*(\w+)", relleno + "\nEstado Civil: SOLTERO") is None
+        assert registro.descartes() == {r"Nacionalidad[:\s]*(\w+)": 1}
+        
+        # Con IGNORECASE también coincide 'İ' con 'i': esas búsquedas no se descartan
+        for texto in (relleno + "\nESTADO CIVIL: SOLTERO", relleno + "\nESTADO CİVİL: SOLTERO"):
+            match = registro.buscar(r"Estado Civil[:\s]*(\w+)", texto)
+            assert match is not None and match.group(1) == "SOLTERO"
+        assert registro.buscar(r"Estado Civil", relleno + "\nestado civil", re.MULTILINE) is None
+        assert len(registro.descartes()) == 1, "Un patrón sensible a mayúsculas se busca igual"
+        
+        print(f"✓ Anclas literales: {registro.descartes()}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test anclas literales: {e}")
+        return False
+
+def test_pool_proceso_caido():
+    """Prueba que un proceso trabajador muerto no detiene el lote"""
+    try:
+        import os
+        from utils.procesamiento_paralelo import ERROR_PROCESO_CAIDO, PoolExtraccion
+        
+        # os.system ejecuta cada "ruta" en un shell hijo del trabajador: kill -9 $PPID lo mata
+        rutas = ["true", "kill -9 $PPID"] + ["true"] * 10
+        pool = PoolExtraccion(os.system, trabajadores=2, archivos_por_trabajador=100)
+        resultados = list(pool.procesar(rutas))
+        
+        assert [indice for indice, _, _, _ in resultados] == list(range(len(rutas))), "Un resultado por archivo"
+        assert resultados[1][3].startswith(ERROR_PROCESO_CAIDO), resultados[1]
+        assert resultados[-1][2:] == (0, None), "Los archivos restantes siguen en otra generación"
+        assert pool.caidas == 1 and pool.reciclajes >= 1
+        
+        print(f"✓ Proceso caído: {sum(1 for r in resultados if r[3])} archivos con error de {len(rutas)}")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test pool proceso caído: {e}")
+        return False
+
+def test_paginas_liberadas():
+    """Prueba que las páginas se liberan al leerlas y que un trabajador no abre otro pool"""
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+        from utils.documento_pdf import DocumentoPDF
+        from utils.pdf_backends import BackendPDF, PdfPlumberBackend
+        from utils.procesamiento_paralelo import extraer_textos_en_paralelo
+        
+        class BackendFalso(BackendPDF):
+            nombre = "falso"
+            liberadas = []
+            
+            def abrir(self, fuente):
+                return fuente
+            
+            def numero_paginas(self, documento):
+                return 3
+            
+            def texto_pagina(self, documento, numero_pagina):
+                return f"pagina {numero_pagina}"
+            
+            def palabras_pagina(self, documento, numero_pagina):
+                return []
+            
+            def liberar_pagina(self, documento, numero_pagina):
+                self.liberadas.append(numero_pagina)
+            
+            def cerrar(self, documento):
+                pass
+        
+        backend = BackendFalso()
+        with DocumentoPDF("falso.pdf", backend) as documento:
+            assert documento.texto == "pagina 0\npagina 1\npagina 2"
+            assert backend.liberadas == [0, 1, 2], f"Texto por defecto: {backend.liberadas}"
+            documento.palabras(1)
+            assert backend.liberadas[-1] == 1, "Palabras"
+        
+        # Dentro de un trabajador del pool las páginas se leen en el mismo proceso
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            anidado = pool.submit(extraer_textos_en_paralelo, "falso.pdf", PdfPlumberBackend(), 80, 4).result()
+        assert anidado is None, "Un trabajador no debe abrir un pool anidado"
+        
+        print("✓ Páginas liberadas al leerlas y sin pools anidados")
+        return True
+        
+    except Exception as e:
+        print(f"❌ Error en test páginas liberadas: {e}")
+        return False
+
 if __name__ == "__main__":
     print("="*50)
     print("TEST DEL SISTEMA MODULAR DATACREDITO")
     print("="*50)
     
-    if test_imports() and test_extractor():
+    if (test_imports() and test_extractor() and test_extraccion_paginada() and test_rastreador_secciones()
+            and test_tablas_palabras() and test_tendencia_endeudamiento() and test_registro_patrones()
+            and test_escaner_etiquetas() and test_indice_secciones() and test_contexto_extraccion()
+            and test_plan_campos() and test_habito_pago() and test_vectores_pago()
+            and test_endeudamiento_global() and test_plantilla_documento() and test_normalizacion()
+            and test_presupuesto_busqueda() and test_perfilador()
+            and test_anclas_literales() and test_pool_proceso_caido() and test_paginas_liberadas()):
         print("\n✅ Todos los tests pasaron correctamente")
     else:
         print("\n❌ Algunos tests fallaron")
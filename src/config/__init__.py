@@ -5,14 +5,20 @@ Config package - Configuraciones y mapeos del sistema
 
 from .field_mappings import (
     FIELD_MAPPINGS,
+    FIELD_SPECS,
     REGEX_PATTERNS,
     DEFAULT_VALUES,
-    SECCIONES
+    SECCIONES,
+    ENCABEZADOS_SECCIONES,
+    ENCABEZADOS_DELIMITADORES
 )
 
 __all__ = [
     'FIELD_MAPPINGS',
+    'FIELD_SPECS',
     'REGEX_PATTERNS', 
     'DEFAULT_VALUES',
-    'SECCIONES'
+    'SECCIONES',
+    'ENCABEZADOS_SECCIONES',
+    'ENCABEZADOS_DELIMITADORES'
 ]
\ No newline at end of file
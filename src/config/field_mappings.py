@@ -50,9 +50,261 @@ FIELD_MAPPINGS = {
     }
 }
 
+# Fecha y hora de consulta como las imprime el reporte: "2025/08/26 4.01 PM"
+FECHA_CONSULTA = r"20[0-9]{2}/[0-9]{2}/[0-9]{2}"
+HORA_CONSULTA = r"[0-9]{1,2}\.[0-9]{2} (AM|PM)"
+
+# Especificación declarativa de los campos del extractor completo (los demás
+# extractores toman de aquí los de INFORMACIÓN BÁSICA, ver motor_campos)
+#   grupo -> 'secciones' (claves de sección donde buscar; 'preambulo' es el texto
+#   antes del primer encabezado) y 'campos' en orden de salida. Cada campo admite:
+#     'etiqueta': valor leído por el escáner de INFORMACIÓN BÁSICA (se prueba primero)
+#     'patrones': patrones regex en orden de prioridad (grupo 1 o coincidencia completa)
+#     'secciones': secciones propias del campo (por defecto las del grupo)
+#     'campo_base': toma el valor de otro campo ya extraído del mismo grupo
+#     'tipo': 'texto' (por defecto), 'entero' o 'miles'
+#     'post': nombres de posprocesos aplicados al valor en orden
+#   Un campo sin etiqueta, patrones ni campo_base queda declarado y vacío.
+FIELD_SPECS = {
+    'informacion_personal': {
+        'secciones': ['preambulo', 'informacion_basica'],
+        'campos': {
+            'consultado_por': {'patrones': [
+                r"Consultado por[:\s]*([A-ZÁÉÍÓÚÑ]+(?:\s+[A-ZÁÉÍÓÚÑ]+)+)(?:\s+(?:DELAGRO|SAS|LTDA|S\.A\.S|S\.A|EMPRESA))",
+                r"([A-ZÁÉÍÓÚÑ]+\s+[A-ZÁÉÍÓÚÑ]+\s+[a-záéíóúñ]+)(?=\s*DELAGRO)",
+                r"Consultado por[:\s]*([A-ZÁÉÍÓÚÑ\s]+?)(?=\s*(?:DELAGRO|SAS|LTDA))"
+            ]},
+            'tipo_documento': {'etiqueta': 'tipo_documento', 'patrones': [
+                r"Tipo Documento[:\s]*([A-Za-z\.\s]+?)(?=\s*Número|\s*$)",
+                r"(Cédula de Ciudadanía)",
+                r"(C\.C\.)",
+                r"(Tarjeta de Identidad)",
+                r"(Pasaporte)"
+            ]},
+            'numero_documento': {'etiqueta': 'numero_documento', 'patrones': [
+                r"Número Documento[:\s]*([0-9\.]+)",
+                r"C\.C\.\s*([0-9\.]+)",
+                r"No\.\s*([0-9\.]+)"
+            ]},
+            'estado_documento': {'etiqueta': 'estado_documento', 'patrones': [
+                r"Estado Documento[:\s]*([A-Za-zÁÉÍÓÚÑ]+)",
+                r"(Vigente)",
+                r"(Vencido)",
+                r"(Suspendido)"
+            ]},
+            'lugar_expedicion': {'etiqueta': 'lugar_expedicion', 'patrones': [
+                r"Lugar Expedición[:\s]*([A-ZÁÉÍÓÚÑa-z\s]+?)(?=\s*Fecha Expedici|$)",
+                r"Expedido en[:\s]*([A-ZÁÉÍÓÚÑa-z\s]+)"
+            ]},
+            'fecha_expedicion': {'etiqueta': 'fecha_expedicion', 'patrones': [
+                r"Fecha Expedición[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})",
+                r"Expedido el[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})"
+            ]},
+            'nombre_completo': {'etiqueta': 'nombre', 'patrones': [
+                r"Nombre[:\s]*([A-ZÁÉÍÓÚÑ\s]+)(?=\s*Rango Edad|$)",
+                r"Nombres y Apellidos[:\s]*([A-ZÁÉÍÓÚÑ\s]+)"
+            ]},
+            'primer_nombre': {'campo_base': 'nombre_completo', 'post': ['primer_nombre']},
+            'segundo_nombre': {'campo_base': 'nombre_completo', 'post': ['segundo_nombre']},
+            'primer_apellido': {'campo_base': 'nombre_completo', 'post': ['primer_apellido']},
+            'segundo_apellido': {'campo_base': 'nombre_completo', 'post': ['segundo_apellido']},
+            'rango_edad': {'etiqueta': 'rango_edad', 'patrones': [
+                r"Rango Edad[:\s]*([0-9\-]+)",
+                r"(\d{2}-\d{2})",
+                r"Edad[:\s]*([0-9\-]+)"
+            ]},
+            'edad_exacta': {'patrones': [r"Edad[:\s]*([0-9]+)\s*años", r"([0-9]+)\s*años"]},
+            'genero': {'etiqueta': 'genero', 'patrones': [
+                r"Género[:\s]*([A-Za-zÁÉÍÓÚÑ]+)",
+                r"(Femenino)",
+                r"(Masculino)",
+                r"Sexo[:\s]*([A-Za-zÁÉÍÓÚÑ]+)"
+            ]},
+            'estado_civil': {'patrones': [r"Estado Civil[:\s]*([A-Za-zÁÉÍÓÚÑ]+)"]},
+            'nacionalidad': {'patrones': [r"Nacionalidad[:\s]*([A-Za-zÁÉÍÓÚÑ]+)"]}
+        }
+    },
+    'informacion_consulta': {
+        'secciones': ['preambulo', 'historico_consultas'],
+        'campos': {
+            'fecha_consulta': {'patrones': [
+                "(" + FECHA_CONSULTA + ") " + HORA_CONSULTA,
+                r"Fecha y Hora Consulta[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})",
+                r"([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})\s+[0-9]{1,2}:[0-9]{2}",
+                r"Fecha[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})"
+            ]},
+            'hora_consulta': {'patrones': [
+                FECHA_CONSULTA + " (" + HORA_CONSULTA + ")",
+                r"Fecha y Hora Consulta[:\s]*[0-9]{2}/[0-9]{2}/[0-9]{4}\s+([0-9]{1,2}:[0-9]{2})",
+                r"[0-9]{2}/[0-9]{2}/[0-9]{4}\s+([0-9]{1,2}:[0-9]{2}:[0-9]{2})",
+                r"Hora[:\s]*([0-9]{1,2}:[0-9]{2})"
+            ]},
+            'tipo_consulta': {},
+            'codigo_consulta': {},
+            'entidad_consultante': {},
+            'motivo_consulta': {}
+        }
+    },
+    'historial_crediticio': {
+        'secciones': ['resumen', 'perfil_general', 'tendencia_endeudamiento', 'endeudamiento_actual'],
+        'campos': {
+            'calificacion_crediticia': {},
+            'categoria_riesgo': {},
+            'experiencia_crediticia': {},
+            'comportamiento_pago': {},
+            'mora_maxima': {},
+            'saldo_total_deudas': {'secciones': ['endeudamiento_actual'], 'tipo': 'miles',
+                                   'patrones': [r"^TOTAL [\d,]+ ([\d,]+)"]},
+            'valor_mora': {'secciones': ['endeudamiento_actual'], 'tipo': 'miles',
+                           'patrones': [r"^TOTAL [\d,]+ [\d,]+ ([\d,]+)"]},
+            # Columna Total Sectores del Perfil General
+            'numero_obligaciones_activas': {'secciones': ['perfil_general'], 'tipo': 'entero',
+                                            'patrones': [r"^Créditos Vigentes (?:\d+ ){4}(\d+)"]},
+            'numero_obligaciones_canceladas': {'secciones': ['perfil_general'], 'tipo': 'entero',
+                                               'patrones': [r"^Créditos Cerrados (?:\d+ ){4}(\d+)"]},
+            'cupo_credito_total': {'secciones': ['endeudamiento_actual'], 'tipo': 'miles',
+                                   'patrones': [r"^TOTAL ([\d,]+)"]},
+            'cupo_utilizado': {},
+            'cupo_disponible': {}
+        }
+    },
+    'informacion_comercial': {
+        'secciones': ['informacion_basica', 'reconocer'],
+        'campos': {
+            'actividad_economica_principal': {},
+            'codigo_ciiu': {},
+            'sector_economico': {},
+            'ingresos_reportados': {},
+            'patrimonio_reportado': {},
+            'empresa_trabajo': {},
+            'cargo': {},
+            'tiempo_laborando': {},
+            'tipo_contrato': {}
+        }
+    },
+    'centrales_riesgo': {
+        'secciones': ['alertas', 'puntaje_acierta'],
+        'campos': {
+            'datacredito_score': {},
+            'asobancaria_score': {},
+            'cifin_score': {},
+            'procredito_score': {},
+            'reportes_negativos': {},
+            'reportes_positivos': {},
+            'ultima_actualizacion': {}
+        }
+    },
+    'informacion_judicial': {
+        'secciones': ['demandas_judiciales'],
+        'campos': {
+            'procesos_judiciales': {'patrones': [r"^\(\d{3}\)\s*(.+)$"]},
+            'embargos': {},
+            'demandas': {},
+            'remates': {},
+            'concordatos': {},
+            'reestructuraciones': {}
+        }
+    },
+    'datos_demograficos': {
+        'secciones': ['informacion_basica', 'reconocer'],
+        'campos': {
+            'direccion_residencia': {},
+            'ciudad_residencia': {},
+            'departamento_residencia': {},
+            'antiguedad_ubicacion': {'etiqueta': 'antiguedad_ubicacion', 'patrones': [
+                r"Antiguedad Ubicación[:\s]*([0-9]+\s*Meses\s*[A-Za-z\s]+?)(?=\s*ARTICULO|\s*-|$)",
+                r"(\d+\s*Meses\s*[A-Za-z\s]+?)(?=\s*ARTICULO|\s*-|$)",
+                r"Antigüedad[:\s]*([0-9]+\s*[A-Za-z\s]+)"
+            ]},
+            # Primer registro de cada tabla de RECONOCER+
+            'telefono_residencia': {'patrones': [r"^# Teléfono Fijo.*\n1 (\d+)"]},
+            'telefono_celular': {'patrones': [r"^# Celular.*\n1 (\d+)"]},
+            'email': {'patrones': [r"^# Correo Electrónico.*\n1 (\S+@\S+)"]},
+            'tipo_vivienda': {},
+            'estrato': {}
+        }
+    },
+    'actividad_economica': {
+        'secciones': ['informacion_basica', 'reconocer'],
+        'campos': {
+            'profesion': {},
+            'ocupacion': {},
+            'nivel_educativo': {},
+            'experiencia_laboral': {},
+            'tipo_empleado': {}
+        }
+    },
+    'obligaciones_financieras': {
+        'secciones': ['endeudamiento_actual', 'habito_pago', 'endeudamiento_global'],
+        'campos': {
+            'creditos_hipotecarios': {},
+            'creditos_vehiculo': {},
+            'tarjetas_credito': {},
+            'creditos_libranza': {},
+            'microCreditos': {},
+            'creditos_consumo': {},
+            'creditos_comerciales': {},
+            'leasing': {},
+            'avales': {},
+            'cartas_credito': {}
+        }
+    },
+    'historial_consultas': {
+        'secciones': ['historico_consultas'],
+        'campos': {
+            'consultas_ultimo_mes': {},
+            'consultas_ultimos_3_meses': {},
+            'consultas_ultimo_semestre': {},
+            'consultas_ultimo_año': {},
+            'total_consultas': {},
+            'entidades_consultantes': {}
+        }
+    },
+    'referencias_comerciales': {
+        'secciones': ['habito_pago'],
+        'campos': {
+            'referencias_bancarias': {},
+            'referencias_comerciales': {},
+            'referencias_personales': {},
+            'experiencia_sector_financiero': {}
+        }
+    },
+    'score_crediticio': {
+        'secciones': ['puntaje_acierta'],
+        'campos': {
+            'score_datacredito': {},
+            'interpretacion_score': {},
+            'probabilidad_incumplimiento': {},
+            'nivel_riesgo': {}
+        }
+    },
+    'alertas_observaciones': {
+        'secciones': ['alertas', 'notas'],
+        'campos': {
+            'alertas_seguridad': {},
+            'observaciones_especiales': {},
+            'restricciones': {},
+            'notas_aclaratorias': {}
+        }
+    },
+    'informacion_adicional': {
+        'secciones': [],
+        'campos': {
+            # Párrafo tras la etiqueta: renglones seguidos hasta uno vacío o un '$'.
+            # Cada carácter tiene una sola forma de coincidir, así que una búsqueda
+            # fallida no retrocede sobre el resto del texto
+            'secciones_especiales': {'patrones': [
+                r"INFORMACIÓN ADICIONAL[:\s]*([^$\s:][^$\n]*(?:\n[^$\n]+)*)",
+                r"OBSERVACIONES[:\s]*([^$\s:][^$\n]*(?:\n[^$\n]+)*)",
+                r"NOTAS[:\s]*([^$\s:][^$\n]*(?:\n[^$\n]+)*)"
+            ]}
+        }
+    }
+}
+
 # Patrones regex comunes
 REGEX_PATTERNS = {
-    'fecha_hora': r"(20[0-9]{2}/[0-9]{2}/[0-9]{2} [0-9]{1,2}\.[0-9]{2} (AM|PM))",
+    'fecha_hora': "(" + FECHA_CONSULTA + " " + HORA_CONSULTA + ")",
     'numero_documento': r"([0-9]{6,12})",
     'fechas': r"([0-9]{2}/[0-9]{2}/[0-9]{4})",
     'nombres': r"([A-ZÁÉÍÓÚÑ\s]+)",
@@ -83,6 +335,33 @@ SECCIONES = [
     'puntaje_acierta'
 ]
 
+# Encabezados de línea que abren cada sección del reporte (el código de
+# reporte, p.ej. "1ZS2855", o "null" puede seguir al título)
+ENCABEZADOS_SECCIONES = {
+    'informacion_basica': r"INFORMACIÓN BÁSICA(?: \S+)?$",
+    'perfil_general': r"Perfil General$",
+    'tendencia_endeudamiento': r"Tendencia de endeudamiento$",
+    'endeudamiento_actual': r"Endeudamiento Actual(?: \S+)?$",
+    'habito_pago': r"HÁBITO DE PAGO DE OBLIGACIONES (?:ABIERTAS|CERRADAS)\b.*$",
+    'evolucion_deuda': r"EVOLUCIÓN DE LA DEUDA(?: \S+)?$",
+    'demandas_judiciales': r"DEMANDAS JUDICIALES(?: \S+)?$",
+    'historico_consultas': r"HISTÓRICO DE CONSULTAS(?: \S+)?$",
+    'endeudamiento_global': r"ENDEUDAMIENTO GLOBAL CLASIFICADO(?: \S+)?$",
+    'reconocer': r"RECONOCER\+?(?: \S+)?$",
+    'puntaje_acierta': r"ACIERTA\b.*$"
+}
+
+# Encabezados que no se extraen pero cierran la sección anterior
+ENCABEZADOS_DELIMITADORES = {
+    'articulo_14': r"ARTICULO 14 LEY 1266\b.*$",
+    'alertas': r"ALERTAS(?: \S+)?$",
+    'resumen': r"RESUMEN(?: \S+)?$",
+    'analisis_vectores': r"ANALISIS DE VECTORES(?: \S+)?$",
+    'informacion_cheques': r"INFORMACIÓN DE CHEQUES(?: \S+)?$",
+    'resumen_endeudamiento_global': r"RESUMEN ENDEUDAMIENTO GLOBAL(?: \S+)?$",
+    'notas': r"NOTAS$"
+}
+
 # Configuración de Excel
 EXCEL_CONFIG = {
     'formato_fecha': 'DD/MM/YYYY',
@@ -4,9 +4,11 @@ Extractors package - Extractores especializados por sección
 """
 
 from .base_extractor import BaseExtractor
+from .contexto_extraccion import ContextoExtraccion
 from .info_basica import InformacionBasicaExtractor
 
 __all__ = [
     'BaseExtractor',
+    'ContextoExtraccion',
     'InformacionBasicaExtractor'
 ]
\ No newline at end of file
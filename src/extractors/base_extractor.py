@@ -4,16 +4,21 @@ Clase base para todos los extractores de secciones
 """
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
-from config.field_mappings import REGEX_PATTERNS, DEFAULT_VALUES
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from config.field_mappings import DEFAULT_VALUES
+from utils.patrones import PATRONES_COMUNES, REGISTRO
 
 class BaseExtractor(ABC):
     """Clase base abstracta para extractores de secciones"""
     
+    # Líneas de la página anterior que se anteponen a la siguiente en extract_paginas
+    LINEAS_CONTEXTO = 3
+    
     def __init__(self, nombre_seccion: str):
         self.nombre_seccion = nombre_seccion
-        self.regex_patterns = REGEX_PATTERNS
+        self.regex_patterns = PATRONES_COMUNES
         self.default_values = DEFAULT_VALUES
+        self.registrar_log = True
     
     @abstractmethod
     def extract(self, texto: str, archivo: str) -> Dict[str, Any]:
@@ -29,19 +34,64 @@ class BaseExtractor(ABC):
         """
         pass
     
+    def extract_paginas(self, paginas: Iterable[Tuple[int, str]], archivo: str) -> Dict[str, Any]:
+        """
+        Extrae datos de forma incremental a partir de un flujo de páginas
+        
+        Cada página se procesa apenas llega, precedida por las últimas líneas de
+        la anterior para no perder campos partidos por el salto de página. Se
+        conserva el primer valor encontrado de cada campo y el recorrido se
+        detiene cuando todos los campos tienen valor. Un patrón de respaldo que
+        acierte en una página anterior gana sobre la etiqueta de una posterior.
+        
+        Args:
+            paginas: Pares (número de página, texto), p.ej. PDFReader.iterar_paginas
+            archivo: Nombre del archivo
+            
+        Returns:
+            Dict con datos extraídos
+        """
+        registro: Dict[str, Any] = {}
+        contexto = ""
+        self.registrar_log = False
+        
+        try:
+            for _, texto_pagina in paginas:
+                ventana = f"{contexto}\n{texto_pagina}" if contexto else texto_pagina
+                
+                for campo, valor in self.extract(ventana, archivo).items():
+                    if valor and not registro.get(campo):
+                        registro[campo] = valor
+                    else:
+                        registro.setdefault(campo, valor)
+                
+                if registro and all(registro.values()):
+                    break
+                
+                contexto = "\n".join(texto_pagina.splitlines()[-self.LINEAS_CONTEXTO:])
+        finally:
+            self.registrar_log = True
+            # Liberar el documento si se terminó antes de la última página
+            cerrar = getattr(paginas, 'close', None)
+            if cerrar:
+                cerrar()
+        
+        self.log_extraccion(archivo, len([v for v in registro.values() if v]), [])
+        return registro
+    
     def buscar_patron(self, patron: str, texto: str) -> Optional[str]:
         """
         Busca un patrón regex en el texto
         
         Args:
-            patron: Patrón regex a buscar
+            patron: Patrón regex a buscar (texto o compilado)
             texto: Texto donde buscar
             
         Returns:
             Primer resultado encontrado o None
         """
         try:
-            match = re.search(patron, texto, re.IGNORECASE | re.MULTILINE)
+            match = REGISTRO.buscar(patron, texto)
             if match:
                 resultado = match.group(1) if match.groups() else match.group(0)
                 return self.limpiar_texto(resultado)
@@ -54,7 +104,7 @@ class BaseExtractor(ABC):
         Busca múltiples patrones hasta encontrar uno
         
         Args:
-            patrones: Lista de patrones a probar
+            patrones: Lista de patrones a probar, en orden de prioridad
             texto: Texto donde buscar
             
         Returns:
@@ -148,6 +198,9 @@ class BaseExtractor(ABC):
             campos_extraidos: Cantidad de campos extraídos
             errores: Lista de errores encontrados
         """
+        if not self.registrar_log:
+            return
+        
         print(f"  └─ {self.nombre_seccion}: {campos_extraidos} campos extraídos")
         
         if errores:
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+Contexto de extracción de un reporte
+
+Los valores que varios métodos de extracción necesitan (líneas, secciones,
+etiquetas de INFORMACIÓN BÁSICA, partes del nombre) se calculan la primera vez
+que se piden y se reutilizan durante el resto de la extracción del documento.
+Antes de todo se quitan el pie de página y los encabezados de tabla repetidos,
+aprendidos del mismo documento (utils.plantilla_documento).
+"""
+from functools import cached_property
+from typing import Any, Callable, Dict, Hashable, List
+
+from utils.etiquetas import ESCANER_INFORMACION_BASICA
+from utils.plantilla_documento import limpiar_texto
+from utils.secciones import IndiceSecciones
+
+class ContextoExtraccion:
+    """Valores derivados de un documento, calculados una sola vez"""
+    
+    def __init__(self, texto: str, limpiar: bool = True):
+        """
+        Args:
+            texto: Texto completo del reporte
+            limpiar: Quitar el pie de página y los encabezados de tabla repetidos
+        """
+        self.texto = limpiar_texto(texto) if limpiar else texto
+        self._valores: Dict[Hashable, Any] = {}
+    
+    @cached_property
+    def indice(self) -> IndiceSecciones:
+        """Posiciones de las secciones del reporte"""
+        return IndiceSecciones(self.texto)
+    
+    @cached_property
+    def etiquetas(self) -> Dict[str, str]:
+        """Valores de las etiquetas de INFORMACIÓN BÁSICA (una sola pasada)"""
+        return ESCANER_INFORMACION_BASICA.escanear(self.seccion('informacion_basica'))
+    
+    def seccion(self, *claves: str) -> str:
+        """
+        Texto de una o más secciones
+        
+        Returns:
+            Texto de las secciones, o el texto completo si el reporte no las tiene
+        """
+        return self.indice.seccion(*claves) or self.texto
+    
+    def lineas(self, texto: str) -> List[str]:
+        """Líneas de un texto del documento (el completo o una sección)"""
+        return self.memorizar(('lineas', texto), lambda: texto.split('\n'))
+    
+    def memorizar(self, clave: Hashable, calcular: Callable[[], Any]) -> Any:
+        """
+        Valor guardado bajo una clave, calculado solo la primera vez
+        
+        Args:
+            clave: Identificador del valor (p.ej. ('nombre_completo', texto))
+            calcular: Función sin argumentos que produce el valor
+            
+        Returns:
+            Valor calculado o guardado
+        """
+        if clave not in self._valores:
+            self._valores[clave] = calcular()
+        return self._valores[clave]
\ No newline at end of file
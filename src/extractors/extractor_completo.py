@@ -2,17 +2,31 @@
 """
 Extractor Completo de TODA la información del reporte DataCrédito
 Analiza y extrae absolutamente todos los datos del PDF
+
+Los campos se declaran en config.field_mappings.FIELD_SPECS y se ejecutan con
+el plan compilado de motor_campos; aquí solo queda la información no
+estructurada, que no se describe con patrones.
 """
-import re
 from typing import Dict, Any, List
+from utils.patrones import REGISTRO
 from .base_extractor import BaseExtractor
+from .contexto_extraccion import ContextoExtraccion
+from .motor_campos import PLAN_CAMPOS, PlanExtraccion
+
+# Grupos cuyos campos cuentan en _metadata.total_campos_extraidos
+GRUPOS_PRINCIPALES = ('informacion_personal', 'informacion_consulta', 'historial_crediticio')
 
 class ExtractorCompleto(BaseExtractor):
     """Extractor que captura TODA la información del reporte DataCrédito"""
     
-    def __init__(self):
+    def __init__(self, plan: PlanExtraccion = PLAN_CAMPOS):
+        """
+        Args:
+            plan: Plan de campos compilado (por defecto el de FIELD_SPECS)
+        """
         super().__init__("Extractor Completo DataCrédito")
-        
+        self.plan = plan
+    
     def extract(self, texto: str, archivo: str) -> Dict[str, Any]:
         """
         Extrae TODA la información del PDF DataCrédito
@@ -24,400 +38,57 @@ class ExtractorCompleto(BaseExtractor):
         Returns:
             Dict con TODA la información extraída
         """
-        # Información básica personal
-        info_personal = self.extraer_informacion_personal(texto)
-        
-        # Información de consulta
-        info_consulta = self.extraer_informacion_consulta(texto)
-        
-        # Historial crediticio
-        historial_crediticio = self.extraer_historial_crediticio(texto)
-        
-        # Información comercial
-        info_comercial = self.extraer_informacion_comercial(texto)
-        
-        # Centrales de riesgo
-        centrales_riesgo = self.extraer_centrales_riesgo(texto)
-        
-        # Información judicial
-        info_judicial = self.extraer_informacion_judicial(texto)
-        
-        # Datos demográficos
-        datos_demograficos = self.extraer_datos_demograficos(texto)
-        
-        # Actividad económica
-        actividad_economica = self.extraer_actividad_economica(texto)
-        
-        # Obligaciones financieras
-        obligaciones = self.extraer_obligaciones_financieras(texto)
-        
-        # Consultas realizadas
-        consultas = self.extraer_historial_consultas(texto)
-        
-        # Referencias comerciales
-        referencias = self.extraer_referencias_comerciales(texto)
-        
-        # Score crediticio
-        score = self.extraer_score_crediticio(texto)
-        
-        # Alertas y observaciones
-        alertas = self.extraer_alertas_observaciones(texto)
-        
-        # Información adicional (todo lo que no esté categorizado)
-        info_adicional = self.extraer_informacion_adicional(texto)
-        
-        # Combinar toda la información
-        registro = {
-            **info_personal,
-            **info_consulta,
-            **historial_crediticio,
-            **info_comercial,
-            **centrales_riesgo,
-            **info_judicial,
-            **datos_demograficos,
-            **actividad_economica,
-            **obligaciones,
-            **consultas,
-            **referencias,
-            **score,
-            **alertas,
-            **info_adicional,
-            '_metadata': {
-                'archivo': archivo,
-                'total_campos_extraidos': len([v for v in {**info_personal, **info_consulta, **historial_crediticio}.values() if v]),
-                'texto_completo_length': len(texto)
-            }
+        # Índice de secciones, etiquetas y líneas se calculan una vez por documento;
+        # las búsquedas tienen un presupuesto de tiempo por documento
+        contexto = ContextoExtraccion(texto)
+        with REGISTRO.presupuesto(documento=archivo) as presupuesto:
+            grupos = self.plan.extraer(contexto)
+            
+            # Información adicional (todo lo que no esté categorizado, sobre el texto completo)
+            if 'informacion_adicional' in grupos:
+                grupos['informacion_adicional'] = self.extraer_informacion_adicional(
+                    contexto, grupos['informacion_adicional'])
+        
+        registro = {campo: valor for valores in grupos.values() for campo, valor in valores.items()}
+        registro['_metadata'] = {
+            'archivo': archivo,
+            'total_campos_extraidos': sum(
+                1 for grupo in GRUPOS_PRINCIPALES
+                for valor in grupos.get(grupo, {}).values() if valor
+            ),
+            'texto_completo_length': len(texto),
+            **presupuesto.resumen()
         }
         
         return registro
     
-    def extraer_informacion_personal(self, texto: str) -> Dict[str, Any]:
-        """Extrae información personal completa"""
-        return {
-            'consultado_por': self.extraer_consultado_por(texto),
-            'tipo_documento': self.extraer_tipo_documento(texto),
-            'numero_documento': self.extraer_numero_documento(texto),
-            'estado_documento': self.extraer_estado_documento(texto),
-            'lugar_expedicion': self.extraer_lugar_expedicion(texto),
-            'fecha_expedicion': self.extraer_fecha_expedicion(texto),
-            'nombre_completo': self.extraer_nombre_completo(texto),
-            'primer_nombre': self.extraer_primer_nombre(texto),
-            'segundo_nombre': self.extraer_segundo_nombre(texto),
-            'primer_apellido': self.extraer_primer_apellido(texto),
-            'segundo_apellido': self.extraer_segundo_apellido(texto),
-            'rango_edad': self.extraer_rango_edad(texto),
-            'edad_exacta': self.extraer_edad_exacta(texto),
-            'genero': self.extraer_genero(texto),
-            'estado_civil': self.extraer_estado_civil(texto),
-            'nacionalidad': self.extraer_nacionalidad(texto)
-        }
-    
-    def extraer_informacion_consulta(self, texto: str) -> Dict[str, Any]:
-        """Extrae información de la consulta"""
-        return {
-            'fecha_consulta': self.extraer_fecha_consulta(texto),
-            'hora_consulta': self.extraer_hora_consulta(texto),
-            'tipo_consulta': self.extraer_tipo_consulta(texto),
-            'codigo_consulta': self.extraer_codigo_consulta(texto),
-            'entidad_consultante': self.extraer_entidad_consultante(texto),
-            'motivo_consulta': self.extraer_motivo_consulta(texto)
-        }
-    
-    def extraer_historial_crediticio(self, texto: str) -> Dict[str, Any]:
-        """Extrae historial crediticio completo"""
-        return {
-            'calificacion_crediticia': self.extraer_calificacion_crediticia(texto),
-            'categoria_riesgo': self.extraer_categoria_riesgo(texto),
-            'experiencia_crediticia': self.extraer_experiencia_crediticia(texto),
-            'comportamiento_pago': self.extraer_comportamiento_pago(texto),
-            'mora_maxima': self.extraer_mora_maxima(texto),
-            'saldo_total_deudas': self.extraer_saldo_total_deudas(texto),
-            'valor_mora': self.extraer_valor_mora(texto),
-            'numero_obligaciones_activas': self.extraer_numero_obligaciones_activas(texto),
-            'numero_obligaciones_canceladas': self.extraer_numero_obligaciones_canceladas(texto),
-            'cupo_credito_total': self.extraer_cupo_credito_total(texto),
-            'cupo_utilizado': self.extraer_cupo_utilizado(texto),
-            'cupo_disponible': self.extraer_cupo_disponible(texto)
-        }
-    
-    def extraer_informacion_comercial(self, texto: str) -> Dict[str, Any]:
-        """Extrae información comercial"""
-        return {
-            'actividad_economica_principal': self.extraer_actividad_economica_principal(texto),
-            'codigo_ciiu': self.extraer_codigo_ciiu(texto),
-            'sector_economico': self.extraer_sector_economico(texto),
-            'ingresos_reportados': self.extraer_ingresos_reportados(texto),
-            'patrimonio_reportado': self.extraer_patrimonio_reportado(texto),
-            'empresa_trabajo': self.extraer_empresa_trabajo(texto),
-            'cargo': self.extraer_cargo(texto),
-            'tiempo_laborando': self.extraer_tiempo_laborando(texto),
-            'tipo_contrato': self.extraer_tipo_contrato(texto)
-        }
-    
-    def extraer_centrales_riesgo(self, texto: str) -> Dict[str, Any]:
-        """Extrae información de centrales de riesgo"""
-        return {
-            'datacredito_score': self.extraer_datacredito_score(texto),
-            'asobancaria_score': self.extraer_asobancaria_score(texto),
-            'cifin_score': self.extraer_cifin_score(texto),
-            'procredito_score': self.extraer_procredito_score(texto),
-            'reportes_negativos': self.extraer_reportes_negativos(texto),
-            'reportes_positivos': self.extraer_reportes_positivos(texto),
-            'ultima_actualizacion': self.extraer_ultima_actualizacion(texto)
-        }
-    
-    def extraer_informacion_judicial(self, texto: str) -> Dict[str, Any]:
-        """Extrae información judicial"""
-        return {
-            'procesos_judiciales': self.extraer_procesos_judiciales(texto),
-            'embargos': self.extraer_embargos(texto),
-            'demandas': self.extraer_demandas(texto),
-            'remates': self.extraer_remates(texto),
-            'concordatos': self.extraer_concordatos(texto),
-            'reestructuraciones': self.extraer_reestructuraciones(texto)
-        }
-    
-    def extraer_datos_demograficos(self, texto: str) -> Dict[str, Any]:
-        """Extrae datos demográficos y de ubicación"""
-        return {
-            'direccion_residencia': self.extraer_direccion_residencia(texto),
-            'ciudad_residencia': self.extraer_ciudad_residencia(texto),
-            'departamento_residencia': self.extraer_departamento_residencia(texto),
-            'antiguedad_ubicacion': self.extraer_antiguedad_direccion(texto),
-            'telefono_residencia': self.extraer_telefono_residencia(texto),
-            'telefono_celular': self.extraer_telefono_celular(texto),
-            'email': self.extraer_email(texto),
-            'tipo_vivienda': self.extraer_tipo_vivienda(texto),
-            'estrato': self.extraer_estrato(texto)
-        }
-    
-    def extraer_actividad_economica(self, texto: str) -> Dict[str, Any]:
-        """Extrae información de actividad económica"""
-        return {
-            'profesion': self.extraer_profesion(texto),
-            'ocupacion': self.extraer_ocupacion(texto),
-            'nivel_educativo': self.extraer_nivel_educativo(texto),
-            'experiencia_laboral': self.extraer_experiencia_laboral(texto),
-            'tipo_empleado': self.extraer_tipo_empleado(texto)
-        }
-    
-    def extraer_obligaciones_financieras(self, texto: str) -> Dict[str, Any]:
-        """Extrae detalle de obligaciones financieras"""
-        return {
-            'creditos_hipotecarios': self.extraer_creditos_hipotecarios(texto),
-            'creditos_vehiculo': self.extraer_creditos_vehiculo(texto),
-            'tarjetas_credito': self.extraer_tarjetas_credito(texto),
-            'creditos_libranza': self.extraer_creditos_libranza(texto),
-            'microCreditos': self.extraer_microcreditos(texto),
-            'creditos_consumo': self.extraer_creditos_consumo(texto),
-            'creditos_comerciales': self.extraer_creditos_comerciales(texto),
-            'leasing': self.extraer_leasing(texto),
-            'avales': self.extraer_avales(texto),
-            'cartas_credito': self.extraer_cartas_credito(texto)
-        }
-    
-    def extraer_historial_consultas(self, texto: str) -> Dict[str, Any]:
-        """Extrae historial de consultas"""
-        return {
-            'consultas_ultimo_mes': self.extraer_consultas_periodo(texto, "último mes"),
-            'consultas_ultimos_3_meses': self.extraer_consultas_periodo(texto, "últimos 3 meses"),
-            'consultas_ultimo_semestre': self.extraer_consultas_periodo(texto, "último semestre"),
-            'consultas_ultimo_año': self.extraer_consultas_periodo(texto, "último año"),
-            'total_consultas': self.extraer_total_consultas(texto),
-            'entidades_consultantes': self.extraer_entidades_consultantes(texto)
-        }
-    
-    def extraer_referencias_comerciales(self, texto: str) -> Dict[str, Any]:
-        """Extrae referencias comerciales"""
-        return {
-            'referencias_bancarias': self.extraer_referencias_bancarias(texto),
-            'referencias_comerciales': self.extraer_referencias_comerciales_detalle(texto),
-            'referencias_personales': self.extraer_referencias_personales(texto),
-            'experiencia_sector_financiero': self.extraer_experiencia_sector_financiero(texto)
-        }
-    
-    def extraer_score_crediticio(self, texto: str) -> Dict[str, Any]:
-        """Extrae scores crediticios"""
-        return {
-            'score_datacredito': self.extraer_score_datacredito(texto),
-            'interpretacion_score': self.extraer_interpretacion_score(texto),
-            'probabilidad_incumplimiento': self.extraer_probabilidad_incumplimiento(texto),
-            'nivel_riesgo': self.extraer_nivel_riesgo(texto)
-        }
-    
-    def extraer_alertas_observaciones(self, texto: str) -> Dict[str, Any]:
-        """Extrae alertas y observaciones"""
-        return {
-            'alertas_seguridad': self.extraer_alertas_seguridad(texto),
-            'observaciones_especiales': self.extraer_observaciones_especiales(texto),
-            'restricciones': self.extraer_restricciones(texto),
-            'notas_aclaratorias': self.extraer_notas_aclaratorias(texto)
-        }
-    
-    def extraer_informacion_adicional(self, texto: str) -> Dict[str, Any]:
-        """Extrae información adicional no categorizada"""
+    def extraer_informacion_adicional(self, contexto: ContextoExtraccion,
+                                      campos: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extrae información adicional no categorizada
+        
+        Args:
+            contexto: Contexto del documento
+            campos: Campos del grupo ya extraídos por el plan (p.ej. secciones_especiales)
+            
+        Returns:
+            Dict con los bloques no estructurados y los campos del plan
+        """
+        bloques = contexto.memorizar('bloques', lambda: self.bloques_significativos(contexto))
         return {
-            'informacion_adicional_1': self.extraer_informacion_no_estructurada(texto, 0),
-            'informacion_adicional_2': self.extraer_informacion_no_estructurada(texto, 1),
-            'informacion_adicional_3': self.extraer_informacion_no_estructurada(texto, 2),
-            'secciones_especiales': self.extraer_secciones_especiales(texto),
-            'datos_complementarios': self.extraer_datos_complementarios(texto)
+            'informacion_adicional_1': bloques[0] if len(bloques) > 0 else "",
+            'informacion_adicional_2': bloques[1] if len(bloques) > 1 else "",
+            'informacion_adicional_3': bloques[2] if len(bloques) > 2 else "",
+            **campos,
+            'datos_complementarios': self.extraer_datos_complementarios(contexto)
         }
     
-    # Métodos de extracción específicos
-    def extraer_consultado_por(self, texto: str) -> str:
-        """Extrae quién consultó (persona natural)"""
-        patrones = [
-            r"Consultado por\s*[:\s]*([A-ZÁÉÍÓÚÑ]+(?:\s+[A-ZÁÉÍÓÚÑ]+)+)(?:\s+(?:DELAGRO|SAS|LTDA|S\.A\.S|S\.A|EMPRESA))",
-            r"([A-ZÁÉÍÓÚÑ]+\s+[A-ZÁÉÍÓÚÑ]+\s+[a-záéíóúñ]+)(?=\s*DELAGRO)",
-            r"Consultado por\s*[:\s]*([A-ZÁÉÍÓÚÑ\s]+?)(?=\s*(?:DELAGRO|SAS|LTDA))"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_fecha_consulta(self, texto: str) -> str:
-        """Extrae fecha de consulta"""
-        patrones = [
-            r"Fecha y Hora Consulta\s*[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})",
-            r"([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})\s+[0-9]{1,2}:[0-9]{2}",
-            r"Fecha[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_hora_consulta(self, texto: str) -> str:
-        """Extrae hora de consulta"""
-        patrones = [
-            r"Fecha y Hora Consulta\s*[:\s]*[0-9]{2}/[0-9]{2}/[0-9]{4}\s+([0-9]{1,2}:[0-9]{2})",
-            r"[0-9]{2}/[0-9]{2}/[0-9]{4}\s+([0-9]{1,2}:[0-9]{2}:[0-9]{2})",
-            r"Hora[:\s]*([0-9]{1,2}:[0-9]{2})"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_tipo_documento(self, texto: str) -> str:
-        """Extrae tipo de documento"""
-        patrones = [
-            r"Tipo Documento\s*[:\s]*([A-Za-z\.\s]+?)(?=\s*Número|\s*$)",
-            r"(Cédula de Ciudadanía)",
-            r"(C\.C\.)",
-            r"(Tarjeta de Identidad)",
-            r"(Pasaporte)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_numero_documento(self, texto: str) -> str:
-        """Extrae número de documento"""
-        patrones = [
-            r"Número Documento\s*[:\s]*([0-9\.]+)",
-            r"C\.C\.\s*([0-9\.]+)",
-            r"No\.\s*([0-9\.]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_estado_documento(self, texto: str) -> str:
-        """Extrae estado del documento"""
-        patrones = [
-            r"Estado Documento\s*[:\s]*([A-Za-zÁÉÍÓÚÑ]+)",
-            r"(Vigente)",
-            r"(Vencido)",
-            r"(Suspendido)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_lugar_expedicion(self, texto: str) -> str:
-        """Extrae lugar de expedición"""
-        patrones = [
-            r"Lugar Expedición\s*[:\s]*([A-ZÁÉÍÓÚÑa-z\s]+?)(?=\s*Fecha Expedici|$)",
-            r"Expedido en\s*[:\s]*([A-ZÁÉÍÓÚÑa-z\s]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_fecha_expedicion(self, texto: str) -> str:
-        """Extrae fecha de expedición"""
-        patrones = [
-            r"Fecha Expedición\s*[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})",
-            r"Expedido el\s*[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_nombre_completo(self, texto: str) -> str:
-        """Extrae nombre completo"""
-        patrones = [
-            r"Nombre\s*[:\s]*([A-ZÁÉÍÓÚÑ\s]+)(?=\s*Rango Edad|$)",
-            r"Nombres y Apellidos\s*[:\s]*([A-ZÁÉÍÓÚÑ\s]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    # Continuaré implementando todos los métodos de extracción...
-    # Por ahora implemento los métodos básicos para que funcione el sistema
-    
-    def extraer_primer_nombre(self, texto: str) -> str:
-        nombre_completo = self.extraer_nombre_completo(texto)
-        if nombre_completo:
-            partes = nombre_completo.strip().split()
-            return partes[0] if len(partes) > 0 else ""
-        return ""
-    
-    def extraer_segundo_nombre(self, texto: str) -> str:
-        nombre_completo = self.extraer_nombre_completo(texto)
-        if nombre_completo:
-            partes = nombre_completo.strip().split()
-            return partes[1] if len(partes) > 1 else ""
-        return ""
-    
-    def extraer_primer_apellido(self, texto: str) -> str:
-        nombre_completo = self.extraer_nombre_completo(texto)
-        if nombre_completo:
-            partes = nombre_completo.strip().split()
-            return partes[-2] if len(partes) > 2 else ""
-        return ""
-    
-    def extraer_segundo_apellido(self, texto: str) -> str:
-        nombre_completo = self.extraer_nombre_completo(texto)
-        if nombre_completo:
-            partes = nombre_completo.strip().split()
-            return partes[-1] if len(partes) > 1 else ""
-        return ""
-    
-    def extraer_rango_edad(self, texto: str) -> str:
-        patrones = [
-            r"Rango Edad\s*[:\s]*([0-9\-]+)",
-            r"(\d{2}-\d{2})",
-            r"Edad\s*[:\s]*([0-9\-]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_edad_exacta(self, texto: str) -> str:
-        patrones = [
-            r"Edad\s*[:\s]*([0-9]+)\s*años",
-            r"([0-9]+)\s*años"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_genero(self, texto: str) -> str:
-        patrones = [
-            r"Género\s*[:\s]*([A-Za-zÁÉÍÓÚÑ]+)",
-            r"(Femenino)",
-            r"(Masculino)",
-            r"Sexo\s*[:\s]*([A-Za-zÁÉÍÓÚÑ]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_antiguedad_direccion(self, texto: str) -> str:
-        patrones = [
-            r"Antiguedad Ubicación\s*[:\s]*([0-9]+\s*Meses\s*[A-Za-z\s]+?)(?=\s*ARTICULO|\s*-|$)",
-            r"(\d+\s*Meses\s*[A-Za-z\s]+?)(?=\s*ARTICULO|\s*-|$)",
-            r"Antigüedad\s*[:\s]*([0-9]+\s*[A-Za-z\s]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    # Métodos auxiliares para extracciones complejas
-    def extraer_informacion_no_estructurada(self, texto: str, seccion: int) -> str:
-        """Extrae información no estructurada por secciones"""
-        # Dividir el texto en secciones y extraer información adicional
-        lineas = texto.split('\n')
+    def bloques_significativos(self, contexto: ContextoExtraccion) -> List[str]:
+        """Bloques de líneas largas consecutivas del texto"""
         secciones = []
         seccion_actual = []
         
-        for linea in lineas:
+        for linea in contexto.lineas(contexto.texto):
             if len(linea.strip()) > 50:  # Líneas con contenido significativo
                 seccion_actual.append(linea.strip())
             elif seccion_actual:
@@ -427,42 +98,14 @@ class ExtractorCompleto(BaseExtractor):
         if seccion_actual:
             secciones.append(' '.join(seccion_actual))
         
-        return secciones[seccion] if len(secciones) > seccion else ""
+        return secciones
     
-    def extraer_secciones_especiales(self, texto: str) -> str:
-        """Extrae secciones especiales del reporte"""
-        patrones = [
-            r"INFORMACIÓN ADICIONAL\s*[:\s]*([^$]+?)(?=\n\n|\Z)",
-            r"OBSERVACIONES\s*[:\s]*([^$]+?)(?=\n\n|\Z)",
-            r"NOTAS\s*[:\s]*([^$]+?)(?=\n\n|\Z)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_datos_complementarios(self, texto: str) -> str:
+    def extraer_datos_complementarios(self, contexto: ContextoExtraccion) -> str:
         """Extrae datos complementarios"""
         # Extraer bloques de texto que contengan información no capturada
         lineas_importantes = []
-        for linea in texto.split('\n'):
+        for linea in contexto.lineas(contexto.texto):
             if ':' in linea and len(linea.strip()) > 10:
                 lineas_importantes.append(linea.strip())
         
-        return ' | '.join(lineas_importantes[:10])  # Primeras 10 líneas importantes
-    
-    # Implementar métodos que retornen cadenas vacías por ahora
-    # (Para que el sistema funcione inmediatamente)
-    def extraer_estado_civil(self, texto: str) -> str:
-        patrones = [r"Estado Civil\s*[:\s]*([A-Za-zÁÉÍÓÚÑ]+)"]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_nacionalidad(self, texto: str) -> str:
-        patrones = [r"Nacionalidad\s*[:\s]*([A-Za-zÁÉÍÓÚÑ]+)"]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    # Continúo con implementaciones básicas para que funcione...
-    # [Los demás métodos retornarán cadenas vacías por ahora]
-    
-    def __getattr__(self, name):
-        """Método para manejar llamadas a métodos no implementados aún"""
-        if name.startswith('extraer_'):
-            return lambda texto: ""
-        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
\ No newline at end of file
+        return ' | '.join(lineas_importantes[:10])  # Primeras 10 líneas importantes
\ No newline at end of file
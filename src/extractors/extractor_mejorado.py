@@ -6,6 +6,10 @@ Diseñado para capturar información incluso con variaciones de formato
 import re
 from typing import Dict, Any
 
+from utils.patrones import REGISTRO
+from .contexto_extraccion import ContextoExtraccion
+from .motor_campos import PLAN_CAMPOS
+
 class ExtractorMejorado:
     """Extractor con patrones más flexibles y robustos"""
     
@@ -25,8 +29,8 @@ class ExtractorMejorado:
         # 1. Información de consulta
         registro.update(self.extraer_info_consulta(texto_limpio))
         
-        # 2. Información personal
-        registro.update(self.extraer_info_personal(texto_limpio))
+        # 2. Información personal (secciones y etiquetas necesitan los saltos de línea originales)
+        registro.update(self.extraer_info_personal(texto))
         
         # 3. Información demográfica
         registro.update(self.extraer_info_demografica(texto_limpio))
@@ -62,7 +66,7 @@ class ExtractorMejorado:
         return texto
     
     def extraer_info_consulta(self, texto: str) -> Dict[str, str]:
-        """Extrae información de la consulta"""
+        """Extrae quién hizo la consulta (la fecha y la hora vienen con la información personal)"""
         info = {}
         
         # Consultado por - MÚLTIPLES PATRONES
@@ -74,80 +78,11 @@ class ExtractorMejorado:
         ]
         info['consultado_por'] = self.buscar_multiples_patrones(patrones_consultado, texto)
         
-        # Fecha y hora - MÚLTIPLES FORMATOS
-        patrones_fecha = [
-            r"Fecha[^:]*:[\\s]*([0-9]{1,2}[/\\-][0-9]{1,2}[/\\-][0-9]{4})",
-            r"([0-9]{1,2}[/\\-][0-9]{1,2}[/\\-][0-9]{4})[\\s]+([0-9]{1,2}:[0-9]{2})",
-            r"\\b([0-9]{1,2}/[0-9]{1,2}/[0-9]{4})\\b"
-        ]
-        fecha = self.buscar_multiples_patrones(patrones_fecha, texto)
-        if fecha:
-            info['fecha_consulta'] = fecha
-        
-        # Hora
-        patrones_hora = [
-            r"([0-9]{1,2}:[0-9]{2}:[0-9]{2})",
-            r"([0-9]{1,2}:[0-9]{2})\\s*(?:AM|PM|am|pm)?",
-            r"Hora[^:]*:[\\s]*([0-9]{1,2}:[0-9]{2})"
-        ]
-        info['hora_consulta'] = self.buscar_multiples_patrones(patrones_hora, texto)
-        
         return info
     
     def extraer_info_personal(self, texto: str) -> Dict[str, str]:
-        """Extrae información personal"""
-        info = {}
-        
-        # Tipo de documento
-        patrones_tipo_doc = [
-            r"Tipo[^:]*Documento[^:]*:[\\s]*([^\\n]{3,30})",
-            r"(Cédula[^\\n]*)",
-            r"(C\\.C\\.)",
-            r"(Tarjeta[^\\n]*Identidad)"
-        ]
-        info['tipo_documento'] = self.buscar_multiples_patrones(patrones_tipo_doc, texto)
-        
-        # Número de documento
-        patrones_numero = [
-            r"Número[^:]*:[\\s]*([0-9\\.\\,]+)",
-            r"C\\.C\\.?[\\s]*:?[\\s]*([0-9\\.\\,]+)",
-            r"Documento[^:]*:[\\s]*([0-9\\.\\,]+)",
-            r"\\b([0-9]{6,12})\\b"  # Números largos que podrían ser documentos
-        ]
-        info['numero_documento'] = self.buscar_multiples_patrones(patrones_numero, texto)
-        
-        # Nombre completo
-        patrones_nombre = [
-            r"Nombre[^:]*:[\\s]*([A-ZÁÉÍÓÚÑ][^\\n]{5,50})",
-            r"Nombres[^:]*:[\\s]*([A-ZÁÉÍÓÚÑ][^\\n]{5,50})",
-            r"Apellidos[^:]*:[\\s]*([A-ZÁÉÍÓÚÑ][^\\n]{5,50})"
-        ]
-        info['nombre_completo'] = self.buscar_multiples_patrones(patrones_nombre, texto)
-        
-        # Estado documento
-        patrones_estado = [
-            r"Estado[^:]*:[\\s]*([A-Za-záéíóúñ]+)",
-            r"(Vigente|Vencido|Activo|Inactivo)"
-        ]
-        info['estado_documento'] = self.buscar_multiples_patrones(patrones_estado, texto)
-        
-        # Género
-        patrones_genero = [
-            r"Género[^:]*:[\\s]*([A-Za-záéíóúñ]+)",
-            r"Sexo[^:]*:[\\s]*([A-Za-záéíóúñ]+)",
-            r"\\b(Masculino|Femenino|Hombre|Mujer)\\b"
-        ]
-        info['genero'] = self.buscar_multiples_patrones(patrones_genero, texto)
-        
-        # Edad
-        patrones_edad = [
-            r"Edad[^:]*:[\\s]*([0-9\\-]+)",
-            r"Rango[^:]*:[\\s]*([0-9\\-]+)",
-            r"\\b([0-9]{2}-[0-9]{2})\\b años?"
-        ]
-        info['rango_edad'] = self.buscar_multiples_patrones(patrones_edad, texto)
-        
-        return info
+        """Extrae información personal y fecha y hora de la consulta (campos compartidos de FIELD_SPECS)"""
+        return {campo: valor or "" for campo, valor in PLAN_CAMPOS.extraer_campos(ContextoExtraccion(texto)).items()}
     
     def extraer_info_demografica(self, texto: str) -> Dict[str, str]:
         """Extrae información demográfica"""
@@ -254,7 +189,7 @@ class ExtractorMejorado:
         }
         
         for clave, patron in palabras_clave.items():
-            matches = re.findall(patron, texto, re.IGNORECASE)
+            matches = REGISTRO.encontrar_todos(patron, texto, re.IGNORECASE)
             if matches:
                 info[f"detectado_{clave}"] = matches[0] if isinstance(matches[0], str) else str(matches[0])
         
@@ -264,7 +199,7 @@ class ExtractorMejorado:
         """Busca con múltiples patrones y retorna el primer match"""
         for patron in patrones:
             try:
-                matches = re.findall(patron, texto, re.IGNORECASE | re.MULTILINE)
+                matches = REGISTRO.encontrar_todos(patron, texto)
                 if matches:
                     resultado = matches[0]
                     if isinstance(resultado, tuple):
@@ -4,7 +4,25 @@ Extractor de Información Básica del reporte DataCrédito
 """
 import re
 from typing import Dict, Any
+from utils.patrones import REGISTRO
 from .base_extractor import BaseExtractor
+from .contexto_extraccion import ContextoExtraccion
+from .motor_campos import PLAN_CAMPOS
+
+# Columna del registro -> campo extraído (de FIELD_SPECS salvo 'consultado_por')
+COLUMNAS = {
+    "Consultado por": 'consultado_por',
+    "Fecha y Hora Consulta": 'fecha_hora_consulta',
+    "Tipo Documento": 'tipo_documento',
+    "Número Documento": 'numero_documento',
+    "Estado Documento": 'estado_documento',
+    "Lugar Expedición": 'lugar_expedicion',
+    "Fecha Expedición": 'fecha_expedicion',
+    "Nombre": 'nombre_completo',
+    "Rango Edad": 'rango_edad',
+    "Género": 'genero',
+    "Antigüedad Ubicación": 'antiguedad_ubicacion'
+}
 
 class InformacionBasicaExtractor(BaseExtractor):
     """Extrae información básica personal del cliente"""
@@ -23,82 +41,24 @@ class InformacionBasicaExtractor(BaseExtractor):
         Returns:
             Dict con información básica extraída
         """
-        registro = self.crear_registro_vacio([
-            "Consultado por", "Fecha y Hora Consulta", "Tipo Documento",
-            "Número Documento", "Estado Documento", "Lugar Expedición",
-            "Fecha Expedición", "Nombre", "Rango Edad", "Género",
-            "Antigüedad Ubicación"
-        ])
+        registro = self.crear_registro_vacio(list(COLUMNAS))
         
         errores = []
         campos_extraidos = 0
         
         try:
-            # Fecha y hora de consulta
-            fecha_hora = self.extraer_fecha_consulta(texto)
-            if fecha_hora:
-                registro["Fecha y Hora Consulta"] = fecha_hora
-                campos_extraidos += 1
+            # Campos compartidos con la especificación declarativa (FIELD_SPECS)
+            valores = PLAN_CAMPOS.extraer_campos(ContextoExtraccion(texto))
+            valores['fecha_hora_consulta'] = " ".join(
+                valor for valor in (valores['fecha_consulta'], valores['hora_consulta']) if valor)
             
             # Consultado por (solo personas naturales)
-            consultado = self.extraer_consultado_por(texto)
-            if consultado:
-                registro["Consultado por"] = consultado
-                campos_extraidos += 1
-            
-            # Tipo de documento
-            tipo_doc = self.extraer_tipo_documento(texto)
-            if tipo_doc:
-                registro["Tipo Documento"] = tipo_doc
-                campos_extraidos += 1
-            
-            # Número de documento
-            num_doc = self.extraer_numero_documento(texto)
-            if num_doc:
-                registro["Número Documento"] = num_doc
-                campos_extraidos += 1
-            
-            # Estado del documento
-            estado = self.extraer_estado_documento(texto)
-            if estado:
-                registro["Estado Documento"] = estado
-                campos_extraidos += 1
-            
-            # Lugar de expedición
-            lugar = self.extraer_lugar_expedicion(texto)
-            if lugar:
-                registro["Lugar Expedición"] = lugar
-                campos_extraidos += 1
-            
-            # Fecha de expedición
-            fecha_exp = self.extraer_fecha_expedicion(texto)
-            if fecha_exp:
-                registro["Fecha Expedición"] = fecha_exp
-                campos_extraidos += 1
-            
-            # Nombre
-            nombre = self.extraer_nombre(texto)
-            if nombre:
-                registro["Nombre"] = nombre
-                campos_extraidos += 1
+            valores['consultado_por'] = self.extraer_consultado_por(texto)
             
-            # Rango de edad
-            rango = self.extraer_rango_edad(texto)
-            if rango:
-                registro["Rango Edad"] = rango
-                campos_extraidos += 1
-            
-            # Género
-            genero = self.extraer_genero(texto)
-            if genero:
-                registro["Género"] = genero
-                campos_extraidos += 1
-            
-            # Antigüedad ubicación
-            antiguedad = self.extraer_antiguedad_ubicacion(texto)
-            if antiguedad:
-                registro["Antigüedad Ubicación"] = antiguedad
-                campos_extraidos += 1
+            for columna, campo in COLUMNAS.items():
+                if valores[campo]:
+                    registro[columna] = valores[campo]
+                    campos_extraidos += 1
                 
         except Exception as e:
             errores.append(f"Error general en extracción: {str(e)}")
@@ -106,14 +66,6 @@ class InformacionBasicaExtractor(BaseExtractor):
         self.log_extraccion(archivo, campos_extraidos, errores)
         return registro
     
-    def extraer_fecha_consulta(self, texto: str) -> str:
-        """Extrae fecha y hora de consulta"""
-        patrones = [
-            r"Fecha y Hora Consulta\s*:?\s*([0-9]{4}/[0-9]{2}/[0-9]{2} [0-9]{1,2}\.[0-9]{2} (AM|PM))",
-            r"(20[0-9]{2}/[0-9]{2}/[0-9]{2} [0-9]{1,2}\.[0-9]{2} (AM|PM))"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
     def extraer_consultado_por(self, texto: str) -> str:
         """Extrae el nombre de la persona que realizó la consulta (no la empresa)"""
         lineas = texto.splitlines()
@@ -128,7 +80,7 @@ class InformacionBasicaExtractor(BaseExtractor):
                     
                     # Patrón para extraer nombre completo antes del guión y número
                     patron_persona = r'^([A-Za-záéíóúñÁÉÍÓÚÑ\s]+)\s*-\s*\d+'
-                    match = re.search(patron_persona, linea_siguiente)
+                    match = REGISTRO.buscar(patron_persona, linea_siguiente, flags=0)
                     if match:
                         nombre_persona = match.group(1).strip()
                         if self.es_persona_natural(nombre_persona):
@@ -183,77 +135,4 @@ class InformacionBasicaExtractor(BaseExtractor):
                     return False
             return True
         
-        return False
-    
-    def extraer_tipo_documento(self, texto: str) -> str:
-        """Extrae tipo de documento"""
-        patrones = [
-            r"Tipo Documento\s*[:\s]*([A-Z.]+)",
-            r"(C\.C\.)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_numero_documento(self, texto: str) -> str:
-        """Extrae número de documento"""
-        patrones = [
-            r"Número Documento\s*[:\s]*([0-9]+)",
-            r"C\.C\.\s*([0-9]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_estado_documento(self, texto: str) -> str:
-        """Extrae estado del documento"""
-        patrones = [
-            r"Estado Documento\s*[:\s]*([A-Za-zÁÉÍÓÚÑ]+)",
-            r"(Vigente)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_lugar_expedicion(self, texto: str) -> str:
-        """Extrae lugar de expedición"""
-        patrones = [
-            r"Lugar Expedición\s*[:\s]*([A-ZÁÉÍÓÚÑa-z\s]+?)(?=\s*Fecha Expedici|$)",
-            r"(IBAGUE)",
-            r"(BOGOTA)",
-            r"(MEDELLIN)",
-            r"(CALI)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_fecha_expedicion(self, texto: str) -> str:
-        """Extrae fecha de expedición"""
-        patron = r"Fecha Expedición\s*[:\s]*([0-9]{2}/[0-9]{2}/[0-9]{4})"
-        return self.buscar_patron(patron, texto)
-    
-    def extraer_nombre(self, texto: str) -> str:
-        """Extrae nombre para persona natural"""
-        patrones = [
-            r"Nombre\s*[:\s]*([A-ZÁÉÍÓÚÑ\s]+)(?=\s*Rango Edad|$)",
-            r"([A-ZÁÉÍÓÚÑ]+\s+[A-ZÁÉÍÓÚÑ]+)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_rango_edad(self, texto: str) -> str:
-        """Extrae rango de edad"""
-        patrones = [
-            r"Rango Edad\s*[:\s]*([0-9\-]+)",
-            r"(\d{2}-\d{2})"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_genero(self, texto: str) -> str:
-        """Extrae género"""
-        patrones = [
-            r"Género\s*[:\s]*([A-Za-zÁÉÍÓÚÑ]+)",
-            r"(Femenino)",
-            r"(Masculino)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
-    
-    def extraer_antiguedad_ubicacion(self, texto: str) -> str:
-        """Extrae antigüedad de ubicación"""
-        patrones = [
-            r"Antiguedad Ubicación\s*[:\s]*([0-9]+\s*Meses\s*[A-Za-z\s]+?)(?=\s*ARTICULO|\s*-|$)",
-            r"(\d+\s*Meses\s*[A-Za-z\s]+?)(?=\s*ARTICULO|\s*-|$)"
-        ]
-        return self.buscar_multiples_patrones(patrones, texto)
\ No newline at end of file
+        return False
\ No newline at end of file
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de extracción a partir de la especificación declarativa de campos
+
+config.field_mappings.FIELD_SPECS describe cada campo (secciones, etiqueta,
+patrones, tipo y posprocesos). Al importar se compila en un plan: patrones
+compilados una vez en el registro compartido, conversores y posprocesos ya
+resueltos y la lista de secciones de cada campo lista para pedir el corte al
+contexto del documento. Agregar un campo es un cambio de configuración.
+
+ExtractorCompleto ejecuta el plan entero; los demás extractores toman de aquí
+los campos de INFORMACIÓN BÁSICA (CAMPOS_INFORMACION_BASICA) en lugar de
+repetir sus propias cascadas de patrones.
+"""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from config.field_mappings import FIELD_SPECS
+from utils.patrones import REGISTRO
+from utils.tablas_palabras import a_miles
+from .contexto_extraccion import ContextoExtraccion
+
+def _palabra(indice: int, minimo: int) -> Callable[[str], str]:
+    """Posproceso que toma una palabra del valor si tiene al menos `minimo` palabras"""
+    def tomar(valor: str) -> str:
+        partes = valor.split()
+        return partes[indice] if len(partes) >= minimo else ""
+    return tomar
+
+# Conversores por tipo de campo
+CONVERSORES: Dict[str, Callable[[str], Any]] = {
+    'texto': lambda valor: valor,
+    'entero': int,
+    'miles': a_miles
+}
+
+# Posprocesos por nombre (los campos los referencian en 'post')
+POSPROCESOS: Dict[str, Callable[[str], str]] = {
+    'mayusculas': str.upper,
+    'primer_nombre': _palabra(0, 1),
+    'segundo_nombre': _palabra(1, 2),
+    'primer_apellido': _palabra(-2, 3),
+    'segundo_apellido': _palabra(-1, 2)
+}
+
+# Campos de INFORMACIÓN BÁSICA que comparten todos los extractores
+CAMPOS_INFORMACION_BASICA = (
+    'fecha_consulta', 'hora_consulta', 'tipo_documento', 'numero_documento', 'estado_documento',
+    'lugar_expedicion', 'fecha_expedicion', 'nombre_completo', 'rango_edad', 'genero',
+    'antiguedad_ubicacion'
+)
+
+class CampoCompilado:
+    """Un campo de FIELD_SPECS listo para ejecutar"""
+    
+    def __init__(self, nombre: str, spec: Dict[str, Any], secciones: List[str]):
+        """
+        Args:
+            nombre: Nombre del campo en el registro de salida
+            spec: Especificación del campo
+            secciones: Secciones del grupo (si el campo no define las suyas)
+        """
+        self.nombre = nombre
+        self.secciones: Tuple[str, ...] = tuple(spec.get('secciones', secciones))
+        self.etiqueta: Optional[str] = spec.get('etiqueta')
+        self.campo_base: Optional[str] = spec.get('campo_base')
+        self.patrones: List[Pattern] = [REGISTRO.compilar(patron) for patron in spec.get('patrones', [])]
+        self.conversor = CONVERSORES[spec.get('tipo', 'texto')]
+        self.posprocesos = [POSPROCESOS[nombre_post] for nombre_post in spec.get('post', [])]
+    
+    def extraer(self, contexto: ContextoExtraccion, grupo: Dict[str, Any]) -> Any:
+        """
+        Valor del campo en un documento
+        
+        Args:
+            contexto: Contexto del documento
+            grupo: Campos ya extraídos del mismo grupo (para 'campo_base')
+            
+        Returns:
+            Valor convertido, o None si no se encontró
+        """
+        with REGISTRO.campo(self.nombre):
+            valor = self._buscar(contexto, grupo)
+        if not valor:
+            return None
+        
+        for posproceso in self.posprocesos:
+            valor = posproceso(valor)
+        
+        try:
+            return self.conversor(valor) if valor else valor
+        except ValueError:
+            return valor  # Valor fuera de formato: se conserva el texto
+    
+    def _buscar(self, contexto: ContextoExtraccion, grupo: Dict[str, Any]) -> Optional[str]:
+        if self.campo_base is not None:
+            return grupo.get(self.campo_base)
+        
+        if self.etiqueta is not None:
+            valor = contexto.etiquetas.get(self.etiqueta)
+            if valor:
+                return valor
+        
+        if not self.patrones:
+            return None
+        
+        texto = contexto.seccion(*self.secciones) if self.secciones else contexto.texto
+        for patron in self.patrones:
+            match = REGISTRO.buscar(patron, texto)
+            if match:
+                valor = " ".join((match.group(1) if match.groups() else match.group(0)).split())
+                if valor:
+                    return valor
+        return None
+
+class PlanExtraccion:
+    """FIELD_SPECS compilado: grupos de campos en el orden de salida"""
+    
+    def __init__(self, especificaciones: Dict[str, Dict[str, Any]] = FIELD_SPECS):
+        """
+        Args:
+            especificaciones: Grupo -> {'secciones', 'campos'} (por defecto FIELD_SPECS)
+        """
+        self.grupos: Dict[str, List[CampoCompilado]] = {
+            grupo: [
+                CampoCompilado(nombre, spec, definicion.get('secciones', []))
+                for nombre, spec in definicion['campos'].items()
+            ]
+            for grupo, definicion in especificaciones.items()
+        }
+        self._por_nombre: Dict[str, CampoCompilado] = {
+            campo.nombre: campo for campos in self.grupos.values() for campo in campos
+        }
+    
+    @property
+    def campos(self) -> List[str]:
+        """Nombres de todos los campos, en orden de salida"""
+        return [campo.nombre for campos in self.grupos.values() for campo in campos]
+    
+    def extraer_grupo(self, grupo: str, contexto: ContextoExtraccion) -> Dict[str, Any]:
+        """
+        Extrae los campos de un grupo
+        
+        Args:
+            grupo: Nombre del grupo en FIELD_SPECS
+            contexto: Contexto del documento
+            
+        Returns:
+            Dict campo -> valor
+        """
+        valores: Dict[str, Any] = {}
+        for campo in self.grupos[grupo]:
+            valores[campo.nombre] = campo.extraer(contexto, valores)
+        return valores
+    
+    def extraer(self, contexto: ContextoExtraccion) -> Dict[str, Dict[str, Any]]:
+        """
+        Extrae todos los grupos de un documento
+        
+        Returns:
+            Dict grupo -> {campo: valor}
+        """
+        return {grupo: self.extraer_grupo(grupo, contexto) for grupo in self.grupos}
+    
+    def extraer_campos(self, contexto: ContextoExtraccion,
+                       nombres: Iterable[str] = CAMPOS_INFORMACION_BASICA) -> Dict[str, Any]:
+        """
+        Extrae solo algunos campos, de cualquier grupo
+        
+        Args:
+            contexto: Contexto del documento
+            nombres: Campos de la especificación (por defecto los de INFORMACIÓN BÁSICA)
+            
+        Returns:
+            Dict campo -> valor, en el orden pedido
+        """
+        valores: Dict[str, Any] = {}
+        for nombre in nombres:
+            self._extraer_con_base(self._por_nombre[nombre], contexto, valores)
+        return {nombre: valores[nombre] for nombre in nombres}
+    
+    def _extraer_con_base(self, campo: CampoCompilado, contexto: ContextoExtraccion, valores: Dict[str, Any]):
+        """Extrae un campo, y antes el campo del que toma su valor si aún no se extrajo"""
+        if campo.nombre in valores:
+            return
+        if campo.campo_base is not None:
+            self._extraer_con_base(self._por_nombre[campo.campo_base], contexto, valores)
+        valores[campo.nombre] = campo.extraer(contexto, valores)
+
+# Plan de FIELD_SPECS, compilado una sola vez por proceso
+PLAN_CAMPOS = PlanExtraccion()
\ No newline at end of file
@@ -7,6 +7,7 @@ from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from pathlib import Path
 from typing import List, Dict, Any
+from utils.normalizacion import a_celda, normalizar_dataframe
 
 class ExcelProcessor:
     """Procesador para generar archivos Excel formateados"""
@@ -85,25 +86,16 @@ class ExcelProcessor:
             self.aplicar_estilo_encabezado(celda)
         
         # Escribir datos (sin columna de archivo, procesado o error para usuario final)
-        for fila, registro in enumerate(datos, 2):
-            info_basica = registro.get('informacion_basica', {})
-            
-            valores = [
-                info_basica.get('Consultado por', ''),
-                info_basica.get('Fecha y Hora Consulta', ''),
-                info_basica.get('Tipo Documento', ''),
-                info_basica.get('Número Documento', ''),
-                info_basica.get('Estado Documento', ''),
-                info_basica.get('Lugar Expedición', ''),
-                info_basica.get('Fecha Expedición', ''),
-                info_basica.get('Nombre', ''),
-                info_basica.get('Rango Edad', ''),
-                info_basica.get('Género', ''),
-                info_basica.get('Antigüedad Ubicación', '')
-            ]
-            
+        filas = [
+            [registro.get('informacion_basica', {}).get(encabezado, '') for encabezado in encabezados]
+            for registro in datos
+        ]
+        
+        # Fechas y cantidades convertidas por columna
+        tabla = normalizar_dataframe(pd.DataFrame(filas, columns=encabezados))
+        for fila, valores in enumerate(tabla.itertuples(index=False, name=None), 2):
             for col, valor in enumerate(valores, 1):
-                celda = ws.cell(row=fila, column=col, value=valor)
+                celda = ws.cell(row=fila, column=col, value=a_celda(valor))
                 self.aplicar_estilo_celda(celda)
         
         # Ajustar anchos de columna
@@ -3,9 +3,11 @@
 Procesador de Excel COMPLETO - Genera tabla única con TODA la información
 """
 from typing import List, Dict, Any
+import pandas as pd
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
+from utils.normalizacion import a_celda, normalizar_dataframe
 
 class ExcelProcessorCompleto:
     """Procesador que genera Excel con TODA la información en una sola tabla"""
@@ -116,11 +118,14 @@ class ExcelProcessorCompleto:
             celda = ws.cell(row=1, column=col, value=encabezado)
             self.aplicar_estilo_encabezado(celda)
         
-        # Escribir datos
-        for fila, registro in enumerate(datos, 2):
-            for col, campo in enumerate(self.encabezados_completos, 1):
-                valor = self.obtener_valor_campo(registro, campo)
-                celda = ws.cell(row=fila, column=col, value=valor)
+        # Escribir datos (montos, porcentajes y fechas convertidos por columna)
+        tabla = normalizar_dataframe(pd.DataFrame(
+            [[self.obtener_valor_campo(registro, campo) for campo in self.encabezados_completos] for registro in datos],
+            columns=self.encabezados_completos
+        ))
+        for fila, valores in enumerate(tabla.itertuples(index=False, name=None), 2):
+            for col, valor in enumerate(valores, 1):
+                celda = ws.cell(row=fila, column=col, value=a_celda(valor))
                 self.aplicar_estilo_datos(celda)
         
         # Ajustar ancho de columnas
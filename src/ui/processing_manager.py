@@ -6,15 +6,117 @@ import threading
 import queue
 import time
 from pathlib import Path
-from typing import Callable
+from typing import Callable, List, Optional
+
+from utils.patrones import REGISTRO
+from utils.plantilla_documento import limpiar_texto
+from utils.procesamiento_paralelo import PoolExtraccion
+
+class ExtraccionArchivo:
+    """Lectura y extracción de un PDF; serializable para ejecutarse en otro proceso"""
+    
+    def __init__(self, pdf_reader, extractor, secciones: Optional[List[str]] = None):
+        self.pdf_reader = pdf_reader
+        self.extractor = extractor
+        self.secciones = secciones
+    
+    def __call__(self, ruta_pdf: str):
+        """Procesar un archivo PDF individual"""
+        archivo_pdf = Path(ruta_pdf)
+        
+        # Presupuesto de búsqueda por archivo: agotado, se omiten las búsquedas restantes
+        with REGISTRO.presupuesto(documento=archivo_pdf.name) as presupuesto:
+            registro = self._procesar_archivo(archivo_pdf)
+        registro['_metadata'].update(presupuesto.resumen())
+        return registro
+    
+    def _procesar_archivo(self, archivo_pdf: Path):
+        """Leer y extraer un PDF según el tipo de extractor"""
+        # Extractores con soporte incremental leen página por página
+        if hasattr(self.extractor, 'extract_paginas'):
+            return self._procesar_archivo_por_paginas(archivo_pdf)
+        
+        # Leer solo las páginas de las secciones requeridas
+        if self.secciones:
+            return self._procesar_archivo_por_paginas(archivo_pdf, self._extraer_texto_paginas)
+        
+        # Leer PDF (una sola sesión por archivo)
+        with self.pdf_reader.abrir(str(archivo_pdf)) as documento:
+            contenido = documento.texto
+            
+            if not contenido:
+                raise ValueError("No se pudo extraer texto del PDF")
+            
+            # Extraer datos sin pie de página ni encabezados de tabla repetidos
+            info_basica = self.extractor.extract(limpiar_texto(contenido), archivo_pdf.name)
+            numero_paginas = documento.numero_paginas
+        
+        # Crear registro
+        return {
+            'informacion_basica': info_basica,
+            '_metadata': {
+                'archivo': archivo_pdf.name,
+                'ruta': str(archivo_pdf),
+                'tamaño_texto': len(contenido),
+                'numero_paginas': numero_paginas,
+                'procesado': True
+            }
+        }
+    
+    def _procesar_archivo_por_paginas(self, archivo_pdf: Path, extraer: Callable = None):
+        """Procesar un archivo PDF consumiendo sus páginas a medida que se leen"""
+        lectura = {'paginas': 0, 'caracteres': 0}
+        
+        def paginas():
+            for numero, texto in self.pdf_reader.iterar_paginas(str(archivo_pdf), self.secciones):
+                lectura['paginas'] += 1
+                lectura['caracteres'] += len(texto)
+                yield numero, texto
+        
+        extraer = extraer or self.extractor.extract_paginas
+        info_basica = extraer(paginas(), archivo_pdf.name)
+        
+        if not lectura['caracteres']:
+            raise ValueError("No se pudo extraer texto del PDF")
+        
+        return {
+            'informacion_basica': info_basica,
+            '_metadata': {
+                'archivo': archivo_pdf.name,
+                'ruta': str(archivo_pdf),
+                'tamaño_texto': lectura['caracteres'],
+                'paginas_leidas': lectura['paginas'],
+                'procesado': True
+            }
+        }
+    
+    def _extraer_texto_paginas(self, paginas, archivo: str):
+        """Extraer con extractores sin soporte incremental uniendo las páginas leídas"""
+        texto = "\n".join(texto for _, texto in paginas if texto).strip()
+        return self.extractor.extract(texto, archivo)
 
 class ProcessingManager:
     """Maneja el procesamiento de archivos PDF en background"""
     
-    def __init__(self, pdf_reader, excel_processor, extractor):
+    def __init__(self, pdf_reader, excel_processor, extractor,
+                 secciones: Optional[List[str]] = None,
+                 trabajadores: Optional[int] = 1, ordenado: bool = True):
+        """
+        Args:
+            secciones: Secciones requeridas (nombres de SECCIONES); si se
+                indican, cada PDF se lee solo hasta que todas terminan
+            trabajadores: Procesos para leer y extraer en paralelo
+                (1 = en el hilo de procesamiento; None = según núcleos y RAM disponible)
+            ordenado: True conserva el orden de los archivos en el Excel;
+                False los agrega a medida que terminan
+        """
         self.pdf_reader = pdf_reader
         self.excel_processor = excel_processor
         self.extractor = extractor
+        self.secciones = secciones
+        self.trabajadores = trabajadores
+        self.ordenado = ordenado
+        self.tarea = ExtraccionArchivo(pdf_reader, extractor, secciones)
         self.queue = queue.Queue()
         self.procesando = False
         
@@ -53,29 +155,37 @@ class ProcessingManager:
                 
             self.queue.put(('log', f"📄 Procesando {total_archivos} archivos PDF"))
             
-            # Procesar cada archivo
+            # Procesar cada archivo (en paralelo si hay más de un trabajador)
             datos_procesados = []
             exitosos = 0
+            pool = PoolExtraccion(self.tarea, self.trabajadores)
             
-            for i, archivo_pdf in enumerate(archivos_pdf):
-                try:
-                    # Actualizar progreso
-                    progreso = (i / total_archivos) * 95
-                    self.queue.put(('progreso', progreso))
-                    self.queue.put(('status', f"📄 Procesando: {archivo_pdf.name}"))
-                    self.queue.put(('log', f"🔄 ({i+1}/{total_archivos}) {archivo_pdf.name}"))
-                    
-                    # Procesar archivo
-                    registro = self._procesar_archivo_individual(archivo_pdf)
-                    datos_procesados.append(registro)
-                    
-                    if registro['_metadata']['procesado']:
-                        exitosos += 1
-                        
-                except Exception as e:
-                    self.queue.put(('log', f"❌ Error en {archivo_pdf.name}: {str(e)}", 'error'))
-                    registro_error = self._crear_registro_error(archivo_pdf, str(e))
-                    datos_procesados.append(registro_error)
+            if pool.trabajadores > 1:
+                self.queue.put(('log', f"⚙️ Procesando con {pool.trabajadores} procesos "
+                                       f"(reciclados cada {pool.tamaño_lote} archivos)"))
+            
+            for i, (_, ruta, registro, error) in enumerate(pool.procesar(archivos_pdf, self.ordenado)):
+                archivo_pdf = Path(ruta)
+                
+                # Actualizar progreso
+                progreso = ((i + 1) / total_archivos) * 95
+                self.queue.put(('progreso', progreso))
+                self.queue.put(('status', f"📄 Procesado: {archivo_pdf.name}"))
+                self.queue.put(('log', f"🔄 ({i+1}/{total_archivos}) {archivo_pdf.name}"))
+                
+                if error is not None:
+                    self.queue.put(('log', f"❌ Error en {archivo_pdf.name}: {error}", 'error'))
+                    registro = self._crear_registro_error(archivo_pdf, error)
+                
+                datos_procesados.append(registro)
+                
+                if registro['_metadata']['procesado']:
+                    exitosos += 1
+            
+            if pool.reciclajes:
+                self.queue.put(('log', f"♻️ Procesos reciclados {pool.reciclajes} veces"))
+            if pool.caidas:
+                self.queue.put(('log', f"⚠️ Procesos caídos {pool.caidas} veces (sus archivos en curso quedan con error)", 'error'))
             
             # Generar Excel
             self._generar_excel_final(datos_procesados, carpeta_excel, exitosos, total_archivos)
@@ -87,25 +197,7 @@ class ProcessingManager:
     
     def _procesar_archivo_individual(self, archivo_pdf: Path):
         """Procesar un archivo PDF individual"""
-        # Leer PDF
-        contenido = self.pdf_reader.extraer_texto(str(archivo_pdf))
-        
-        if not contenido:
-            raise ValueError("No se pudo extraer texto del PDF")
-        
-        # Extraer datos
-        info_basica = self.extractor.extract(contenido, archivo_pdf.name)
-        
-        # Crear registro
-        return {
-            'informacion_basica': info_basica,
-            '_metadata': {
-                'archivo': archivo_pdf.name,
-                'ruta': str(archivo_pdf),
-                'tamaño_texto': len(contenido),
-                'procesado': True
-            }
-        }
+        return self.tarea(str(archivo_pdf))
     
     def _crear_registro_error(self, archivo_pdf: Path, error: str):
         """Crear registro para archivo con error"""
@@ -143,6 +235,12 @@ class ProcessingManager:
         self.queue.put(('log', f'✅ Procesamiento completado'))
         self.queue.put(('log', f'📊 Exitosos: {exitosos} | Errores: {errores}', 'success'))
         self.queue.put(('log', f'💾 Archivo: {archivo_salida.name}', 'success'))
+        
+        # Las estadísticas del caché solo reflejan el proceso actual
+        cache = getattr(self.pdf_reader, 'cache', None)
+        if cache is not None and self.trabajadores == 1:
+            self.queue.put(('log', f"🗄️ Caché de texto: {cache.estadisticas['aciertos']} aciertos, "
+                                   f"{cache.estadisticas['fallos']} fallos"))
         self.queue.put(('completado', str(archivo_salida)))
     
     def _monitorear_progreso(self, callback):
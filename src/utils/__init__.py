@@ -4,7 +4,14 @@ Utils package - Utilidades generales del sistema
 """
 
 from .pdf_reader import PDFReader
+from .documento_pdf import DocumentoPDF
+from .cache_texto import CacheTexto
+from .pdf_backends import obtener_backend, backends_disponibles
 
 __all__ = [
-    'PDFReader'
+    'PDFReader',
+    'DocumentoPDF',
+    'CacheTexto',
+    'obtener_backend',
+    'backends_disponibles'
 ]
\ No newline at end of file
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Anclas literales de los patrones
+
+Muchos patrones solo pueden coincidir si el texto contiene cierto literal
+("Estado Civil", "Nacionalidad", "OBSERVACIONES", ...). Las anclas se obtienen
+del árbol que arma el propio re al analizar el patrón: las secuencias de
+caracteres literales que toda coincidencia tiene que recorrer. Si una sola de
+ellas falta en el texto el patrón no puede coincidir y la búsqueda se omite.
+
+Las anclas se comparan con una copia plegada del texto (casefold), que sirve
+igual para patrones con o sin IGNORECASE: toda coincidencia de re también
+coincide plegada. Las dos excepciones de re ('İ' y 'ı' coinciden con 'i') se
+pliegan a 'i', y las anclas se limitan a caracteres Latin-1 para no depender
+de otras equivalencias de mayúsculas.
+"""
+from typing import Iterator, List, Optional, Pattern, Tuple
+
+try:
+    from re import _parser
+except ImportError:  # Python < 3.11
+    import sre_parse as _parser
+
+# Anclas más cortas casi siempre están en el texto y no descartan nada
+MIN_LONGITUD_ANCLA = 3
+
+# Anclas por alternativa del patrón (basta que una alternativa tenga todas las suyas)
+Anclas = Tuple[Tuple[str, ...], ...]
+
+_CORTE = None  # Punto donde termina una secuencia de literales
+
+# Nodos que solo agrupan: sus literales siguen la secuencia de afuera
+_GRUPOS = {_parser.SUBPATTERN, getattr(_parser, 'ATOMIC_GROUP', None)} - {None}
+
+# Repeticiones: con mínimo 1 su contenido es obligatorio
+_REPETICIONES = {_parser.MAX_REPEAT, _parser.MIN_REPEAT, getattr(_parser, 'POSSESSIVE_REPEAT', None)} - {None}
+
+def _recorrer(items) -> Iterator[Optional[str]]:
+    """Caracteres literales obligatorios de una secuencia, con _CORTE donde se interrumpen"""
+    for operacion, argumento in items:
+        if operacion == _parser.LITERAL and argumento < 256:
+            yield chr(argumento)
+        elif operacion == _parser.AT:
+            continue  # ^, $ y \b no consumen caracteres
+        elif operacion in _GRUPOS:
+            yield from _recorrer(argumento[-1])
+        elif operacion in _REPETICIONES and argumento[0] >= 1:
+            yield _CORTE
+            yield from _recorrer(argumento[2])
+            yield _CORTE
+        else:
+            yield _CORTE
+
+def _secuencias(items) -> Tuple[str, ...]:
+    """Secuencias literales obligatorias (plegadas) de una alternativa"""
+    secuencias: List[str] = []
+    actual: List[str] = []
+    for caracter in list(_recorrer(items)) + [_CORTE]:
+        if caracter is not _CORTE:
+            actual.append(caracter)
+            continue
+        secuencia = "".join(actual).casefold()
+        if len(secuencia) >= MIN_LONGITUD_ANCLA and secuencia not in secuencias:
+            secuencias.append(secuencia)
+        actual = []
+    return tuple(secuencias)
+
+def anclas_literales(compilado: Pattern) -> Optional[Anclas]:
+    """
+    Literales que el texto tiene que contener para que el patrón coincida
+    
+    Args:
+        compilado: Patrón compilado
+        
+    Returns:
+        Una tupla de anclas por alternativa del patrón, o None si alguna
+        alternativa no tiene anclas (el patrón nunca se puede descartar)
+    """
+    try:
+        arbol = list(_parser.parse(compilado.pattern, compilado.flags))
+    except Exception:
+        return None
+    
+    alternativas = [arbol]
+    if len(arbol) == 1 and arbol[0][0] == _parser.BRANCH:
+        alternativas = arbol[0][1][1]
+    
+    anclas = tuple(_secuencias(alternativa) for alternativa in alternativas)
+    if not all(anclas):
+        return None
+    return anclas
+
+def plegar(texto: str) -> str:
+    """Copia del texto con la que se comparan las anclas"""
+    if 'İ' in texto or 'ı' in texto:
+        texto = texto.replace('İ', 'i').replace('ı', 'i')
+    return texto.casefold()
+
+def presentes(anclas: Anclas, plegado: str) -> bool:
+    """True si alguna alternativa tiene todas sus anclas en el texto plegado"""
+    return any(all(ancla in plegado for ancla in alternativa) for alternativa in anclas)
\ No newline at end of file
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Caché persistente de la capa de texto de los PDFs
+
+La capa de texto de un reporte nunca cambia, así que volver a procesar una
+carpeta (p.ej. después de corregir un extractor) no debería analizar de nuevo
+cada PDF. Las entradas se identifican por el hash SHA-256 del contenido y el
+motor usado; el tamaño y la fecha de modificación del archivo sirven de
+verificación rápida para no recalcular el hash en cada lectura. El contenido
+en memoria (bytes, mmap, archivos abiertos) se identifica por su hash directo.
+
+Estructura del directorio:
+    textos/<sha256>.<tipo>.json.gz  -> lista de páginas comprimida
+    rutas/<sha1 de la ruta>.json    -> tamaño, mtime y sha256 del archivo
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .pdf_backends import FuentePDF, es_ruta, nombre_fuente
+
+# Directorio por defecto: <raíz del proyecto>/cache_texto
+DIRECTORIO_CACHE = Path(__file__).resolve().parents[2] / "cache_texto"
+
+# Tamaño máximo del caché antes de desalojar las entradas menos usadas
+LIMITE_MB = 500
+
+class CacheTexto:
+    """Caché en disco, direccionado por contenido, con desalojo LRU"""
+    
+    def __init__(self, directorio: Optional[str] = None, limite_mb: float = LIMITE_MB):
+        """
+        Args:
+            directorio: Carpeta del caché (por defecto DIRECTORIO_CACHE)
+            limite_mb: Tamaño máximo en MB de las entradas guardadas
+        """
+        self.directorio = Path(directorio) if directorio else DIRECTORIO_CACHE
+        self.limite_bytes = int(limite_mb * 1024 * 1024)
+        self.dir_textos = self.directorio / "textos"
+        self.dir_rutas = self.directorio / "rutas"
+        self.dir_textos.mkdir(parents=True, exist_ok=True)
+        self.dir_rutas.mkdir(parents=True, exist_ok=True)
+        self._tamaño_total: Optional[int] = None
+        self.estadisticas = {'aciertos': 0, 'fallos': 0}
+    
+    def hash_archivo(self, ruta_pdf: str) -> str:
+        """
+        SHA-256 del contenido, reutilizado si el tamaño y mtime no cambiaron
+        
+        Args:
+            ruta_pdf: Ruta al archivo PDF
+            
+        Returns:
+            Hash hexadecimal del contenido
+        """
+        ruta = Path(ruta_pdf).resolve()
+        estado = ruta.stat()
+        registro = self.dir_rutas / f"{hashlib.sha1(str(ruta).encode()).hexdigest()}.json"
+        
+        try:
+            datos = json.loads(registro.read_text(encoding='utf-8'))
+            if datos['tamaño'] == estado.st_size and datos['mtime_ns'] == estado.st_mtime_ns:
+                return datos['sha256']
+        except (OSError, ValueError, KeyError):
+            pass
+        
+        sha = hashlib.sha256()
+        with open(ruta, 'rb') as archivo:
+            for bloque in iter(lambda: archivo.read(1024 * 1024), b''):
+                sha.update(bloque)
+        
+        self._escribir(registro, json.dumps({
+            'ruta': str(ruta),
+            'tamaño': estado.st_size,
+            'mtime_ns': estado.st_mtime_ns,
+            'sha256': sha.hexdigest()
+        }).encode('utf-8'))
+        return sha.hexdigest()
+    
+    def hash_fuente(self, fuente: FuentePDF) -> str:
+        """
+        SHA-256 de una ruta o de contenido en memoria
+        
+        Args:
+            fuente: Ruta al PDF o contenido en memoria
+            
+        Returns:
+            Hash hexadecimal del contenido
+        """
+        if es_ruta(fuente):
+            return self.hash_archivo(fuente)
+        
+        if not hasattr(fuente, 'read'):  # bytes, bytearray, memoryview, mmap
+            return hashlib.sha256(fuente).hexdigest()
+        
+        sha = hashlib.sha256()
+        posicion = fuente.tell()
+        for bloque in iter(lambda: fuente.read(1024 * 1024), b''):
+            sha.update(bloque)
+        fuente.seek(posicion)
+        return sha.hexdigest()
+    
+    def obtener(self, fuente: FuentePDF, tipo: str) -> Optional[List[Any]]:
+        """
+        Busca el contenido guardado de un PDF
+        
+        Args:
+            fuente: Ruta al PDF o contenido en memoria
+            tipo: Tipo de entrada, p.ej. el nombre del motor ('pymupdf')
+            
+        Returns:
+            Lista por página o None si no está en caché
+        """
+        try:
+            entrada = self._ruta_entrada(self.hash_fuente(fuente), tipo)
+            with gzip.open(entrada, 'rt', encoding='utf-8') as archivo:
+                contenido = json.load(archivo)
+            os.utime(entrada)  # Marca de uso para el desalojo LRU
+        except (OSError, ValueError):
+            self.estadisticas['fallos'] += 1
+            return None
+        
+        self.estadisticas['aciertos'] += 1
+        return contenido
+    
+    def guardar(self, fuente: FuentePDF, tipo: str, contenido: List[Any]):
+        """
+        Guarda el contenido por página de un PDF
+        
+        Args:
+            fuente: Ruta al PDF o contenido en memoria
+            tipo: Tipo de entrada, p.ej. el nombre del motor ('pymupdf')
+            contenido: Lista por página (serializable a JSON)
+        """
+        try:
+            entrada = self._ruta_entrada(self.hash_fuente(fuente), tipo)
+            datos = gzip.compress(json.dumps(contenido, ensure_ascii=False).encode('utf-8'))
+            self._escribir(entrada, datos)
+        except OSError as e:
+            print(f"⚠️  No se pudo guardar en caché {nombre_fuente(fuente)}: {e}")
+            return
+        
+        if self._tamaño_total is None:
+            self._tamaño_total = self.tamaño()
+        else:
+            self._tamaño_total += len(datos)
+        
+        if self._tamaño_total > self.limite_bytes:
+            self._desalojar()
+    
+    def tamaño(self) -> int:
+        """Bytes ocupados por las entradas del caché"""
+        return sum(entrada.stat().st_size for entrada in self.dir_textos.glob("*.json.gz"))
+    
+    def limpiar(self):
+        """Elimina todas las entradas del caché"""
+        for carpeta in (self.dir_textos, self.dir_rutas):
+            for entrada in carpeta.iterdir():
+                entrada.unlink(missing_ok=True)
+        self._tamaño_total = 0
+    
+    def info(self) -> Dict[str, Any]:
+        """Resumen del estado del caché"""
+        return {
+            'directorio': str(self.directorio),
+            'entradas': len(list(self.dir_textos.glob("*.json.gz"))),
+            'tamaño_mb': round(self.tamaño() / (1024 * 1024), 2),
+            'limite_mb': round(self.limite_bytes / (1024 * 1024), 2),
+            **self.estadisticas
+        }
+    
+    def _ruta_entrada(self, sha256: str, tipo: str) -> Path:
+        return self.dir_textos / f"{sha256}.{tipo}.json.gz"
+    
+    def _desalojar(self):
+        """Elimina las entradas menos usadas hasta quedar bajo el 90% del límite"""
+        entradas = []
+        for entrada in self.dir_textos.glob("*.json.gz"):
+            try:
+                estado = entrada.stat()
+                entradas.append((estado.st_mtime, estado.st_size, entrada))
+            except OSError:
+                continue  # Eliminada por otro proceso
+        
+        total = sum(tamaño for _, tamaño, _ in entradas)
+        objetivo = self.limite_bytes * 0.9
+        
+        for _, tamaño, entrada in sorted(entradas, key=lambda e: e[0]):
+            if total <= objetivo:
+                break
+            entrada.unlink(missing_ok=True)
+            total -= tamaño
+        
+        self._tamaño_total = total
+    
+    def _escribir(self, destino: Path, datos: bytes):
+        """Escritura atómica (segura con varios procesos escribiendo a la vez)"""
+        descriptor, temporal = tempfile.mkstemp(dir=destino.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, 'wb') as archivo:
+                archivo.write(datos)
+            os.replace(temporal, destino)
+        except OSError:
+            Path(temporal).unlink(missing_ok=True)
+            raise
\ No newline at end of file
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Sesión de documento PDF: el archivo se abre y se analiza una sola vez
+Sirve texto, texto por página, tablas y metadatos a todo el pipeline
+Con caché, un PDF ya analizado no se vuelve a abrir para leer su texto
+"""
+import io
+import mmap
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .cache_texto import CacheTexto
+from .habito_pago import LectorHabitoPago, leer_palabras
+from .pdf_backends import BackendPDF, FuentePDF, Palabra, PdfPlumberBackend, Tabla, es_ruta, nombre_fuente
+from .procesamiento_paralelo import extraer_textos_en_paralelo
+from .tablas_palabras import DISPOSICIONES, VERSION_DISPOSICIONES, Fila, extraer_tablas, paginas_relevantes
+
+class DocumentoPDF:
+    """Documento PDF abierto con resultados memorizados por página"""
+    
+    def __init__(self, fuente: FuentePDF, backend: BackendPDF, cache: Optional[CacheTexto] = None,
+                 umbral_paralelo: Optional[int] = None, nombre: Optional[str] = None):
+        """
+        Args:
+            fuente: Ruta al archivo PDF o contenido en memoria (bytes,
+                memoryview, mmap u objeto tipo archivo)
+            backend: Motor con el que se abre el documento
+            cache: Caché persistente de texto y tablas (opcional)
+            umbral_paralelo: Páginas a partir de las cuales el texto completo se
+                reparte entre procesos (None = siempre en el proceso actual)
+            nombre: Nombre del documento (por defecto, el de la fuente)
+        """
+        self.fuente = fuente
+        self._nombre = nombre
+        self.backend = backend
+        self.cache = cache
+        self.umbral_paralelo = umbral_paralelo
+        self._documento = None
+        self._textos: Dict[int, str] = {}
+        self._tablas: Dict[int, List[Tabla]] = {}
+        self._respaldo_tablas = None  # pdfplumber, solo si el motor no detecta tablas
+        self._texto_completo: Optional[str] = None
+        self._tablas_palabras: Optional[Dict[str, List[Fila]]] = None
+        
+        textos = cache.obtener(fuente, backend.nombre) if cache else None
+        self.desde_cache = textos is not None
+        
+        if self.desde_cache:
+            self._textos = dict(enumerate(textos))
+            self._numero_paginas = len(textos)
+        else:
+            self._numero_paginas = backend.numero_paginas(self._nativo())
+    
+    @property
+    def numero_paginas(self) -> int:
+        """Cantidad de páginas del documento"""
+        return self._numero_paginas
+    
+    @property
+    def nombre(self) -> str:
+        """Nombre del archivo"""
+        return self._nombre or nombre_fuente(self.fuente)
+    
+    def texto_pagina(self, numero_pagina: int) -> str:
+        """
+        Texto de una página (base 0), analizada una sola vez
+        
+        Args:
+            numero_pagina: Número de página (base 0)
+            
+        Returns:
+            Texto de la página
+        """
+        if not 0 <= numero_pagina < self._numero_paginas:
+            raise IndexError(f"La página {numero_pagina} no existe")
+        
+        if numero_pagina not in self._textos:
+            self._textos[numero_pagina] = self.backend.texto_pagina(self._nativo(), numero_pagina)
+            # El texto queda memorizado: los objetos de la página ya no hacen falta
+            self.backend.liberar_pagina(self._documento, numero_pagina)
+            if len(self._textos) == self._numero_paginas:
+                self._guardar_en_cache(self.backend.nombre, [self._textos[n] for n in range(self._numero_paginas)])
+        return self._textos[numero_pagina]
+    
+    def paginas(self, memorizar: bool = True) -> Iterator[Tuple[int, str]]:
+        """
+        Recorre las páginas como pares (número base 0, texto)
+        
+        Args:
+            memorizar: Si es False, el texto de cada página no queda guardado en
+                la sesión (en ambos casos la página se libera al leerla)
+        """
+        if memorizar:
+            self._precargar_en_paralelo()
+        
+        # Sin memorizar, la lista solo existe para guardar el documento completo en caché
+        leidas = [] if self.cache is not None and not memorizar else None
+        
+        for numero in range(self._numero_paginas):
+            if memorizar or numero in self._textos:
+                texto = self.texto_pagina(numero)
+            else:
+                texto = self.backend.texto_pagina(self._nativo(), numero)
+                self.backend.liberar_pagina(self._documento, numero)
+            
+            if leidas is not None:
+                leidas.append(texto)
+            yield numero, texto
+        
+        if leidas is not None and not self.desde_cache:
+            self._guardar_en_cache(self.backend.nombre, leidas)
+    
+    @property
+    def texto(self) -> str:
+        """Texto completo del documento (páginas no vacías separadas por salto de línea)"""
+        if self._texto_completo is None:
+            self._precargar_en_paralelo()
+            self._texto_completo = "\n".join(texto for _, texto in self.paginas() if texto).strip()
+        return self._texto_completo
+    
+    def tablas(self, numero_pagina: int) -> List[Tabla]:
+        """
+        Tablas de una página (base 0), detectadas una sola vez
+        
+        Args:
+            numero_pagina: Número de página (base 0)
+            
+        Returns:
+            Lista de tablas de la página
+        """
+        if numero_pagina not in self._tablas:
+            tablas = self.backend.tablas_pagina(self._nativo(), numero_pagina)
+            if tablas is None:
+                respaldo = self._abrir_respaldo_tablas()
+                tablas = respaldo.pages[numero_pagina].extract_tables()
+                respaldo.pages[numero_pagina].close()
+            # Las tablas quedan memorizadas: los objetos de la página ya no hacen falta
+            self.backend.liberar_pagina(self._documento, numero_pagina)
+            self._tablas[numero_pagina] = tablas or []
+        return self._tablas[numero_pagina]
+    
+    def todas_las_tablas(self) -> Iterator[Tuple[int, List[Tabla]]]:
+        """Recorre las tablas de todas las páginas como pares (número base 0, tablas)"""
+        tipo = f"{self.backend.nombre}.tablas"
+        guardadas = None
+        
+        if self.cache is not None and len(self._tablas) < self._numero_paginas:
+            guardadas = self.cache.obtener(self.fuente, tipo)
+            if guardadas is not None:
+                self._tablas.update(enumerate(guardadas))
+        
+        for numero in range(self._numero_paginas):
+            yield numero, self.tablas(numero)
+        
+        if guardadas is None:
+            self._guardar_en_cache(tipo, [self._tablas[n] for n in range(self._numero_paginas)])
+    
+    def palabras(self, numero_pagina: int) -> List[Palabra]:
+        """
+        Palabras de una página (base 0) con sus coordenadas (x0, top, x1, bottom, texto)
+        
+        Args:
+            numero_pagina: Número de página (base 0)
+            
+        Returns:
+            Lista de palabras de la página
+        """
+        if not 0 <= numero_pagina < self._numero_paginas:
+            raise IndexError(f"La página {numero_pagina} no existe")
+        palabras = self.backend.palabras_pagina(self._nativo(), numero_pagina)
+        self.backend.liberar_pagina(self._documento, numero_pagina)
+        return palabras
+    
+    def tablas_palabras(self) -> Dict[str, List[Fila]]:
+        """
+        Tablas conocidas del reporte (Endeudamiento Actual, Endeudamiento Global
+        por trimestre y Tendencia de endeudamiento) como filas tipadas, armadas
+        con las coordenadas de las palabras
+        
+        Solo se leen las palabras de las páginas donde están esas secciones.
+        
+        Returns:
+            Dict por clave de sección con la lista de filas
+        """
+        if self._tablas_palabras is None:
+            tipo = f"{self.backend.nombre}.tablas_palabras.v{VERSION_DISPOSICIONES}"
+            guardadas = self.cache.obtener(self.fuente, tipo) if self.cache is not None else None
+            
+            if guardadas is None:
+                textos = (texto for _, texto in self.paginas())
+                paginas = paginas_relevantes(textos, DISPOSICIONES)
+                guardadas = extraer_tablas((numero, self.palabras(numero)) for numero in list(paginas))
+                self._guardar_en_cache(tipo, guardadas)
+            
+            self._tablas_palabras = guardadas
+        return self._tablas_palabras
+    
+    def habito_pago(self) -> LectorHabitoPago:
+        """
+        Obligaciones de HÁBITO DE PAGO leídas con las coordenadas de las palabras,
+        para tomar la entidad y la oficina de sus columnas
+        
+        Returns:
+            Lector con las obligaciones (resultado()) y los renglones descartados
+        """
+        textos = (texto for _, texto in self.paginas())
+        paginas = paginas_relevantes(textos, ['habito_pago'])
+        return leer_palabras((numero, self.palabras(numero)) for numero in list(paginas))
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Metadatos del documento"""
+        return self.backend.metadata(self._nativo())
+    
+    def info(self) -> Dict[str, Any]:
+        """Información básica del documento (equivalente a PDFReader.obtener_info_pdf)"""
+        return {
+            'numero_paginas': self._numero_paginas,
+            'metadata': self.metadata,
+            'archivo': self.nombre,
+            'tamaño': self._tamaño_fuente(),
+            'backend': self.backend.nombre
+        }
+    
+    def _tamaño_fuente(self) -> int:
+        """Tamaño en bytes del PDF, en disco o en memoria"""
+        if es_ruta(self.fuente):
+            return Path(self.fuente).stat().st_size
+        if hasattr(self.fuente, 'seek') and not isinstance(self.fuente, mmap.mmap):
+            posicion = self.fuente.tell()
+            tamaño = self.fuente.seek(0, io.SEEK_END)
+            self.fuente.seek(posicion)
+            return tamaño
+        return memoryview(self.fuente).nbytes
+    
+    def _precargar_en_paralelo(self):
+        """En documentos muy grandes, extrae todas las páginas repartidas entre procesos"""
+        # Los procesos abren el PDF por ruta; el contenido en memoria se lee aquí
+        if (not self.umbral_paralelo or self._numero_paginas <= self.umbral_paralelo
+                or len(self._textos) == self._numero_paginas or not es_ruta(self.fuente)):
+            return
+        
+        textos = extraer_textos_en_paralelo(str(self.fuente), self.backend, self._numero_paginas)
+        if textos is not None:
+            self._textos = dict(enumerate(textos))
+            self._guardar_en_cache(self.backend.nombre, textos)
+    
+    def _nativo(self) -> Any:
+        """Documento nativo del motor, abierto solo cuando hace falta"""
+        if self._documento is None:
+            self._documento = self.backend.abrir(self.fuente)
+        return self._documento
+    
+    def _guardar_en_cache(self, tipo: str, contenido: List[Any]):
+        """Guarda el contenido por página en el caché, si hay uno configurado"""
+        if self.cache is not None:
+            self.cache.guardar(self.fuente, tipo, contenido)
+    
+    def _abrir_respaldo_tablas(self) -> Any:
+        """Abre pdfplumber solo para motores sin detección de tablas (pdfium)"""
+        if self._respaldo_tablas is None:
+            self._respaldo_tablas = PdfPlumberBackend().abrir(self.fuente)
+        return self._respaldo_tablas
+    
+    def cerrar(self):
+        """Libera los recursos del documento"""
+        if self._documento is not None:
+            self.backend.cerrar(self._documento)
+            self._documento = None
+        if self._respaldo_tablas is not None:
+            self._respaldo_tablas.close()
+            self._respaldo_tablas = None
+    
+    def __enter__(self) -> 'DocumentoPDF':
+        return self
+    
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
\ No newline at end of file
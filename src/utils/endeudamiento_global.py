@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+"""
+ENDEUDAMIENTO GLOBAL CLASIFICADO leído del texto en una sola pasada
+
+La sección repite un bloque por TRIMESTRE (2025/03, 2024/12, ...) con una tabla
+por sector. En el texto cada celda trae su valor ('0', '$0' o '-'), así que un
+renglón de entidad se reconoce con un solo patrón, sin las coordenadas de las
+palabras. Las filas tienen las mismas columnas que las de
+tablas_palabras.DISPOSICIONES['endeudamiento_global'] (con la entidad separada
+en nombre, tipo y código) y se pueden usar indistintamente; solo falta
+'pagina', que el texto no trae.
+"""
+import re
+from typing import Dict, List, Optional
+
+from .secciones import PATRON_ENCABEZADOS
+from .tablas_palabras import (DISPOSICIONES, ENTIDAD_INFORMANTE, PATRON_PIE_PAGINA, PATRON_SECTOR,
+                             PATRON_TRIMESTRE, Fila, a_texto)
+
+SECCION = 'endeudamiento_global'
+
+_MILES = r"\$[\d,]+"
+
+# Renglón de entidad o TOTAL: "FINANDINA - BC 0 A 1 $14,896 1 $14,896 0 $0 0 $0 0 $0
+# OTR PREND 27/12/2019 $74,000 ML S"; TOTAL no trae calificación
+PATRON_FILA = re.compile(
+    rf"^{ENTIDAD_INFORMANTE}(?: (?P<calf>[^\s$]+))? (?P<num>\d+) (?P<saldo_total>{_MILES})"
+    rf" (?P<comercial_nro>\d+) (?P<comercial_miles>{_MILES}) (?P<hipotecario_nro>\d+) (?P<hipotecario_miles>{_MILES})"
+    rf" (?P<consumo_nro>\d+) (?P<consumo_miles>{_MILES}) (?P<microcredito_nro>\d+) (?P<microcredito_miles>{_MILES})"
+    rf" (?P<garantia_tipo>.+?) (?P<garantia_fecha_avaluo>\d{{2}}/\d{{2}}/\d{{4}}|-) (?P<garantia_valor>{_MILES}|-)"
+    rf" (?P<moneda>\S+) (?P<fuente>\S+)$"
+)
+
+# Conversor de cada columna, los mismos de la tabla por coordenadas
+CONVERSORES = {nombre: conversor for nombre, _, conversor in DISPOSICIONES[SECCION].columnas}
+CONVERSORES.update(tipo_entidad=a_texto, codigo_entidad=a_texto)
+
+def extraer_endeudamiento_global(texto: str) -> List[Fila]:
+    """
+    Filas tipadas de ENDEUDAMIENTO GLOBAL CLASIFICADO
+    
+    Args:
+        texto: Texto del reporte (o solo de la sección)
+        
+    Returns:
+        Filas en el orden del reporte, con 'trimestre', 'sector' y 'tipo'
+        ('detalle' por entidad, 'total_sector' para el TOTAL de cada sector)
+    """
+    filas: List[Fila] = []
+    en_seccion = False
+    trimestre: Optional[str] = None
+    sector: Optional[str] = None
+    
+    for linea in texto.split('\n'):
+        linea = linea.strip()
+        encabezado = PATRON_ENCABEZADOS.match(linea)
+        if encabezado:
+            en_seccion = encabezado.lastgroup == SECCION
+            trimestre = sector = None
+            continue
+        
+        if not en_seccion or PATRON_PIE_PAGINA.search(linea):
+            continue
+        
+        match = PATRON_TRIMESTRE.match(linea)
+        if match:
+            trimestre, sector = match.group(1), None
+            continue
+        
+        match = PATRON_SECTOR.match(linea)
+        if match:
+            sector = match.group(1)
+            continue
+        
+        match = PATRON_FILA.match(linea)
+        if match is None:
+            continue  # Encabezados de la tabla
+        
+        fila = {}
+        for nombre, valor in match.groupdict().items():
+            try:
+                fila[nombre] = CONVERSORES[nombre](valor or '')
+            except ValueError:
+                fila[nombre] = valor
+        fila['tipo'] = 'total_sector' if fila['entidad'] == 'TOTAL' else 'detalle'
+        fila['sector'] = sector
+        fila['trimestre'] = trimestre
+        filas.append(fila)
+    
+    return filas
+
+def totales_trimestre(filas: List[Fila]) -> Dict[str, Dict[str, int]]:
+    """
+    Totales de cada trimestre sumando los TOTAL de todos los sectores
+    
+    Args:
+        filas: Filas de extraer_endeudamiento_global() o de la tabla por coordenadas
+        
+    Returns:
+        Dict trimestre -> {'num', 'saldo_total', 'comercial_miles', ...}, en el
+        orden del reporte (del trimestre más reciente al más antiguo)
+    """
+    columnas = [nombre for nombre in CONVERSORES if nombre.endswith(('num', 'nro', 'miles')) or nombre == 'saldo_total']
+    totales: Dict[str, Dict[str, int]] = {}
+    for fila in filas:
+        if fila['tipo'] != 'total_sector':
+            continue
+        total = totales.setdefault(fila['trimestre'], dict.fromkeys(columnas, 0))
+        for columna in columnas:
+            total[columna] += fila[columna] or 0
+    return totales
\ No newline at end of file
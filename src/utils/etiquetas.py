@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Escáner de etiquetas en una sola pasada
+
+Los campos de INFORMACIÓN BÁSICA vienen como "Etiqueta valor" seguidos en el
+mismo renglón ("Tipo Documento C.C. Número Documento 14106202 ..."). En lugar
+de una búsqueda regex sobre todo el reporte por cada campo, una sola
+alternación con todas las etiquetas recorre el texto una vez y el valor de
+cada etiqueta es el texto hasta la siguiente etiqueta o el fin del renglón.
+"""
+import re
+from typing import Dict, Iterable, Optional
+
+from config.field_mappings import FIELD_MAPPINGS
+
+class EscanerEtiquetas:
+    """Encuentra varias etiquetas literales en una pasada y corta sus valores"""
+    
+    def __init__(self, etiquetas: Dict[str, str], delimitadores: Iterable[str] = ()):
+        """
+        Args:
+            etiquetas: Campo -> etiqueta literal tal como aparece en el reporte
+            delimitadores: Etiquetas que no se extraen pero terminan el valor anterior
+        """
+        self.campos = {etiqueta: campo for campo, etiqueta in etiquetas.items()}
+        # Las etiquetas más largas primero, para que ninguna quede tapada por un prefijo
+        alternativas = sorted(set(self.campos) | set(delimitadores), key=len, reverse=True)
+        self.patron = re.compile("|".join(rf"(?<!\w){re.escape(e)}(?!\w)" for e in alternativas))
+    
+    def escanear(self, texto: str) -> Dict[str, str]:
+        """
+        Recorre el texto una vez y retorna el valor de cada etiqueta
+        
+        Se conserva la primera aparición de cada etiqueta. El recorrido termina
+        apenas todas las etiquetas tienen valor.
+        
+        Args:
+            texto: Texto del reporte
+            
+        Returns:
+            Dict campo -> valor (solo campos con valor)
+        """
+        valores: Dict[str, str] = {}
+        pendiente: Optional[str] = None  # Campo cuyo valor aún no termina
+        inicio = fin_linea = 0
+        
+        for match in self.patron.finditer(texto):
+            if pendiente is not None:
+                self._guardar(valores, pendiente, texto[inicio:min(match.start(), fin_linea)])
+                pendiente = None
+                if len(valores) == len(self.campos):
+                    break
+            
+            campo = self.campos.get(match.group())
+            if campo is not None and campo not in valores:
+                pendiente = campo
+                inicio = match.end()
+                fin_linea = texto.find('\n', inicio)
+                if fin_linea < 0:
+                    fin_linea = len(texto)
+        
+        if pendiente is not None:
+            self._guardar(valores, pendiente, texto[inicio:fin_linea])
+        
+        return {campo: valor for campo, valor in valores.items() if valor}
+    
+    @staticmethod
+    def _guardar(valores: Dict[str, str], campo: str, valor: str):
+        # "Tiene RUT? -" y "189 Meses -": el guion marca un valor vacío
+        valores[campo] = valor.strip().lstrip(':').rstrip('-').strip()
+
+# Etiquetas de INFORMACIÓN BÁSICA (primera variante de cada campo en FIELD_MAPPINGS)
+ESCANER_INFORMACION_BASICA = EscanerEtiquetas(
+    {campo: variantes[0] for campo, variantes in FIELD_MAPPINGS['informacion_basica'].items()},
+    delimitadores=['Tiene RUT?']
+)
\ No newline at end of file
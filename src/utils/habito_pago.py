@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+"""
+Obligaciones de HÁBITO DE PAGO leídas en una sola pasada
+
+Cada obligación del reporte repite el mismo bloque de renglones: el primer
+vector de 24 meses, el estado ("+ Al día", "- Esta en mora 120"), el renglón
+principal (entidad, tipo, cuenta de 9 dígitos, fechas y el segundo vector),
+"Orig:" y, en las obligaciones abiertas, el renglón de valores con la oficina.
+Un autómata recorre los renglones uno a uno y cierra cada obligación cuando
+empieza la siguiente, así que el costo es lineal en el largo de la sección sin
+importar cuántas obligaciones tenga el reporte.
+
+Las entidades con nombres largos quedan partidas alrededor del renglón
+principal; se unen los pedazos que están antes del signo del estado y antes
+de "Orig:". Con las coordenadas de las palabras la entidad y la oficina se
+toman de sus columnas, porque en el texto plano un renglón como
+"BANCOLOMBIA AME. NO INFORMO /" no dice dónde termina una y empieza la otra.
+"""
+import re
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .pdf_backends import Palabra, agrupar_renglones
+from .secciones import PATRON_ENCABEZADOS
+from .tablas_palabras import PATRON_PIE_PAGINA, PATRON_SECTOR, a_entero, a_miles, a_porcentaje, a_texto
+
+# Obligación tipada: campo -> valor (None si el reporte no lo trae)
+Obligacion = Dict[str, Any]
+
+ABIERTA = 'abierta'
+CERRADA = 'cerrada'
+
+PATRON_HABITO = re.compile(r"^HÁBITO DE PAGO DE OBLIGACIONES (ABIERTAS|CERRADAS)")
+
+# Encabezados de la tabla que se repiten antes de cada obligación o sector
+PATRON_ENCABEZADO_TABLA = re.compile(
+    r"^(?:Tipo (?:Num Cta|Estado de la)|Entidad Informante|Cuenta (?:dígitos|Obligación)"
+    r"|Desacuerdo con la|Perm\. Cuotas|inform\. Titular)"
+)
+
+# Pie de página sin número ("DELAGRO SAS 2024/02/27 18:07:22 Página" en la última hoja)
+PATRON_PIE_TRUNCADO = re.compile(r"\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2} Página$")
+
+# Dos bloques de 12 meses: "[NNNNNNNNNNNN][NNNNNN------]"
+PATRON_VECTOR = re.compile(r"\[([^\]\[]{12})\]\[([^\]\[]{12})\]")
+
+# Estado precedido de su signo, con el resto de la entidad antes ("BCO DAVIVIENDA LIBRE + Pago Vol")
+PATRON_SIGNO = re.compile(r"(?:^|(?<= ))([+-]) (.*)$")
+
+# Número de cuenta: 9 dígitos casi siempre, pero hay cuentas más cortas y
+# algunas con punto al inicio (".49214796" en Telcos)
+_CUENTA = r"\.?(?=[0-9A-Z]*\d)[0-9A-Z]{4,9}"
+_FECHA = r"\d{8}|-"
+_MILES = r"[\d,]+|-"
+
+# Renglón principal de una obligación abierta: tipo, cuenta y calificación seguidos de las fechas
+PATRON_PRINCIPAL_ABIERTA = re.compile(
+    rf"^(?:(?P<entidad>.*) )?(?P<tipo_cuenta>[A-Z]{{3}}) (?P<numero_cuenta>{_CUENTA}) (?P<calificacion>\S+)"
+    rf"(?: (?P<detalle>.*?))? (?P<fecha_actualizacion>\d{{8}}) (?P<fecha_apertura>\d{{8}})"
+    rf" (?P<fecha_vencimiento>{_FECHA})(?: (?P<mora_maxima>>?\d+))?$"
+)
+
+# Renglón principal de una obligación cerrada: la calificación va antes de la cuenta
+PATRON_PRINCIPAL_CERRADA = re.compile(
+    rf"^(?:(?P<entidad>.*) )?(?P<tipo_cuenta>[A-Z]{{3}})(?: (?P<detalle>.*?))? (?P<calificacion>\S+)"
+    rf" (?P<numero_cuenta>{_CUENTA}) (?P<fecha_apertura>\d{{8}}) (?P<fecha_cierre>\d{{8}})"
+    rf" (?P<valor_inicial>{_MILES}) (?P<fecha_vencimiento>{_FECHA})(?: (?P<oficina>.+))?$"
+)
+
+# Renglón de valores de una obligación abierta
+PATRON_VALORES = re.compile(
+    rf"^(?P<estado_titular>\S+)(?: (?P<marca>\S+/\S+))? (?P<garantia>.+?) (?P<valor_inicial>{_MILES})"
+    rf" (?P<saldo_actual>{_MILES}) (?P<saldo_mora>{_MILES}) (?P<valor_cuota>{_MILES})"
+    rf" (?P<fecha_limite_pago>{_FECHA}) (?P<fecha_pago>{_FECHA}) (?P<cheques_devueltos>\d+|-)"
+    rf" (?P<permanencia>\S+) (?P<cuotas>\S+(?: de \S+)?) (?P<porcentaje_deuda>[\d.]+%|-)(?: (?P<oficina>.+))?$"
+)
+
+# Estados de las obligaciones cerradas, seguidos de la ciudad en el mismo renglón
+PATRON_ESTADO_CERRADA = re.compile(r"^(Pago Vol|Cancelada(?: Vol)?|Saldada|Inactiva|Al día)\b ?(.*)$")
+
+PATRON_TIPO_DEUDOR = re.compile(r"^(Principal|Codeudor|Avalista|Deudor)$")
+
+PATRON_ORIGEN = re.compile(r"^(Normal|Reestructurad[ao]|Refinanciad[ao]|Transferid[ao]|Comprad[ao])$")
+
+# Fechas seguidas de un renglón principal; si el renglón no se pudo leer como
+# principal (ni como renglón de valores) se cuenta como descartado
+PATRON_FECHAS = re.compile(r"\b\d{8} \d{8}\b")
+
+# Oficina partida en su propio renglón: "NO INFORMO /", "SER / -", "/ Principal"
+PATRON_OFICINA = re.compile(r"^(.*?) ?/(?: (\S+))?$")
+
+# Estado del plástico de las tarjetas cerradas, repartido entre los renglones
+# vecinos del principal ("VolPlástico:", "MASTERCARD Devuelto Orig:", "Sin")
+PATRON_TARJETA = re.compile(
+    r"(?:^|(?<= ))(?:(?:Vol|Mora)?Pl(?:á|a)?stico:|Vol|Mora|Orig:"
+    r"|(?P<plastico>Devuelto|Entregado|No Renovado|Sin))(?= |$)"
+)
+
+# Columnas según el centro de cada palabra (puntos PDF, página de 1008 de
+# ancho): la entidad termina antes del tipo de cuenta; la oficina va después
+# del porcentaje de deuda en abiertas y entre la fecha de vencimiento y el
+# desacuerdo en cerradas
+FIN_ENTIDAD = {ABIERTA: 190, CERRADA: 140}
+COLUMNA_OFICINA = {ABIERTA: (875, float('inf')), CERRADA: (610, 712)}
+
+def a_fecha(texto: Optional[str]) -> Optional[date]:
+    """Fecha del reporte: '20250731' -> date(2025, 7, 31); una fecha inválida ('00000000') -> None"""
+    if not texto or texto == '-':
+        return None
+    try:
+        return datetime.strptime(texto, "%Y%m%d").date()
+    except ValueError:
+        return None
+
+def a_mora(texto: Optional[str]) -> Optional[int]:
+    """Mora máxima en días: '>120' -> 120"""
+    return a_entero(texto.lstrip('>')) if texto else None
+
+def separar_tarjeta(texto: str) -> Tuple[str, Optional[str]]:
+    """'MASTERCARD Devuelto Orig:' -> ('MASTERCARD', 'Devuelto')"""
+    plastico = [match.group('plastico') for match in PATRON_TARJETA.finditer(texto) if match.group('plastico')]
+    resto = " ".join(PATRON_TARJETA.sub('', texto).split())
+    return resto, " ".join(plastico) or None
+
+def obligacion_vacia(estado_cuenta: str, sector: Optional[str]) -> Obligacion:
+    """Obligación con todos los campos en None"""
+    return {
+        'estado_cuenta': estado_cuenta, 'sector': sector, 'entidad': None, 'tipo_cuenta': None,
+        'numero_cuenta': None, 'calificacion': None, 'estado': None, 'al_dia': None, 'detalle': None,
+        'fecha_actualizacion': None, 'fecha_apertura': None, 'fecha_vencimiento': None,
+        'fecha_cierre': None, 'mora_maxima': None, 'vector': None, 'estado_origen': None,
+        'estado_titular': None, 'marca': None, 'garantia': None, 'valor_inicial': None,
+        'saldo_actual': None, 'saldo_mora': None, 'valor_cuota': None, 'fecha_limite_pago': None,
+        'fecha_pago': None, 'cheques_devueltos': None, 'cuotas': None, 'porcentaje_deuda': None,
+        'oficina': None, 'tipo_deudor': None
+    }
+
+class LectorHabitoPago:
+    """Autómata que arma las obligaciones renglón por renglón"""
+    
+    def __init__(self):
+        self.obligaciones: List[Obligacion] = []
+        self.estado_cuenta: Optional[str] = None  # None fuera de HÁBITO DE PAGO
+        self.sector: Optional[str] = None
+        self._actual: Optional[Obligacion] = None
+        self._con_principal = False  # La obligación actual ya tiene su renglón principal
+        self._vectores: List[str] = []
+        self._entidad: List[str] = []  # Pedazos de la entidad fuera del renglón principal
+        self._antes = 0  # Cuántos de esos pedazos están antes del renglón principal
+        self._por_columnas = False  # Entidad y oficina tomadas de sus columnas
+        self.descartados: List[str] = []  # Renglones principales que no se pudieron leer
+    
+    def procesar_texto(self, texto: str):
+        """Procesa el texto de una o más páginas (el estado continúa entre llamadas)"""
+        for linea in texto.split('\n'):
+            self.procesar_linea(linea)
+    
+    def procesar_renglon(self, renglon: List[Palabra]):
+        """
+        Avanza el autómata con un renglón de palabras posicionadas
+        
+        Args:
+            renglon: Palabras del renglón de izquierda a derecha (agrupar_renglones)
+        """
+        self.procesar_linea(" ".join(palabra[4] for palabra in renglon), renglon)
+    
+    def procesar_linea(self, linea: str, renglon: Optional[List[Palabra]] = None):
+        """
+        Avanza el autómata con un renglón
+        
+        Args:
+            linea: Texto del renglón
+            renglon: Palabras del renglón con sus coordenadas; si se dan, la
+                entidad y la oficina se toman de sus columnas
+        """
+        linea = linea.strip()
+        if not linea or PATRON_PIE_PAGINA.search(linea) or PATRON_PIE_TRUNCADO.search(linea):
+            return
+        
+        match = PATRON_HABITO.match(linea)
+        if match:
+            self._cerrar()
+            self.estado_cuenta = ABIERTA if match.group(1) == 'ABIERTAS' else CERRADA
+            self.sector = None
+            return
+        
+        if PATRON_ENCABEZADOS.match(linea):  # Otra sección del reporte
+            self._cerrar()
+            self.estado_cuenta = None
+            return
+        
+        if self.estado_cuenta is None:
+            return
+        
+        match = PATRON_SECTOR.match(linea)
+        if match:
+            self._cerrar()
+            self.sector = match.group(1)
+            return
+        
+        if PATRON_ENCABEZADO_TABLA.match(linea):
+            # En abiertas el encabezado se repite antes de cada obligación
+            if self.estado_cuenta == ABIERTA and linea.startswith("Tipo Num Cta"):
+                self._cerrar()
+            return
+        
+        entidad = oficina = None
+        if renglon is not None:
+            self._por_columnas = True
+            resto, entidad, oficina = self._columnas(renglon)
+        
+        # Los vectores se separan del resto del renglón
+        vectores = PATRON_VECTOR.findall(linea)
+        if vectores:
+            linea = PATRON_VECTOR.sub('', linea).strip()
+        if renglon is not None:
+            resto = PATRON_VECTOR.sub('', resto).strip()
+        else:
+            resto = linea
+        principal = self._principal(resto)
+        
+        # Sin el encabezado de la tabla (cerradas, o texto ya limpio) una nueva
+        # obligación empieza con su primer vector, su estado o un renglón
+        # principal tras uno ya leído. Las cuentas sin vector (ahorros,
+        # corriente) caben en un renglón, así que lo que sigue y no es oficina ya
+        # es de la siguiente; en abiertas, tras el renglón de valores, también
+        # el estado sin signo ("Activa")
+        if self._con_principal and (
+                principal is not None or vectores or PATRON_SIGNO.match(linea)
+                or self._siguiente_sin_vector(linea)):
+            self._cerrar()
+        
+        if self._actual is None:
+            self._actual = obligacion_vacia(self.estado_cuenta, self.sector)
+        
+        self._vectores.extend(a + b for a, b in vectores)
+        
+        if principal is not None:
+            self._aplicar_principal(principal)
+        elif self._descartado(resto):
+            self.descartados.append(linea)
+        elif self._con_principal:
+            self._despues_principal(resto)
+        elif resto:
+            self._antes_principal(resto)
+        
+        if entidad:
+            self._entidad.append(entidad)
+        if oficina:
+            self._asignar_oficina(oficina)
+    
+    def resultado(self) -> List[Obligacion]:
+        """Obligaciones leídas, en el orden del reporte"""
+        self._cerrar()
+        return self.obligaciones
+    
+    def _columnas(self, renglon: List[Palabra]) -> Tuple[str, Optional[str], Optional[str]]:
+        """Separa el renglón en (resto, entidad, oficina) según la columna de cada palabra"""
+        fin_entidad = FIN_ENTIDAD[self.estado_cuenta]
+        inicio_oficina, fin_oficina = COLUMNA_OFICINA[self.estado_cuenta]
+        resto, entidad, oficina = [], [], []
+        for palabra in renglon:
+            centro = (palabra[0] + palabra[2]) / 2
+            if inicio_oficina <= centro < fin_oficina:
+                oficina.append(palabra[4])
+            elif centro < fin_entidad:
+                entidad.append(palabra[4])
+            else:
+                resto.append(palabra[4])
+        
+        # En abiertas el renglón de valores empieza bajo la columna de la entidad ("Normal ADMIS ...")
+        if entidad and self.estado_cuenta == ABIERTA and PATRON_VALORES.match(" ".join(entidad + resto)):
+            resto, entidad = entidad + resto, []
+        return " ".join(resto), " ".join(entidad) or None, " ".join(oficina) or None
+    
+    def _descartado(self, linea: str) -> bool:
+        """True si el renglón trae las fechas de un principal pero no se pudo leer"""
+        if not PATRON_FECHAS.search(linea):
+            return False
+        return self.estado_cuenta == CERRADA or not PATRON_VALORES.match(linea)
+    
+    def _siguiente_sin_vector(self, linea: str) -> bool:
+        """True si el renglón ya es de la obligación siguiente a una sin vector"""
+        if PATRON_OFICINA.match(linea):
+            return False
+        if self.estado_cuenta == CERRADA:
+            return not self._vectores and self._actual['oficina'] is not None
+        # Los pedazos de la marca ("Card/Otra") y del deudor siguen al renglón de valores
+        return (self._actual['estado_titular'] is not None and '/' not in linea
+                and not PATRON_TIPO_DEUDOR.match(linea) and not PATRON_ORIGEN.match(linea))
+    
+    def _principal(self, linea: str) -> Optional[Dict[str, Optional[str]]]:
+        patron = PATRON_PRINCIPAL_ABIERTA if self.estado_cuenta == ABIERTA else PATRON_PRINCIPAL_CERRADA
+        match = patron.match(linea)
+        return match.groupdict() if match else None
+    
+    def _aplicar_principal(self, campos: Dict[str, Optional[str]]):
+        obligacion = self._actual
+        obligacion['entidad'] = campos['entidad']
+        obligacion['tipo_cuenta'] = campos['tipo_cuenta']
+        obligacion['numero_cuenta'] = campos['numero_cuenta']
+        obligacion['calificacion'] = a_texto(campos['calificacion'])
+        if campos['tipo_cuenta'] == 'TDC' and self.estado_cuenta == CERRADA:
+            self._fragmento_entidad(campos['detalle'] or '')  # Solo trae el estado del plástico
+        else:
+            obligacion['detalle'] = campos['detalle']
+        obligacion['fecha_apertura'] = a_fecha(campos['fecha_apertura'])
+        obligacion['fecha_vencimiento'] = a_fecha(campos['fecha_vencimiento'])
+        obligacion['fecha_actualizacion'] = a_fecha(campos.get('fecha_actualizacion'))
+        obligacion['fecha_cierre'] = a_fecha(campos.get('fecha_cierre'))
+        obligacion['mora_maxima'] = a_mora(campos.get('mora_maxima'))
+        if campos.get('valor_inicial') is not None:
+            obligacion['valor_inicial'] = a_miles(campos['valor_inicial'])
+        if campos.get('oficina'):
+            self._asignar_oficina(campos['oficina'])
+        self._con_principal = True
+        self._antes = len(self._entidad)
+    
+    def _antes_principal(self, linea: str):
+        match = PATRON_SIGNO.search(linea)
+        if match is None:
+            if self.estado_cuenta == ABIERTA:
+                self._actual['estado'] = linea  # Estado sin signo, p.ej. "Activa"
+            else:
+                self._fragmento_entidad(linea)
+            return
+        
+        anterior = linea[:match.start()].strip()
+        if anterior:
+            self._fragmento_entidad(anterior)
+        
+        estado = match.group(2)
+        if self.estado_cuenta == CERRADA:
+            separado = PATRON_ESTADO_CERRADA.match(estado)
+            if separado:
+                estado = separado.group(1)
+                if separado.group(2):
+                    self._asignar_oficina(separado.group(2))
+        self._actual['estado'] = estado
+        self._actual['al_dia'] = match.group(1) == '+'
+    
+    def _despues_principal(self, linea: str):
+        obligacion = self._actual
+        if not linea:
+            return
+        
+        if 'Orig:' in linea:
+            anterior, _, origen = linea.partition('Orig:')
+            if anterior.strip():
+                self._fragmento_entidad(anterior)
+            for palabra in origen.split():
+                if PATRON_TIPO_DEUDOR.match(palabra):
+                    obligacion['tipo_deudor'] = palabra
+                elif obligacion['estado_origen'] is None:
+                    obligacion['estado_origen'] = palabra
+            return
+        
+        match = PATRON_VALORES.match(linea) if self.estado_cuenta == ABIERTA else None
+        if match:
+            campos = match.groupdict()
+            obligacion['estado_titular'] = campos['estado_titular']
+            obligacion['marca'] = campos['marca']
+            obligacion['garantia'] = a_texto(campos['garantia'])
+            for campo in ('valor_inicial', 'saldo_actual', 'saldo_mora', 'valor_cuota'):
+                obligacion[campo] = a_miles(campos[campo])
+            obligacion['fecha_limite_pago'] = a_fecha(campos['fecha_limite_pago'])
+            obligacion['fecha_pago'] = a_fecha(campos['fecha_pago'])
+            obligacion['cheques_devueltos'] = a_entero(campos['cheques_devueltos'])
+            obligacion['cuotas'] = a_texto(campos['cuotas'])
+            obligacion['porcentaje_deuda'] = a_porcentaje(campos['porcentaje_deuda'])
+            if campos['oficina']:
+                self._asignar_oficina(campos['oficina'])
+            return
+        
+        if PATRON_TIPO_DEUDOR.match(linea):
+            obligacion['tipo_deudor'] = linea
+        elif PATRON_ORIGEN.match(linea) and obligacion['estado_origen'] is None:
+            obligacion['estado_origen'] = linea  # "Orig:" quedó en el renglón anterior
+        elif obligacion['estado_origen'] is None and self.estado_cuenta == CERRADA:
+            # Pedazo de la entidad o del deudor ("EXP. Principal")
+            anterior, _, deudor = linea.rpartition(' ')
+            if PATRON_TIPO_DEUDOR.match(deudor):
+                obligacion['tipo_deudor'] = deudor
+                linea = anterior
+            if linea:
+                self._fragmento_entidad(linea)
+        elif PATRON_OFICINA.match(linea):
+            self._asignar_oficina(linea)
+    
+    def _fragmento_entidad(self, texto: str):
+        """Pedazo de la entidad fuera del renglón principal (u oficina, si termina en '/')"""
+        match = PATRON_TARJETA.search(texto)
+        if match and PATRON_OFICINA.match(texto):
+            # "BCO POPULAR TARJ VolPlástico: NO INFORMO /": entidad, plástico y oficina
+            anterior = texto[:match.start()].strip()
+            if anterior:
+                self._entidad.append(anterior)
+            texto = texto[match.start():]
+        texto, plastico = separar_tarjeta(texto)
+        if plastico:
+            detalle = self._actual['detalle']
+            self._actual['detalle'] = f"{detalle} {plastico}" if detalle else plastico
+        if self._por_columnas:
+            return  # La entidad y la oficina ya vienen de sus columnas
+        if PATRON_OFICINA.match(texto):
+            self._asignar_oficina(texto)
+        elif texto:
+            self._entidad.append(texto)
+    
+    def _asignar_oficina(self, texto: str):
+        """'MURILLO TORO / Principal' -> oficina y tipo de deudor"""
+        if PATRON_TIPO_DEUDOR.match(texto):
+            self._actual['tipo_deudor'] = texto  # Sin oficina, solo el deudor en su columna
+            return
+        oficina, _, deudor = texto.partition('/')
+        oficina = oficina.strip()
+        if (not oficina and self._actual['oficina'] is None and self._con_principal and self._antes
+                and not self._por_columnas):
+            # "/ -" bajo el principal: la oficina era el renglón de arriba
+            self._antes -= 1
+            oficina = self._entidad.pop(self._antes)
+        if oficina:
+            # La oficina puede venir partida antes y después del renglón principal
+            anterior = self._actual['oficina']
+            self._actual['oficina'] = f"{anterior} {oficina}" if anterior else oficina
+        deudor = deudor.strip()
+        if deudor and deudor != '-':
+            self._actual['tipo_deudor'] = deudor
+    
+    def _cerrar(self):
+        """Guarda la obligación en curso si tiene su renglón principal"""
+        obligacion = self._actual
+        if obligacion is not None and self._con_principal:
+            if self._entidad:
+                partes = [obligacion['entidad']] if obligacion['entidad'] else []
+                entidad = " ".join(self._entidad[:1] + partes + self._entidad[1:])
+                obligacion['entidad'] = entidad.replace(" :", ":")  # "NATURA ORIG" + ":AVON"
+            if self._vectores:
+                obligacion['vector'] = "".join(self._vectores)
+            self.obligaciones.append(obligacion)
+        
+        self._actual = None
+        self._con_principal = False
+        self._vectores = []
+        self._entidad = []
+        self._antes = 0
+
+def leer_texto(texto: str) -> LectorHabitoPago:
+    """
+    Recorre el texto del reporte renglón por renglón
+    
+    Args:
+        texto: Texto del reporte (o solo de la sección HÁBITO DE PAGO)
+        
+    Returns:
+        Lector con las obligaciones y los renglones descartados
+    """
+    lector = LectorHabitoPago()
+    lector.procesar_texto(texto)
+    return lector
+
+def leer_palabras(paginas: Iterable[Tuple[int, List[Palabra]]]) -> LectorHabitoPago:
+    """
+    Recorre las palabras de las páginas; la entidad y la oficina salen de sus columnas
+    
+    Args:
+        paginas: Pares (número de página base 0, palabras) en orden
+        
+    Returns:
+        Lector con las obligaciones y los renglones descartados
+    """
+    lector = LectorHabitoPago()
+    for _, palabras in paginas:
+        for renglon in agrupar_renglones(palabras):
+            lector.procesar_renglon(renglon)
+    return lector
+
+def extraer_obligaciones(texto: str) -> List[Obligacion]:
+    """
+    Obligaciones abiertas y cerradas de HÁBITO DE PAGO
+    
+    Args:
+        texto: Texto del reporte (o solo de la sección HÁBITO DE PAGO)
+        
+    Returns:
+        Lista de obligaciones tipadas en el orden del reporte; 'vector' une los
+        48 meses del más reciente al más antiguo
+    """
+    return leer_texto(texto).resultado()
\ No newline at end of file
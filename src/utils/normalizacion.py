@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Normalización de columnas de valores extraídos
+
+Los extractores entregan montos y fechas como texto ("57,399", "$38,357",
+"37.0%", ">120", "-", "20250731", "22/06/1995", "2025/08/26"). Aquí se
+convierten columnas completas de una vez con pandas (Int64/float64 y
+datetime64, con los vacíos como nulos explícitos) en lugar de analizar celda
+por celda, para que los archivos de salida tengan números y fechas reales.
+Cada columna se factoriza primero: los valores se repiten mucho entre
+registros ("-", "0", fechas de corte), así que solo se analizan los distintos
+y el resultado se expande con take().
+
+El tipo de una columna se infiere de sus valores: solo se convierte si todos
+los valores no vacíos tienen la misma forma. Los identificadores (documento,
+cuenta, teléfono, ...) se dejan como texto aunque sean solo dígitos.
+"""
+import unicodedata
+from typing import Any, Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# Valores que el reporte usa para "sin dato"
+VACIOS = ['', '-']
+
+# Montos, cantidades y porcentajes: "57,399", "$38,357", "37.0%", ">120", "0.0"
+# (más de 15 dígitos ya no es una cantidad, es un identificador)
+PATRON_NUMERO = r"[>$]?-?(?:\d{1,3}(?:,\d{3}){1,4}|\d{1,15})(?:\.\d+)?%?"
+
+# Formatos de fecha del reporte: patrón -> formato de strptime
+FORMATOS_FECHA = {
+    r"\d{8}": "%Y%m%d",
+    r"\d{2}/\d{2}/\d{4}": "%d/%m/%Y",
+    r"\d{4}/\d{2}/\d{2}": "%Y/%m/%d",
+}
+
+# Columnas con identificadores numéricos que no son cantidades: nombre exacto o
+# prefijo seguido de '_' ('telefono' cubre telefono_celular, 'vector' cubre
+# vector_entidad_1; vectores_pago_total y total_codigos son cantidades)
+COLUMNAS_TEXTO = ('documento', 'numero_documento', 'cedula', 'cuenta', 'numero_cuenta', 'telefono',
+                  'celular', 'codigo', 'ciiu', 'nit', 'vector')
+
+NUMERO = 'numero'
+FECHA = 'fecha'
+
+def _texto(serie: pd.Series) -> pd.Series:
+    """Serie como texto sin espacios, con los vacíos del reporte como nulos"""
+    texto = serie.astype('string').str.strip()
+    return texto.mask(texto.isin(VACIOS))
+
+def _por_valor(serie: pd.Series, convertir: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """Aplica una conversión a los valores distintos de la serie y la expande"""
+    codigos, unicos = pd.factorize(serie)
+    convertidos = convertir(_texto(pd.Series(unicos, dtype=object)))
+    return pd.Series(convertidos.array.take(codigos, allow_fill=True), index=serie.index, name=serie.name)
+
+def _numeros(texto: pd.Series) -> pd.Series:
+    """Conversión de a_numeros sobre texto ya limpio"""
+    limpio = texto.str.replace(r"[$>,%]", "", regex=True)
+    numeros = pd.to_numeric(limpio, errors='coerce')
+    if texto.str.contains(r"[.%]", regex=True).any():
+        return numeros.astype('float64')
+    return numeros.astype('Int64')
+
+def _fechas(texto: pd.Series) -> pd.Series:
+    """Conversión de a_fechas sobre texto ya limpio"""
+    fechas = pd.Series(pd.NaT, index=texto.index, dtype='datetime64[ns]')
+    for patron, formato in FORMATOS_FECHA.items():
+        mascara = texto.str.fullmatch(patron).fillna(False).astype(bool)
+        if mascara.any():
+            fechas[mascara] = pd.to_datetime(texto[mascara], format=formato, errors='coerce')
+    return fechas
+
+def a_numeros(serie: pd.Series) -> pd.Series:
+    """
+    Convierte una columna de montos, cantidades o porcentajes
+    
+    Args:
+        serie: Valores como texto ("$38,357", "37.0%", ">120", "-")
+        
+    Returns:
+        Serie float64 si algún valor tiene decimales o es porcentaje, si no
+        Int64; los vacíos y los valores que no son números quedan nulos
+    """
+    return _por_valor(serie, _numeros)
+
+def a_fechas(serie: pd.Series) -> pd.Series:
+    """
+    Convierte una columna de fechas en cualquiera de los formatos del reporte
+    
+    Args:
+        serie: Fechas como texto ("20250731", "22/06/1995", "2025/08/26")
+        
+    Returns:
+        Serie datetime64; los vacíos y las fechas inválidas quedan NaT
+    """
+    return _por_valor(serie, _fechas)
+
+def tipo_columna(serie: pd.Series) -> Optional[str]:
+    """
+    Tipo de los valores de una columna
+    
+    Returns:
+        FECHA o NUMERO si todos los valores no vacíos tienen esa forma, None si
+        la columna es texto (o no tiene valores)
+    """
+    texto = _texto(pd.Series(serie.unique(), dtype=object)).dropna()
+    if texto.empty:
+        return None
+    if texto.str.fullmatch("|".join(FORMATOS_FECHA)).all() and _fechas(texto).notna().all():
+        return FECHA
+    if texto.str.fullmatch(PATRON_NUMERO).all():
+        return NUMERO
+    return None
+
+def nombre_columna(columna: Any) -> str:
+    """Nombre comparable de una columna: 'Número Documento' -> 'numero_documento'"""
+    nombre = unicodedata.normalize('NFKD', str(columna).strip().lower().replace(' ', '_'))
+    return "".join(caracter for caracter in nombre if not unicodedata.combining(caracter))
+
+def es_identificador(columna: Any, identificadores: Iterable[str] = COLUMNAS_TEXTO) -> bool:
+    """True si el nombre de la columna es uno de los identificadores o empieza con uno seguido de '_'"""
+    nombre = nombre_columna(columna)
+    return any(nombre == identificador or nombre.startswith(identificador + '_')
+               for identificador in identificadores)
+
+def normalizar_dataframe(df: pd.DataFrame, excluir: Iterable[str] = COLUMNAS_TEXTO) -> pd.DataFrame:
+    """
+    Convierte las columnas de texto que son números o fechas
+    
+    Args:
+        df: Tabla con un registro por fila
+        excluir: Nombres o prefijos de las columnas que siempre son texto (ver es_identificador)
+        
+    Returns:
+        Copia de la tabla con las columnas convertidas
+    """
+    excluir = tuple(nombre_columna(identificador) for identificador in excluir)
+    resultado = df.copy()
+    for columna in df.columns:
+        if es_identificador(columna, excluir):
+            continue
+        if not (pd.api.types.is_object_dtype(df[columna]) or pd.api.types.is_string_dtype(df[columna])):
+            continue
+        tipo = tipo_columna(df[columna])
+        if tipo == FECHA:
+            resultado[columna] = a_fechas(df[columna])
+        elif tipo == NUMERO:
+            resultado[columna] = a_numeros(df[columna])
+    return resultado
+
+def a_celda(valor: Any) -> Any:
+    """Valor de una tabla normalizada listo para una celda de openpyxl (nulos como None)"""
+    if valor is None or (np.ndim(valor) == 0 and pd.isna(valor)):
+        return None
+    if isinstance(valor, pd.Timestamp):
+        return valor.date() if valor == valor.normalize() else valor.to_pydatetime()
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return valor
\ No newline at end of file
@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+"""
+Registro compartido de patrones regex compilados
+
+Los extractores buscaban con re.search(patron_en_texto, ...), lo que consulta
+el caché interno de re en cada llamada y recompila cuando hay más patrones de
+los que ese caché conserva. El registro compila cada patrón una sola vez por
+proceso (REGEX_PATTERNS al importar, el resto en su primer uso) y lleva la
+cuenta de aciertos y fallos de cada uno.
+
+Un texto de más de VENTANA_MAXIMA caracteres (un reporte completo tiene unos
+40.000, así que solo pasa con textos anómalos) se busca tramo por tramo,
+cortado en los límites de sus secciones (utils.secciones.IndiceSecciones) y,
+si una sección no cabe, en límites de renglón. Cada tramo se busca con
+pos/endpos sobre el texto completo, así que los Match tienen las posiciones
+del texto completo, y con SOLAPE_TRAMOS caracteres más allá del corte para
+encontrar las coincidencias que lo cruzan; una coincidencia que cruza el corte
+se vuelve a buscar sin límite desde su inicio. El resultado es el mismo que
+sobre el texto completo mientras las coincidencias (y cada repetición de un
+grupo) midan menos que el solape.
+
+Dentro de presupuesto() cada búsqueda descuenta su duración del tiempo
+disponible para el documento y, una vez agotado, las búsquedas restantes del
+documento se omiten. El presupuesto se revisa entre búsquedas: re no permite
+interrumpir una búsqueda en curso, así que un patrón con retroceso
+catastrófico corre hasta terminar. Esos patrones se corrigen en el patrón
+mismo; aquí solo quedan registrados (patrones costosos y excesos()) para
+encontrarlos. Con utils.perfilador activo cada búsqueda además se mide y se
+atribuye a su campo.
+
+Antes de buscar en un texto largo se verifica que estén las anclas literales
+del patrón (utils.anclas) en una copia plegada del texto, calculada una vez;
+si falta alguna, la búsqueda se omite sin recorrer el texto con la regex.
+"""
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+from config.field_mappings import REGEX_PATTERNS
+from .anclas import Anclas, anclas_literales, plegar, presentes
+from .secciones import IndiceSecciones
+
+# Opciones con las que buscan todos los extractores
+FLAGS_EXTRACTORES = re.IGNORECASE | re.MULTILINE
+
+# Caracteres de cada tramo de búsqueda (un reporte completo tiene ~40.000)
+VENTANA_MAXIMA = 200_000
+
+# Caracteres que cada tramo examina después de su corte, para las coincidencias que lo cruzan
+SOLAPE_TRAMOS = 2_000
+
+# Segundos de búsqueda disponibles por documento
+PRESUPUESTO_DOCUMENTO = 5.0
+
+# Una búsqueda más lenta que esto se registra como costosa
+LIMITE_BUSQUEDA = 0.25
+
+# Textos más cortos se buscan directamente (plegarlos costaría más que la búsqueda)
+MIN_TEXTO_ANCLAS = 1000
+
+# Textos plegados que conserva cada hilo (el documento y sus secciones en uso)
+TEXTOS_PLEGADOS = 4
+
+class PresupuestoBusqueda:
+    """Tiempo de búsqueda disponible para un documento (se revisa entre búsquedas, no durante)"""
+    
+    def __init__(self, segundos: float = PRESUPUESTO_DOCUMENTO, limite_busqueda: float = LIMITE_BUSQUEDA,
+                 documento: Optional[str] = None):
+        """
+        Args:
+            segundos: Tiempo total de búsqueda del documento
+            limite_busqueda: Duración a partir de la cual una búsqueda es costosa
+            documento: Nombre del documento (para los reportes)
+        """
+        self.segundos = segundos
+        self.limite_busqueda = limite_busqueda
+        self.documento = documento
+        self.usado = 0.0
+        self.omitidas = 0  # Búsquedas no realizadas por presupuesto agotado
+        self.costosas: List[Tuple[str, float]] = []  # (patrón, segundos)
+        self.fraccionados: List[Tuple[str, int]] = []  # (patrón, longitud) de textos buscados por tramos
+        self.patron_agotado: Optional[str] = None  # Patrón con el que se agotó el presupuesto
+    
+    @property
+    def agotado(self) -> bool:
+        """True si ya no queda tiempo de búsqueda"""
+        return self.usado >= self.segundos
+    
+    def descontar(self, patron: str, segundos: float) -> bool:
+        """
+        Descuenta una búsqueda del presupuesto
+        
+        Returns:
+            True si la búsqueda fue costosa o agotó el presupuesto
+        """
+        disponible = not self.agotado
+        self.usado += segundos
+        costosa = segundos >= self.limite_busqueda
+        if costosa:
+            self.costosas.append((patron, segundos))
+        if disponible and self.agotado:
+            self.patron_agotado = patron
+            return True
+        return costosa
+    
+    def resumen(self) -> Dict[str, Any]:
+        """Lo que pasó con el presupuesto (vacío si no hubo búsquedas costosas ni textos fraccionados)"""
+        if not self.costosas and not self.agotado and not self.fraccionados:
+            return {}
+        return {
+            'tiempo_busqueda': round(self.usado, 3),
+            'busquedas_omitidas': self.omitidas,
+            'patron_agotado': self.patron_agotado,
+            'patrones_costosos': [patron for patron, _ in sorted(self.costosas, key=lambda c: -c[1])],
+            'busquedas_fraccionadas': len(self.fraccionados),
+            'textos_fraccionados': [f"{patron} ({longitud} caracteres)"
+                                    for patron, longitud in dict.fromkeys(self.fraccionados)]
+        }
+
+class RegistroPatrones:
+    """Patrones compilados una sola vez, con contadores de aciertos y fallos"""
+    
+    def __init__(self, flags: int = FLAGS_EXTRACTORES, ventana: int = VENTANA_MAXIMA,
+                 solape: int = SOLAPE_TRAMOS):
+        """
+        Args:
+            flags: Opciones de re por defecto para compilar
+            ventana: Caracteres de cada tramo de búsqueda en textos más largos
+            solape: Caracteres que cada tramo examina después de su corte
+        """
+        self.flags = flags
+        self.ventana = ventana
+        self.solape = solape
+        self._compilados: Dict[tuple, Pattern] = {}
+        self._contadores: Dict[str, List[int]] = {}  # patrón -> [aciertos, fallos]
+        self._excesos: Dict[str, int] = {}  # patrón -> búsquedas costosas o que agotaron un presupuesto
+        self._anclas: Dict[Pattern, Optional[Anclas]] = {}
+        self._descartes: Dict[str, int] = {}  # patrón -> búsquedas omitidas por faltar sus anclas
+        self._local = threading.local()  # Presupuesto del documento en curso, por hilo
+        self.perfilador = None  # utils.perfilador.PerfiladorPatrones mientras perfilar() está activo
+    
+    def compilar(self, patron: Union[str, Pattern], flags: Optional[int] = None) -> Pattern:
+        """
+        Patrón compilado, reutilizado en las siguientes llamadas
+        
+        Args:
+            patron: Patrón en texto (o ya compilado, que se retorna igual)
+            flags: Opciones de re (por defecto las del registro)
+            
+        Returns:
+            Patrón compilado
+        """
+        if not isinstance(patron, str):
+            return patron
+        
+        clave = (patron, self.flags if flags is None else flags)
+        compilado = self._compilados.get(clave)
+        if compilado is None:
+            compilado = self._compilados[clave] = re.compile(patron, clave[1])
+        return compilado
+    
+    def registrar(self, patrones: Dict[str, str], flags: Optional[int] = None) -> Dict[str, Pattern]:
+        """
+        Compila de una vez un grupo de patrones con nombre
+        
+        Args:
+            patrones: Nombre -> patrón en texto
+            flags: Opciones de re (por defecto las del registro)
+            
+        Returns:
+            Nombre -> patrón compilado
+        """
+        return {nombre: self.compilar(patron, flags) for nombre, patron in patrones.items()}
+    
+    def buscar(self, patron: Union[str, Pattern], texto: str, flags: Optional[int] = None) -> Optional[Any]:
+        """
+        re.search con el patrón compilado, contando el acierto o fallo
+        
+        Returns:
+            Match o None (también si el presupuesto del documento se agotó)
+        """
+        compilado = self.compilar(patron, flags)
+        match = self._ejecutar(compilado, compilado.search, texto)
+        self._contar(compilado.pattern, match is not None)
+        return match
+    
+    def encontrar_todos(self, patron: Union[str, Pattern], texto: str, flags: Optional[int] = None) -> list:
+        """
+        re.findall con el patrón compilado, contando el acierto o fallo
+        
+        Returns:
+            Lista de coincidencias (vacía si no hay o si el presupuesto se agotó)
+        """
+        compilado = self.compilar(patron, flags)
+        coincidencias = self._ejecutar(compilado, compilado.findall, texto) or []
+        self._contar(compilado.pattern, bool(coincidencias))
+        return coincidencias
+    
+    @contextmanager
+    def presupuesto(self, segundos: float = PRESUPUESTO_DOCUMENTO, documento: Optional[str] = None,
+                    limite_busqueda: float = LIMITE_BUSQUEDA) -> Iterator[PresupuestoBusqueda]:
+        """
+        Presupuesto de tiempo para las búsquedas de un documento (en este hilo)
+        
+        Si ya hay uno activo (p.ej. el del lote que llama al extractor) se
+        comparte en lugar de abrir otro.
+        
+        Args:
+            segundos: Tiempo total de búsqueda del documento
+            documento: Nombre del documento
+            limite_busqueda: Duración a partir de la cual una búsqueda es costosa
+            
+        Yields:
+            Presupuesto con el tiempo usado y los patrones costosos
+        """
+        activo = getattr(self._local, 'presupuesto', None)
+        if activo is not None:
+            yield activo
+            return
+        
+        self._local.presupuesto = PresupuestoBusqueda(segundos, limite_busqueda, documento)
+        try:
+            yield self._local.presupuesto
+        finally:
+            self._local.presupuesto = None
+    
+    def campo(self, nombre: str) -> ContextManager:
+        """Atribuye a un campo las búsquedas del bloque (solo con el perfil activo)"""
+        return self.perfilador.campo(nombre) if self.perfilador is not None else nullcontext()
+    
+    def excesos(self) -> Dict[str, int]:
+        """Patrones con búsquedas costosas o que agotaron un presupuesto, y cuántas veces"""
+        return dict(self._excesos)
+    
+    def descartes(self) -> Dict[str, int]:
+        """Patrones con búsquedas omitidas porque el texto no tenía sus anclas, y cuántas veces"""
+        return dict(self._descartes)
+    
+    def contadores(self, patron: Union[str, Pattern]) -> Dict[str, int]:
+        """Aciertos y fallos de un patrón"""
+        fuente = patron if isinstance(patron, str) else patron.pattern
+        aciertos, fallos = self._contadores.get(fuente, (0, 0))
+        return {'aciertos': aciertos, 'fallos': fallos}
+    
+    def tasa_acierto(self, patron: Union[str, Pattern]) -> Optional[float]:
+        """Fracción de búsquedas con coincidencia (None si nunca se usó)"""
+        contadores = self.contadores(patron)
+        total = contadores['aciertos'] + contadores['fallos']
+        return contadores['aciertos'] / total if total else None
+    
+    def estadisticas(self) -> Dict[str, Dict[str, int]]:
+        """Contadores de todos los patrones usados"""
+        return {patron: {'aciertos': a, 'fallos': f} for patron, (a, f) in self._contadores.items()}
+    
+    def reiniciar_contadores(self):
+        """Pone en cero los contadores (los patrones compilados se conservan)"""
+        self._contadores.clear()
+        self._excesos.clear()
+        self._descartes.clear()
+    
+    def __len__(self) -> int:
+        return len(self._compilados)
+    
+    def _ejecutar(self, compilado: Pattern, metodo: Callable[..., Any], texto: str) -> Any:
+        """Ejecuta search o findall, por tramos si el texto no cabe en la ventana"""
+        if len(texto) <= self.ventana:
+            return self._ejecutar_tramo(compilado, partial(metodo, texto), texto)
+        
+        presupuesto = getattr(self._local, 'presupuesto', None)
+        if presupuesto is not None:
+            presupuesto.fraccionados.append((compilado.pattern, len(texto)))
+        
+        # search: la primera coincidencia en el orden del texto; findall: todas,
+        # sin solaparse (la siguiente empieza donde terminó la anterior)
+        coincidencias = []
+        desde = 0
+        for inicio, fin in self._tramos(texto):
+            if desde > fin:
+                continue
+            limite = min(len(texto), fin + self.solape)
+            encontradas = self._ejecutar_tramo(
+                compilado, lambda: list(compilado.finditer(texto, max(inicio, desde), limite)), texto)
+            for match in encontradas or []:
+                if match.start() >= fin and fin < len(texto):
+                    break  # Empieza en el tramo siguiente, que la vuelve a encontrar
+                if match.start() < desde:
+                    continue
+                if match.end() > fin and limite < len(texto):
+                    # Cruza el corte: en el texto completo puede seguir más allá de lo examinado
+                    match = self._ejecutar_tramo(compilado, partial(compilado.search, texto, match.start()), texto)
+                    if match is None:
+                        break
+                if metodo.__name__ == 'search':
+                    return match
+                coincidencias.append(_grupos(compilado, match))
+                desde = match.end() + (match.end() == match.start())
+        return coincidencias if metodo.__name__ == 'findall' else None
+    
+    def _tramos(self, texto: str) -> List[Tuple[int, int]]:
+        """(inicio, fin) de tramos de a lo más una ventana, cortados en límites de sección o de renglón"""
+        tramos_textos = getattr(self._local, 'tramos', None)
+        if tramos_textos is None:
+            tramos_textos = self._local.tramos = {}
+        
+        tramos = tramos_textos.get(texto)
+        if tramos is None:
+            if len(tramos_textos) >= TEXTOS_PLEGADOS:
+                del tramos_textos[next(iter(tramos_textos))]
+            # Se corta en el último inicio de sección que cabe; una sección larga, en renglones
+            limites = [inicio for _, inicio, _ in IndiceSecciones(texto).tramos[1:]] + [len(texto)]
+            tramos = tramos_textos[texto] = []
+            inicio = ultimo = 0
+            for limite in limites:
+                while limite - inicio > self.ventana:
+                    corte = ultimo
+                    if corte <= inicio:
+                        corte = texto.rfind('\n', inicio, inicio + self.ventana) + 1
+                    if corte <= inicio:
+                        corte = inicio + self.ventana  # Renglón más largo que la ventana
+                    tramos.append((inicio, corte))
+                    inicio = corte
+                ultimo = limite
+            tramos.append((inicio, len(texto)))
+        return tramos
+    
+    def _ejecutar_tramo(self, compilado: Pattern, ejecutar: Callable[[], Any], texto: str) -> Any:
+        """Ejecuta una búsqueda sobre el texto, descontando su duración del presupuesto activo"""
+        presupuesto = getattr(self._local, 'presupuesto', None)
+        if presupuesto is None and self.perfilador is None:
+            return self._buscar_con_anclas(compilado, ejecutar, texto)
+        if presupuesto is not None and presupuesto.agotado:
+            presupuesto.omitidas += 1
+            return None
+        
+        inicio = time.perf_counter()
+        resultado = self._buscar_con_anclas(compilado, ejecutar, texto)
+        segundos = time.perf_counter() - inicio
+        if presupuesto is not None and presupuesto.descontar(compilado.pattern, segundos):
+            self._excesos[compilado.pattern] = self._excesos.get(compilado.pattern, 0) + 1
+        if self.perfilador is not None:
+            self.perfilador.registrar(compilado, segundos, resultado, texto)
+        return resultado
+    
+    def _buscar_con_anclas(self, compilado: Pattern, ejecutar: Callable[[], Any], texto: str) -> Any:
+        """Ejecuta la búsqueda, salvo que al texto le falten las anclas literales del patrón"""
+        if len(texto) < MIN_TEXTO_ANCLAS:
+            return ejecutar()
+        
+        if compilado in self._anclas:
+            anclas = self._anclas[compilado]
+        else:
+            anclas = self._anclas[compilado] = anclas_literales(compilado)
+        
+        if anclas is not None and not presentes(anclas, self._plegado(texto)):
+            self._descartes[compilado.pattern] = self._descartes.get(compilado.pattern, 0) + 1
+            return None
+        return ejecutar()
+    
+    def _plegado(self, texto: str) -> str:
+        """Copia plegada del texto, calculada una vez por texto (y por hilo)"""
+        plegados = getattr(self._local, 'plegados', None)
+        if plegados is None:
+            plegados = self._local.plegados = {}
+        
+        plegado = plegados.get(texto)
+        if plegado is None:
+            if len(plegados) >= TEXTOS_PLEGADOS:
+                del plegados[next(iter(plegados))]
+            plegado = plegados[texto] = plegar(texto)
+        return plegado
+    
+    def _contar(self, patron: str, acierto: bool):
+        contadores = self._contadores.get(patron)
+        if contadores is None:
+            contadores = self._contadores[patron] = [0, 0]
+        contadores[0 if acierto else 1] += 1
+
+def _grupos(compilado: Pattern, match: Any) -> Any:
+    """Lo que findall entrega por una coincidencia: el texto, el grupo o la tupla de grupos"""
+    if compilado.groups == 0:
+        return match.group(0)
+    if compilado.groups == 1:
+        return match.group(1) or ''
+    return match.groups(default='')
+
+# Registro único del proceso, compartido por todos los extractores
+REGISTRO = RegistroPatrones()
+
+# Patrones comunes de config.field_mappings, compilados al importar
+PATRONES_COMUNES = REGISTRO.registrar(REGEX_PATTERNS)
\ No newline at end of file
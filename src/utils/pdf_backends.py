@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+"""
+Motores (backends) de lectura de texto para archivos PDF
+
+pdfplumber es puro Python y es la etapa más lenta del procesamiento masivo.
+PyMuPDF y pypdfium2 extraen la capa de texto con código nativo; para que los
+extractores reciban exactamente el mismo texto, las líneas se reconstruyen a
+partir de las coordenadas de las palabras con la misma tolerancia vertical
+que usa pdfplumber (3 puntos).
+
+Todos los motores aceptan la ruta del archivo o el contenido en memoria
+(bytes, memoryview, mmap u objetos tipo archivo) sin pasar por un temporal.
+"""
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+import pdfplumber
+
+# Importar motores opcionales con manejo de error
+try:
+    import pymupdf  # PyMuPDF >= 1.24
+    PYMUPDF_DISPONIBLE = True
+except ImportError:
+    try:
+        import fitz as pymupdf  # Nombre histórico de PyMuPDF
+        PYMUPDF_DISPONIBLE = True
+    except ImportError:
+        pymupdf = None
+        PYMUPDF_DISPONIBLE = False
+
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_DISPONIBLE = True
+except ImportError:
+    pdfium = None
+    PDFIUM_DISPONIBLE = False
+
+# Tolerancias equivalentes a los valores por defecto de pdfplumber
+TOLERANCIA_X = 3
+TOLERANCIA_Y = 3
+
+# Palabra posicionada: (x0, top, x1, bottom, texto)
+Palabra = Tuple[float, float, float, float, str]
+
+# Tabla como lista de filas con celdas de texto (None si la celda está vacía)
+Tabla = List[List[Optional[str]]]
+
+# Ruta al PDF o contenido en memoria
+FuentePDF = Union[str, os.PathLike, bytes, bytearray, memoryview, mmap.mmap, BinaryIO]
+
+def es_ruta(fuente: FuentePDF) -> bool:
+    """True si la fuente es una ruta en disco (y no contenido en memoria)"""
+    return isinstance(fuente, (str, os.PathLike))
+
+def nombre_fuente(fuente: FuentePDF) -> str:
+    """Nombre legible de la fuente para mensajes y registros"""
+    if es_ruta(fuente):
+        return Path(fuente).name
+    nombre = getattr(fuente, 'name', None)  # Archivos abiertos y miembros de ZIP
+    return Path(nombre).name if isinstance(nombre, str) else f"<{type(fuente).__name__} en memoria>"
+
+def como_archivo(fuente: FuentePDF) -> BinaryIO:
+    """
+    Contenido en memoria como objeto tipo archivo con seek (pdfplumber)
+    
+    bytes se envuelve en BytesIO, que comparte el buffer sin copiarlo; mmap
+    y los archivos con seek se usan directamente.
+    """
+    if hasattr(fuente, 'read') and hasattr(fuente, 'seek'):
+        if not getattr(fuente, 'seekable', lambda: True)():
+            return io.BytesIO(fuente.read())
+        fuente.seek(0)
+        return fuente
+    if hasattr(fuente, 'read'):
+        return io.BytesIO(fuente.read())
+    return io.BytesIO(fuente)
+
+def como_buffer(fuente: FuentePDF) -> Union[bytes, bytearray, memoryview]:
+    """Contenido en memoria como buffer, sin copiar cuando es posible (PyMuPDF)"""
+    if isinstance(fuente, (bytes, bytearray, memoryview)):
+        return fuente
+    if isinstance(fuente, mmap.mmap):
+        return memoryview(fuente)
+    if isinstance(fuente, io.BytesIO):
+        return fuente.getbuffer()
+    if getattr(fuente, 'seekable', lambda: False)():
+        fuente.seek(0)
+    return fuente.read()
+
+def agrupar_renglones(palabras: List[Palabra], tolerancia_y: float = TOLERANCIA_Y) -> List[List[Palabra]]:
+    """
+    Agrupa palabras por renglón
+    
+    Args:
+        palabras: Palabras con sus coordenadas (x0, top, x1, bottom, texto)
+        tolerancia_y: Diferencia máxima de 'top' para considerar el mismo renglón
+        
+    Returns:
+        Renglones de arriba hacia abajo, cada uno con sus palabras de izquierda a derecha
+    """
+    renglones = []
+    actual = []
+    top_base = None
+    
+    for palabra in sorted(palabras, key=lambda p: (p[1], p[0])):
+        if top_base is None or abs(palabra[1] - top_base) <= tolerancia_y:
+            actual.append(palabra)
+            if top_base is None:
+                top_base = palabra[1]
+        else:
+            renglones.append(actual)
+            actual = [palabra]
+            top_base = palabra[1]
+    
+    if actual:
+        renglones.append(actual)
+    
+    return [sorted(renglon, key=lambda p: p[0]) for renglon in renglones]
+
+def agrupar_lineas(palabras: List[Palabra], tolerancia_y: float = TOLERANCIA_Y) -> str:
+    """
+    Reconstruye el texto de una página agrupando palabras por renglón
+    
+    Args:
+        palabras: Palabras con sus coordenadas (x0, top, x1, bottom, texto)
+        tolerancia_y: Diferencia máxima de 'top' para considerar el mismo renglón
+        
+    Returns:
+        Texto de la página con un renglón por línea
+    """
+    return "\n".join(
+        " ".join(p[4] for p in renglon)
+        for renglon in agrupar_renglones(palabras, tolerancia_y)
+    )
+
+class BackendPDF:
+    """Interfaz común de los motores de lectura de PDF"""
+    
+    nombre = "base"
+    disponible = False
+    
+    def abrir(self, fuente: FuentePDF) -> Any:
+        """Abre el documento (ruta o contenido en memoria) y retorna el objeto nativo del motor"""
+        raise NotImplementedError
+    
+    def numero_paginas(self, documento: Any) -> int:
+        """Cantidad de páginas del documento"""
+        raise NotImplementedError
+    
+    def texto_pagina(self, documento: Any, numero_pagina: int) -> str:
+        """Texto de una página (base 0)"""
+        raise NotImplementedError
+    
+    def palabras_pagina(self, documento: Any, numero_pagina: int) -> List[Palabra]:
+        """Palabras de una página (base 0) con sus coordenadas"""
+        raise NotImplementedError
+    
+    def tablas_pagina(self, documento: Any, numero_pagina: int) -> Optional[List[Tabla]]:
+        """Tablas de una página; None si el motor no detecta tablas"""
+        return None
+    
+    def metadata(self, documento: Any) -> Dict[str, Any]:
+        """Metadatos del documento"""
+        return {}
+    
+    def liberar_pagina(self, documento: Any, numero_pagina: int):
+        """Libera los objetos que el motor guarda en caché para una página"""
+        pass
+    
+    def cerrar(self, documento: Any):
+        """Libera los recursos del documento"""
+        documento.close()
+
+class PdfPlumberBackend(BackendPDF):
+    """Motor de referencia: lento, pero conserva el layout y soporta tablas"""
+    
+    nombre = "pdfplumber"
+    disponible = True
+    
+    def abrir(self, fuente: FuentePDF) -> Any:
+        return pdfplumber.open(fuente if es_ruta(fuente) else como_archivo(fuente))
+    
+    def numero_paginas(self, documento: Any) -> int:
+        return len(documento.pages)
+    
+    def texto_pagina(self, documento: Any, numero_pagina: int) -> str:
+        return documento.pages[numero_pagina].extract_text() or ""
+    
+    def palabras_pagina(self, documento: Any, numero_pagina: int) -> List[Palabra]:
+        return [
+            (p['x0'], p['top'], p['x1'], p['bottom'], p['text'])
+            for p in documento.pages[numero_pagina].extract_words()
+        ]
+    
+    def tablas_pagina(self, documento: Any, numero_pagina: int) -> Optional[List[Tabla]]:
+        return documento.pages[numero_pagina].extract_tables()
+    
+    def metadata(self, documento: Any) -> Dict[str, Any]:
+        return dict(documento.metadata or {})
+    
+    def liberar_pagina(self, documento: Any, numero_pagina: int):
+        # pdfplumber conserva caracteres y objetos de cada página hasta cerrar el PDF
+        documento.pages[numero_pagina].close()
+
+class PyMuPDFBackend(BackendPDF):
+    """Motor PyMuPDF (MuPDF nativo)"""
+    
+    nombre = "pymupdf"
+    disponible = PYMUPDF_DISPONIBLE
+    
+    def abrir(self, fuente: FuentePDF) -> Any:
+        if es_ruta(fuente):
+            return pymupdf.open(fuente)
+        return pymupdf.open(stream=como_buffer(fuente), filetype="pdf")
+    
+    def numero_paginas(self, documento: Any) -> int:
+        return documento.page_count
+    
+    def texto_pagina(self, documento: Any, numero_pagina: int) -> str:
+        return agrupar_lineas(self.palabras_pagina(documento, numero_pagina))
+    
+    def palabras_pagina(self, documento: Any, numero_pagina: int) -> List[Palabra]:
+        return [(p[0], p[1], p[2], p[3], p[4]) for p in documento[numero_pagina].get_text("words")]
+    
+    def tablas_pagina(self, documento: Any, numero_pagina: int) -> Optional[List[Tabla]]:
+        pagina = documento[numero_pagina]
+        if not hasattr(pagina, 'find_tables'):  # PyMuPDF < 1.23
+            return None
+        return [tabla.extract() for tabla in pagina.find_tables().tables]
+    
+    def metadata(self, documento: Any) -> Dict[str, Any]:
+        return {clave: valor for clave, valor in (documento.metadata or {}).items() if valor}
+
+class PdfiumBackend(BackendPDF):
+    """Motor pypdfium2 (PDFium nativo)"""
+    
+    nombre = "pdfium"
+    disponible = PDFIUM_DISPONIBLE
+    
+    def abrir(self, fuente: FuentePDF) -> Any:
+        if es_ruta(fuente) or isinstance(fuente, bytes):
+            return pdfium.PdfDocument(fuente)
+        if isinstance(fuente, io.IOBase):
+            return pdfium.PdfDocument(como_archivo(fuente))
+        # bytearray, memoryview y mmap no son tipos de entrada de pypdfium2
+        return pdfium.PdfDocument(bytes(como_buffer(fuente)))
+    
+    def numero_paginas(self, documento: Any) -> int:
+        return len(documento)
+    
+    def texto_pagina(self, documento: Any, numero_pagina: int) -> str:
+        return agrupar_lineas(self.palabras_pagina(documento, numero_pagina))
+    
+    def palabras_pagina(self, documento: Any, numero_pagina: int) -> List[Palabra]:
+        pagina = documento[numero_pagina]
+        try:
+            return self._palabras_pagina(pagina)
+        finally:
+            pagina.close()
+    
+    def _palabras_pagina(self, pagina: Any) -> List[Palabra]:
+        """Arma palabras a partir de las cajas de cada carácter"""
+        textpage = pagina.get_textpage()
+        try:
+            total = textpage.count_chars()
+            # PDFium marca los guiones de corte con U+FFFE
+            texto = textpage.get_text_range(0, total).replace('￾', '-')
+            alto = pagina.get_height()
+            
+            palabras = []
+            actual = None
+            for i, caracter in enumerate(texto[:total]):
+                if caracter.isspace():
+                    if actual:
+                        palabras.append(tuple(actual))
+                        actual = None
+                    continue
+                
+                izquierda, abajo, derecha, arriba = textpage.get_charbox(i, loose=True)
+                top = alto - arriba
+                
+                if actual and abs(actual[1] - top) <= TOLERANCIA_Y and izquierda - actual[2] <= TOLERANCIA_X:
+                    actual[2] = max(actual[2], derecha)
+                    actual[4] += caracter
+                else:
+                    if actual:
+                        palabras.append(tuple(actual))
+                    actual = [izquierda, top, derecha, alto - abajo, caracter]
+            
+            if actual:
+                palabras.append(tuple(actual))
+            
+            return palabras
+        finally:
+            textpage.close()
+    
+    def metadata(self, documento: Any) -> Dict[str, Any]:
+        return {clave: valor for clave, valor in documento.get_metadata_dict().items() if valor}
+
+# Motores registrados, en orden de preferencia (más rápido primero)
+BACKENDS = {
+    PyMuPDFBackend.nombre: PyMuPDFBackend,
+    PdfiumBackend.nombre: PdfiumBackend,
+    PdfPlumberBackend.nombre: PdfPlumberBackend
+}
+
+def backends_disponibles() -> List[str]:
+    """Nombres de los motores instalados, en orden de preferencia"""
+    return [nombre for nombre, clase in BACKENDS.items() if clase.disponible]
+
+def obtener_backend(nombre: Optional[str] = 'auto') -> BackendPDF:
+    """
+    Obtiene una instancia del motor solicitado
+    
+    Args:
+        nombre: Nombre del motor o 'auto' para el más rápido instalado
+        
+    Returns:
+        Instancia del motor; pdfplumber si el solicitado no está instalado
+    """
+    if not nombre or nombre == 'auto':
+        return BACKENDS[backends_disponibles()[0]]()
+    
+    if nombre not in BACKENDS:
+        raise ValueError(f"Motor PDF desconocido: {nombre}. Opciones: {', '.join(BACKENDS)}")
+    
+    clase = BACKENDS[nombre]
+    if not clase.disponible:
+        print(f"⚠️  Motor {nombre} no está instalado, usando pdfplumber")
+        return PdfPlumberBackend()
+    
+    return clase()
\ No newline at end of file
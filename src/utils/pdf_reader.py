@@ -2,92 +2,205 @@
 """
 Utilidades para lectura de archivos PDF
 """
-import pdfplumber
+import difflib
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .cache_texto import CacheTexto
+from .documento_pdf import DocumentoPDF
+from .pdf_backends import BackendPDF, FuentePDF, backends_disponibles, es_ruta, nombre_fuente, obtener_backend
+from .procesamiento_paralelo import UMBRAL_PAGINAS_PARALELO
+from .secciones import RastreadorSecciones
 
 class PDFReader:
     """Lector de archivos PDF optimizado"""
     
-    def __init__(self):
+    def __init__(self, backend: str = 'auto', cache: Optional[CacheTexto] = None,
+                 umbral_paralelo: Optional[int] = UMBRAL_PAGINAS_PARALELO):
+        """
+        Args:
+            backend: Motor de texto ('auto', 'pymupdf', 'pdfium' o 'pdfplumber').
+                'auto' usa el más rápido instalado; pdfplumber es el respaldo.
+            cache: Caché persistente de texto; los PDFs ya analizados no se
+                vuelven a abrir para leer su texto
+            umbral_paralelo: Páginas a partir de las cuales un reporte reparte
+                su texto entre procesos (None desactiva el reparto)
+        """
         self.encoding = 'utf-8'
+        self.backend: BackendPDF = obtener_backend(backend)
+        self.cache = cache
+        self.umbral_paralelo = umbral_paralelo
     
-    def extraer_texto(self, ruta_pdf: str) -> Optional[str]:
+    def extraer_texto(self, fuente: FuentePDF, secciones: Optional[List[str]] = None) -> Optional[str]:
         """
         Extrae todo el texto de un PDF
         
         Args:
-            ruta_pdf: Ruta al archivo PDF
+            fuente: Ruta al archivo PDF o contenido en memoria (bytes, memoryview,
+                mmap u objeto tipo archivo)
+            secciones: Secciones requeridas (nombres de SECCIONES). Si se indican,
+                solo se leen las páginas hasta que todas ellas terminan.
             
         Returns:
             Texto extraído o None si hay error
         """
         try:
-            ruta = Path(ruta_pdf)
-            
-            if not ruta.exists():
-                raise FileNotFoundError(f"El archivo {ruta_pdf} no existe")
-            
-            if not ruta.suffix.lower() == '.pdf':
-                raise ValueError(f"El archivo {ruta_pdf} no es un PDF")
+            if secciones:
+                paginas = self.iterar_paginas(fuente, secciones)
+                return "\n".join(texto for _, texto in paginas if texto).strip() or None
             
-            texto_completo = ""
-            
-            with pdfplumber.open(ruta_pdf) as pdf:
-                for pagina in pdf.pages:
-                    texto_pagina = pagina.extract_text()
-                    if texto_pagina:
-                        texto_completo += texto_pagina + "\n"
-            
-            return texto_completo.strip() if texto_completo else None
+            with self.abrir(fuente) as documento:
+                return documento.texto or None
             
         except Exception as e:
-            print(f"Error leyendo PDF {ruta_pdf}: {e}")
+            print(f"Error leyendo PDF {nombre_fuente(fuente)}: {e}")
             return None
     
-    def extraer_texto_pagina(self, ruta_pdf: str, numero_pagina: int) -> Optional[str]:
+    def abrir(self, fuente: FuentePDF, nombre: Optional[str] = None) -> DocumentoPDF:
+        """
+        Abre una sesión de documento que analiza el PDF una sola vez
+        
+        El contenido en memoria se abre directamente, sin archivo temporal.
+        
+        Args:
+            fuente: Ruta al archivo PDF o contenido en memoria (bytes, memoryview,
+                mmap u objeto tipo archivo)
+            nombre: Nombre del documento para contenido en memoria
+            
+        Returns:
+            DocumentoPDF que sirve texto, páginas, tablas y metadatos
+        """
+        if not es_ruta(fuente):
+            return DocumentoPDF(fuente, self.backend, self.cache, self.umbral_paralelo, nombre)
+        
+        ruta = Path(fuente)
+        
+        if not ruta.exists():
+            raise FileNotFoundError(f"El archivo {fuente} no existe")
+        
+        if not ruta.suffix.lower() == '.pdf':
+            raise ValueError(f"El archivo {fuente} no es un PDF")
+        
+        return DocumentoPDF(str(ruta), self.backend, self.cache, self.umbral_paralelo, nombre)
+    
+    def iterar_paginas(self, fuente: FuentePDF,
+                       secciones: Optional[List[str]] = None) -> Iterator[Tuple[int, str]]:
+        """
+        Entrega las páginas una a una, apenas el motor termina de analizar cada una
+        
+        El texto de las páginas ya entregadas no se conserva, así que el consumo
+        de memoria por reporte queda cerca de una sola página. El documento se
+        cierra al agotar o cerrar el generador.
+        
+        Args:
+            fuente: Ruta al archivo PDF o contenido en memoria (bytes, memoryview,
+                mmap u objeto tipo archivo)
+            secciones: Secciones requeridas (nombres de SECCIONES). Si se indican,
+                la lectura termina en la página donde se cierra la última de ellas.
+            
+        Yields:
+            Pares (número de página base 0, texto de la página)
+        """
+        rastreador = RastreadorSecciones(secciones) if secciones else None
+        
+        with self.abrir(fuente) as documento:
+            for numero, texto in documento.paginas(memorizar=False):
+                yield numero, texto
+                
+                if rastreador and rastreador.procesar_texto(texto):
+                    break
+    
+    def extraer_texto_pagina(self, fuente: FuentePDF, numero_pagina: int) -> Optional[str]:
         """
         Extrae texto de una página específica
         
         Args:
-            ruta_pdf: Ruta al archivo PDF
+            fuente: Ruta al archivo PDF o contenido en memoria (bytes, memoryview,
+                mmap u objeto tipo archivo)
             numero_pagina: Número de página (base 0)
             
         Returns:
             Texto de la página o None si hay error
         """
         try:
-            with pdfplumber.open(ruta_pdf) as pdf:
-                if numero_pagina < len(pdf.pages):
-                    return pdf.pages[numero_pagina].extract_text()
-                else:
-                    raise IndexError(f"La página {numero_pagina} no existe")
-                    
+            with self.abrir(fuente) as documento:
+                return documento.texto_pagina(numero_pagina)
+        
         except Exception as e:
-            print(f"Error leyendo página {numero_pagina} del PDF {ruta_pdf}: {e}")
+            print(f"Error leyendo página {numero_pagina} del PDF {nombre_fuente(fuente)}: {e}")
             return None
     
-    def obtener_info_pdf(self, ruta_pdf: str) -> dict:
+    def obtener_info_pdf(self, fuente: FuentePDF) -> dict:
         """
         Obtiene información básica del PDF
         
         Args:
-            ruta_pdf: Ruta al archivo PDF
+            fuente: Ruta al archivo PDF o contenido en memoria (bytes, memoryview,
+                mmap u objeto tipo archivo)
             
         Returns:
             Dict con información del PDF
         """
         try:
-            with pdfplumber.open(ruta_pdf) as pdf:
-                return {
-                    'numero_paginas': len(pdf.pages),
-                    'metadata': pdf.metadata,
-                    'archivo': Path(ruta_pdf).name,
-                    'tamaño': Path(ruta_pdf).stat().st_size
-                }
-                
+            with self.abrir(fuente) as documento:
+                return documento.info()
+        
         except Exception as e:
             return {
                 'error': str(e),
-                'archivo': Path(ruta_pdf).name
-            }
\ No newline at end of file
+                'archivo': nombre_fuente(fuente)
+            }
+    
+    def comparar_backends(self, fuente: FuentePDF, backends: Optional[List[str]] = None,
+                          extractor: Any = None) -> Dict[str, Any]:
+        """
+        Compara el texto (y opcionalmente los campos extraídos) entre motores
+        
+        pdfplumber se toma como referencia: cualquier diferencia de líneas o de
+        campos indica que el motor rápido no es equivalente para ese archivo.
+        
+        Args:
+            fuente: Ruta al archivo PDF o contenido en memoria
+            backends: Motores a comparar (por defecto todos los instalados)
+            extractor: Extractor opcional con método extract(texto, archivo)
+            
+        Returns:
+            Dict por motor con tiempo, caracteres, líneas diferentes y campos diferentes
+        """
+        backends = backends or backends_disponibles()
+        nombre_archivo = nombre_fuente(fuente)
+        resultados = {}
+        
+        for nombre in ['pdfplumber'] + [b for b in backends if b != 'pdfplumber']:
+            lector = PDFReader(nombre)
+            inicio = time.perf_counter()
+            texto = lector.extraer_texto(fuente) or ""
+            resultados[nombre] = {
+                'tiempo': time.perf_counter() - inicio,
+                'caracteres': len(texto),
+                'texto': texto
+            }
+            if extractor is not None:
+                resultados[nombre]['campos'] = extractor.extract(texto, nombre_archivo)
+        
+        referencia = resultados['pdfplumber']
+        for nombre, resultado in resultados.items():
+            diferencias = [
+                linea for linea in difflib.unified_diff(
+                    referencia['texto'].splitlines(), resultado['texto'].splitlines(),
+                    lineterm='', n=0
+                )
+                if linea[:1] in '+-' and linea[:3] not in ('---', '+++')
+            ]
+            resultado['lineas_diferentes'] = len(diferencias)
+            resultado['texto_identico'] = not diferencias
+            
+            if extractor is not None:
+                campos_ref = referencia['campos']
+                resultado['campos_diferentes'] = [
+                    campo for campo in set(campos_ref) | set(resultado['campos'])
+                    if campo != '_metadata' and campos_ref.get(campo) != resultado['campos'].get(campo)
+                ]
+        
+        return resultados
\ No newline at end of file
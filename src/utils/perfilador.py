@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+Perfil de costo y aciertos de los patrones de cada campo
+
+Todos los extractores buscan a través de utils.patrones.REGISTRO, así que el
+perfil se toma ahí: mientras perfilar() está activo, cada búsqueda registra su
+duración, la posición de la primera coincidencia y si acertó, agrupadas por
+campo y patrón a lo largo de todos los documentos del corpus.
+
+El campo es el que se declara con PerfiladorPatrones.campo() (lo hacen el
+motor de FIELD_SPECS y ExtractorDiagnostico); si no hay uno declarado, es el
+método del extractor que hizo la búsqueda (p.ej. 'extraer_consultado_por').
+El reporte ordena los patrones por tiempo total, para ver cuáles de los
+patrones en cascada cuestan más y cuáles nunca aciertan.
+"""
+import json
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple, Union
+
+import pandas as pd
+
+from .patrones import REGISTRO, RegistroPatrones
+
+# Métodos auxiliares que buscan en nombre de otro: el campo es quien los llamó
+AUXILIARES = {
+    'buscar_patron', 'buscar_multiples_patrones', 'extraer_campo', 'extraer_multiple_lineas',
+    'extraer_numeros_linea', 'extraer_con_diagnostico', '<lambda>', '<listcomp>', '<genexpr>'
+}
+
+# Módulos del propio registro (sus marcos se saltan al buscar el campo)
+_MODULOS_REGISTRO = {Path(__file__).name, 'patrones.py', 'contextlib.py'}
+
+def _campo_llamador() -> str:
+    """Método del extractor que hizo la búsqueda"""
+    marco = sys._getframe(1)
+    while marco is not None:
+        codigo = marco.f_code
+        if Path(codigo.co_filename).name not in _MODULOS_REGISTRO and codigo.co_name not in AUXILIARES:
+            return codigo.co_name
+        marco = marco.f_back
+    return '<desconocido>'
+
+class PerfiladorPatrones:
+    """Tiempo, posición y acierto de cada búsqueda, por campo y patrón"""
+    
+    def __init__(self):
+        self.documentos: List[str] = []
+        self.tiempo_documentos: Dict[str, float] = {}
+        self._filas: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._local = threading.local()
+        self._bloqueo = threading.Lock()
+    
+    @contextmanager
+    def campo(self, nombre: str) -> Iterator[None]:
+        """Atribuye a un campo las búsquedas hechas dentro del bloque"""
+        anterior = getattr(self._local, 'campo', None)
+        self._local.campo = nombre
+        try:
+            yield
+        finally:
+            self._local.campo = anterior
+    
+    @contextmanager
+    def documento(self, nombre: str) -> Iterator[None]:
+        """Marca las búsquedas del bloque como de un documento del corpus"""
+        anterior = getattr(self._local, 'documento', None)
+        self._local.documento = nombre
+        self.documentos.append(nombre)
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tiempo_documentos[nombre] = time.perf_counter() - inicio
+            self._local.documento = anterior
+    
+    def registrar(self, compilado: Pattern, segundos: float, resultado: Any, texto: str):
+        """
+        Registra una búsqueda (lo llama RegistroPatrones)
+        
+        Args:
+            compilado: Patrón usado
+            segundos: Duración de la búsqueda
+            resultado: Match, lista de findall o None
+            texto: Texto examinado (para ubicar la primera coincidencia de findall)
+        """
+        if isinstance(resultado, list):
+            # findall no trae posiciones: se ubica la primera fuera del tiempo medido
+            primera = compilado.search(texto) if resultado else None
+        else:
+            primera = resultado
+        
+        campo = getattr(self._local, 'campo', None) or _campo_llamador()
+        documento = getattr(self._local, 'documento', None)
+        with self._bloqueo:
+            fila = self._filas.get((campo, compilado.pattern))
+            if fila is None:
+                fila = self._filas[(campo, compilado.pattern)] = {
+                    'llamadas': 0, 'aciertos': 0, 'tiempo_total': 0.0, 'tiempo_maximo': 0.0,
+                    'posiciones': [], 'documentos': set()
+                }
+            fila['llamadas'] += 1
+            fila['tiempo_total'] += segundos
+            fila['tiempo_maximo'] = max(fila['tiempo_maximo'], segundos)
+            if primera is not None:
+                fila['aciertos'] += 1
+                fila['posiciones'].append(primera.start())
+            if documento is not None:
+                fila['documentos'].add(documento)
+    
+    def reporte(self) -> List[Dict[str, Any]]:
+        """
+        Patrones ordenados de mayor a menor tiempo total
+        
+        Returns:
+            Una fila por (campo, patrón) con llamadas, aciertos, tasa de acierto,
+            tiempos en milisegundos, posición media y mínima de la coincidencia,
+            documentos en que se usó y 'nunca_acierta'
+        """
+        filas = []
+        for (campo, patron), fila in self._filas.items():
+            posiciones = fila['posiciones']
+            filas.append({
+                'campo': campo,
+                'patron': patron,
+                'llamadas': fila['llamadas'],
+                'aciertos': fila['aciertos'],
+                'fallos': fila['llamadas'] - fila['aciertos'],
+                'tasa_acierto': round(fila['aciertos'] / fila['llamadas'], 4),
+                'tiempo_total_ms': round(fila['tiempo_total'] * 1000, 3),
+                'tiempo_medio_ms': round(fila['tiempo_total'] * 1000 / fila['llamadas'], 4),
+                'tiempo_maximo_ms': round(fila['tiempo_maximo'] * 1000, 3),
+                'posicion_media': round(sum(posiciones) / len(posiciones)) if posiciones else None,
+                'posicion_minima': min(posiciones) if posiciones else None,
+                'documentos': len(fila['documentos']),
+                'nunca_acierta': fila['aciertos'] == 0
+            })
+        filas.sort(key=lambda f: f['tiempo_total_ms'], reverse=True)
+        return filas
+    
+    def resumen(self) -> Dict[str, Any]:
+        """Totales del corpus"""
+        reporte = self.reporte()
+        return {
+            'documentos': len(self.documentos),
+            'patrones': len(reporte),
+            'busquedas': sum(f['llamadas'] for f in reporte),
+            'tiempo_busqueda_ms': round(sum(f['tiempo_total_ms'] for f in reporte), 3),
+            'patrones_sin_acierto': sum(1 for f in reporte if f['nunca_acierta']),
+            'tiempo_sin_acierto_ms': round(sum(f['tiempo_total_ms'] for f in reporte if f['nunca_acierta']), 3)
+        }
+    
+    def guardar_json(self, ruta: Union[str, Path]) -> Path:
+        """Guarda resumen y reporte en JSON"""
+        ruta = Path(ruta)
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump({'resumen': self.resumen(), 'patrones': self.reporte()}, archivo, ensure_ascii=False, indent=2)
+        return ruta
+    
+    def guardar_excel(self, ruta: Union[str, Path]) -> Path:
+        """Guarda el reporte en una hoja de Excel (y los que nunca aciertan en otra)"""
+        ruta = Path(ruta)
+        reporte = pd.DataFrame(self.reporte())
+        with pd.ExcelWriter(ruta, engine='openpyxl') as writer:
+            reporte.to_excel(writer, sheet_name='Perfil_Patrones', index=False)
+            if not reporte.empty:
+                reporte[reporte['nunca_acierta']].to_excel(writer, sheet_name='Sin_Acierto', index=False)
+            pd.DataFrame([self.resumen()]).to_excel(writer, sheet_name='Resumen', index=False)
+        return ruta
+
+@contextmanager
+def perfilar(registro: RegistroPatrones = REGISTRO,
+             perfilador: Optional[PerfiladorPatrones] = None) -> Iterator[PerfiladorPatrones]:
+    """
+    Activa el perfil en el registro de patrones durante el bloque
+    
+    Args:
+        registro: Registro donde buscan los extractores
+        perfilador: Perfil a continuar (por defecto uno nuevo)
+        
+    Yields:
+        Perfilador con las búsquedas registradas
+    """
+    perfilador = perfilador or PerfiladorPatrones()
+    anterior = registro.perfilador
+    registro.perfilador = perfilador
+    try:
+        yield perfilador
+    finally:
+        registro.perfilador = anterior
+
+def perfilar_corpus(extractor, archivos: Iterable[Union[str, Path]], lector=None) -> PerfiladorPatrones:
+    """
+    Ejecuta un extractor sobre un corpus de PDFs con el perfil activo
+    
+    Args:
+        extractor: Cualquier extractor con método extract(texto, archivo)
+        archivos: Rutas de los PDFs
+        lector: Lector con extraer_texto(ruta) (por defecto PDFReader)
+        
+    Returns:
+        Perfilador con las búsquedas de todos los documentos
+    """
+    if lector is None:
+        from .pdf_reader import PDFReader
+        lector = PDFReader()
+    
+    with perfilar() as perfilador:
+        for ruta in archivos:
+            texto = lector.extraer_texto(str(ruta)) or ""
+            with perfilador.documento(Path(ruta).name):
+                extractor.extract(texto, Path(ruta).name)
+    return perfilador
\ No newline at end of file
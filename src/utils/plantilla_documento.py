@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Renglones repetidos del reporte (pie de página y encabezados de tabla)
+
+Cada página termina con el mismo pie ("DELAGRO SAS 2025/08/26 16:01:48 Página
+N de 6") y cada obligación o sector repite los renglones de encabezado de su
+tabla ("Tipo Num Cta 9 Estado de la Fecha...", "Desacuerdo con la Estado del
+Marca/..."). Esos renglones son buena parte del texto y producen coincidencias
+falsas, así que se aprenden una vez por documento y se quitan antes de extraer:
+
+- El pie se aprende del primer renglón que termina en "Página N de M" (entidad,
+  fecha y hora cambian de un reporte a otro).
+- Un encabezado de tabla es un bloque de renglones consecutivos que aparecen
+  siempre juntos y en el mismo orden, varias veces. Los datos que se repiten
+  ("Orig: Normal", vectores iguales) no forman bloques fijos y se conservan.
+  
+Los encabezados de sección, "Sector ..." y "TRIMESTRE ..." nunca se quitan:
+los lectores de tablas los usan para saber dónde están.
+"""
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Optional, Set
+
+from .secciones import PATRON_ENCABEZADOS
+from .tablas_palabras import PATRON_SECTOR, PATRON_TRIMESTRE
+
+# Veces que debe aparecer un bloque para considerarlo encabezado de tabla
+MIN_REPETICIONES = 3
+
+# Renglones mínimos de un bloque (los encabezados de tabla ocupan 3 o más)
+MIN_LINEAS_BLOQUE = 3
+
+# Pie de página: lo que va antes de "Página N de M" es fijo en todo el documento
+PATRON_PIE = re.compile(r"^(.*\S) Página \d+ de \d+$")
+
+def protegido(linea: str) -> bool:
+    """Renglones que marcan secciones, sectores o trimestres"""
+    return bool(PATRON_ENCABEZADOS.match(linea) or PATRON_SECTOR.match(linea) or PATRON_TRIMESTRE.match(linea))
+
+class PlantillaDocumento:
+    """Renglones repetidos de un documento, aprendidos de su propio texto"""
+    
+    def __init__(self, pie: Optional[str] = None, repetidos: Optional[Set[str]] = None):
+        """
+        Args:
+            pie: Inicio fijo del pie de página (p.ej. "DELAGRO SAS 2025/08/26 16:01:48")
+            repetidos: Renglones de los encabezados de tabla repetidos
+        """
+        self.pie = pie
+        self.repetidos: Set[str] = repetidos or set()
+    
+    @classmethod
+    def aprender(cls, texto: str, minimo: int = MIN_REPETICIONES) -> 'PlantillaDocumento':
+        """
+        Aprende el pie de página y los bloques de encabezado de un documento
+        
+        Args:
+            texto: Texto completo del documento
+            minimo: Veces que debe repetirse un bloque
+            
+        Returns:
+            Plantilla del documento
+        """
+        lineas = [linea.strip() for linea in texto.split('\n')]
+        
+        pie = next((match.group(1) for match in map(PATRON_PIE.match, lineas) if match), None)
+        plantilla = cls(pie)
+        lineas = [linea for linea in lineas if linea and not plantilla.es_pie(linea)]
+        
+        conteo = Counter(lineas)
+        candidatos = {linea for linea, veces in conteo.items() if veces >= minimo and not protegido(linea)}
+        
+        # Vecinos de cada candidato (sin contar el pie, que puede cortar un bloque)
+        siguientes: Dict[str, Set[str]] = defaultdict(set)
+        anteriores: Dict[str, Set[str]] = defaultdict(set)
+        for anterior, siguiente in zip(lineas, lineas[1:]):
+            if anterior in candidatos:
+                siguientes[anterior].add(siguiente)
+            if siguiente in candidatos:
+                anteriores[siguiente].add(anterior)
+        
+        # Dos renglones van enlazados si uno siempre sigue al otro y aparecen las mismas veces
+        enlaces: Dict[str, str] = {}
+        for linea in candidatos:
+            if len(siguientes[linea]) == 1:
+                siguiente = next(iter(siguientes[linea]))
+                if (siguiente in candidatos and anteriores[siguiente] == {linea}
+                        and conteo[siguiente] == conteo[linea]):
+                    enlaces[linea] = siguiente
+        
+        # Cadenas de enlaces con suficientes renglones
+        for inicio in set(enlaces) - set(enlaces.values()):
+            bloque = [inicio]
+            while bloque[-1] in enlaces and len(bloque) <= len(enlaces):
+                bloque.append(enlaces[bloque[-1]])
+            if len(bloque) >= MIN_LINEAS_BLOQUE:
+                plantilla.repetidos.update(bloque)
+        
+        return plantilla
+    
+    def es_pie(self, linea: str) -> bool:
+        """True si el renglón es el pie de página (también el truncado "... Página")"""
+        return self.pie is not None and linea.startswith(self.pie) and (
+            linea == f"{self.pie} Página" or PATRON_PIE.match(linea) is not None)
+    
+    def limpiar(self, texto: str) -> str:
+        """
+        Quita el pie de página y los encabezados de tabla repetidos
+        
+        Args:
+            texto: Texto del documento (o de alguna de sus páginas)
+            
+        Returns:
+            Texto sin esos renglones
+        """
+        return "\n".join(
+            linea for linea in texto.split('\n')
+            if linea.strip() not in self.repetidos and not self.es_pie(linea.strip())
+        )
+
+def limpiar_texto(texto: str) -> str:
+    """
+    Aprende la plantilla del documento y la quita de su texto
+    
+    Args:
+        texto: Texto completo del documento
+        
+    Returns:
+        Texto sin pie de página ni encabezados de tabla repetidos
+    """
+    return PlantillaDocumento.aprender(texto).limpiar(texto)
\ No newline at end of file
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Pool de procesos para leer y extraer PDFs en paralelo
+
+pdfplumber es puro Python: en un solo hilo el procesamiento masivo usa un solo
+núcleo. Cada proceso trabajador recibe una vez la tarea (lector + extractor) y
+luego solo las rutas de los archivos, así que la tarea debe ser serializable
+con pickle (clases definidas a nivel de módulo).
+
+Los reportes muy grandes (lotes consolidados con decenas de páginas) también
+pueden repartir sus páginas entre procesos para no retrasar todo el lote,
+salvo dentro de un proceso trabajador del pool: ahí el lote ya ocupa los
+núcleos y un pool anidado multiplicaría los procesos (y la memoria).
+
+Para corridas de decenas de miles de archivos la memoria se mantiene acotada:
+la cantidad de procesos y el tamaño de lote salen de la RAM disponible y los
+procesos se reciclan después de N archivos o al superar un límite de RSS.
+
+Si un proceso muere (sin memoria, una falla en código nativo) el pool queda
+inutilizable: los archivos que estaban en curso se reportan con error y el
+resto del lote sigue en una nueva generación de procesos.
+"""
+import gc
+import math
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Importar psutil con manejo de error
+try:
+    import psutil  # Para dimensionar lotes según la memoria
+    PSUTIL_DISPONIBLE = True
+except ImportError:
+    PSUTIL_DISPONIBLE = False
+
+# Resultado por archivo: (índice en la entrada, ruta, resultado, error o None)
+ResultadoArchivo = Tuple[int, str, Any, Optional[str]]
+
+# Páginas a partir de las cuales un documento reparte su texto entre procesos
+UMBRAL_PAGINAS_PARALELO = 40
+
+# Mínimo de páginas por bloque: cada proceso abre el PDF, lo que tiene un costo fijo
+PAGINAS_POR_BLOQUE = 8
+
+# Memoria estimada por proceso trabajador (pdfplumber con un reporte grande)
+MEMORIA_POR_TRABAJADOR_MB = 400
+
+# RSS máximo de un proceso trabajador antes de reciclar los procesos
+LIMITE_RSS_MB = 1024
+
+# Error de los archivos que estaban en curso cuando un proceso murió
+ERROR_PROCESO_CAIDO = "El proceso trabajador terminó abruptamente"
+
+# Tarea del proceso trabajador, recibida una sola vez al iniciar
+_tarea: Optional[Callable[[str], Any]] = None
+
+def _inicializar_trabajador(tarea: Callable[[str], Any]):
+    """Guarda la tarea en el proceso trabajador"""
+    global _tarea
+    _tarea = tarea
+
+def _ejecutar(tarea: Callable[[str], Any], indice: int, ruta: str) -> ResultadoArchivo:
+    """Ejecuta la tarea sobre un archivo capturando el error como texto"""
+    try:
+        return indice, ruta, tarea(ruta), None
+    except Exception as e:
+        return indice, ruta, None, str(e)
+
+def _ejecutar_en_trabajador(indice: int, ruta: str) -> Tuple[ResultadoArchivo, float]:
+    """Ejecuta la tarea y reporta el RSS del proceso (MB) para decidir el reciclaje"""
+    resultado = _ejecutar(_tarea, indice, ruta)
+    rss_mb = psutil.Process().memory_info().rss / (1024 * 1024) if PSUTIL_DISPONIBLE else 0.0
+    return resultado, rss_mb
+
+def trabajadores_por_defecto() -> int:
+    """Núcleos disponibles menos uno (para la interfaz), mínimo uno"""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+def configuracion_memoria() -> Dict[str, int]:
+    """
+    Procesos y archivos por proceso según la RAM disponible
+    
+    Returns:
+        Dict con 'trabajadores' y 'archivos_por_trabajador' (tamaño de lote
+        de cada proceso antes de reciclarlo)
+    """
+    if PSUTIL_DISPONIBLE:
+        memoria_disponible_gb = psutil.virtual_memory().available / (1024**3)
+        # Se deja un 30% de la memoria disponible para el sistema y el Excel
+        por_memoria = int(memoria_disponible_gb * 1024 * 0.7 // MEMORIA_POR_TRABAJADOR_MB)
+        trabajadores = max(1, min(trabajadores_por_defecto(), por_memoria))
+        archivos_por_trabajador = min(100, max(10, int(memoria_disponible_gb * 10)))  # 10-100 archivos
+    else:
+        # Sin psutil, usar una configuración conservadora
+        trabajadores = min(2, trabajadores_por_defecto())
+        archivos_por_trabajador = 25
+    
+    return {'trabajadores': trabajadores, 'archivos_por_trabajador': archivos_por_trabajador}
+
+def _textos_bloque(fuente: str, backend: Any, inicio: int, fin: int) -> List[str]:
+    """Texto de las páginas [inicio, fin) de un documento, en un proceso aparte"""
+    documento = backend.abrir(fuente)
+    try:
+        return [backend.texto_pagina(documento, numero) for numero in range(inicio, fin)]
+    finally:
+        backend.cerrar(documento)
+
+def en_proceso_trabajador() -> bool:
+    """True si el código corre en un proceso hijo (por ejemplo, un trabajador del pool)"""
+    return multiprocessing.parent_process() is not None
+
+def extraer_textos_en_paralelo(fuente: str, backend: Any, numero_paginas: int,
+                               trabajadores: Optional[int] = None) -> Optional[List[str]]:
+    """
+    Reparte las páginas de un documento en bloques contiguos entre procesos
+    
+    Args:
+        fuente: Ruta al archivo PDF
+        backend: Motor de lectura (instancia de BackendPDF)
+        numero_paginas: Cantidad de páginas del documento
+        trabajadores: Procesos a usar (None = trabajadores_por_defecto)
+        
+    Returns:
+        Texto de cada página en orden, o None si no vale la pena repartir o si
+        ya se está en un proceso trabajador
+    """
+    if en_proceso_trabajador():
+        return None
+    
+    trabajadores = min(trabajadores or trabajadores_por_defecto(),
+                       numero_paginas // PAGINAS_POR_BLOQUE)
+    if trabajadores <= 1:
+        return None
+    
+    tamaño = math.ceil(numero_paginas / trabajadores)
+    inicios = list(range(0, numero_paginas, tamaño))
+    finales = [min(inicio + tamaño, numero_paginas) for inicio in inicios]
+    
+    # map conserva el orden de los bloques, así que las páginas quedan en orden
+    with ProcessPoolExecutor(max_workers=len(inicios)) as pool:
+        bloques = pool.map(_textos_bloque, repeat(fuente), repeat(backend), inicios, finales)
+        return list(chain.from_iterable(bloques))
+
+class PoolExtraccion:
+    """Ejecuta una tarea por archivo en varios procesos, reciclándolos por lotes"""
+    
+    def __init__(self, tarea: Callable[[str], Any], trabajadores: Optional[int] = None,
+                 archivos_por_trabajador: Optional[int] = None,
+                 limite_rss_mb: Optional[float] = LIMITE_RSS_MB):
+        """
+        Args:
+            tarea: Invocable serializable que recibe la ruta de un PDF
+            trabajadores: Cantidad de procesos (None = según núcleos y RAM
+                disponible; 1 procesa en el proceso actual, sin pool)
+            archivos_por_trabajador: Archivos por proceso antes de reciclar
+                los procesos (None = según la RAM disponible)
+            limite_rss_mb: RSS de un proceso que fuerza el reciclaje (None = sin límite)
+        """
+        configuracion = configuracion_memoria()
+        self.tarea = tarea
+        self.trabajadores = trabajadores or configuracion['trabajadores']
+        self.archivos_por_trabajador = archivos_por_trabajador or configuracion['archivos_por_trabajador']
+        self.limite_rss_mb = limite_rss_mb
+        self.reciclajes = 0
+        self.caidas = 0  # Generaciones de procesos interrumpidas por un proceso muerto
+    
+    @property
+    def tamaño_lote(self) -> int:
+        """Archivos que procesa cada generación de procesos antes de reciclarse"""
+        return self.trabajadores * self.archivos_por_trabajador
+    
+    def procesar(self, rutas: Iterable[str], ordenado: bool = True) -> Iterator[ResultadoArchivo]:
+        """
+        Procesa los archivos y entrega un resultado por archivo
+        
+        Args:
+            rutas: Rutas de los PDFs
+            ordenado: True entrega en el orden de entrada; False a medida que
+                cada archivo termina (el índice permite reordenar después)
+                
+        Yields:
+            Tuplas (índice, ruta, resultado, error)
+        """
+        rutas = [str(ruta) for ruta in rutas]
+        
+        if self.trabajadores <= 1 or len(rutas) <= 1:
+            for indice, ruta in enumerate(rutas):
+                yield _ejecutar(self.tarea, indice, ruta)
+            return
+        
+        pendientes = list(enumerate(rutas))[::-1]  # pop() entrega en orden de entrada
+        listos: Dict[int, ResultadoArchivo] = {}  # Terminados fuera de orden
+        siguiente = 0  # Próximo índice a entregar en modo ordenado
+        ventana = self.trabajadores * 2  # Archivos enviados a la vez
+        
+        while pendientes:
+            # Cada generación de procesos atiende un lote y luego se recicla
+            procesados = 0
+            reciclar = False
+            caida = False
+            
+            with ProcessPoolExecutor(
+                max_workers=min(self.trabajadores, len(pendientes)),
+                initializer=_inicializar_trabajador,
+                initargs=(self.tarea,)
+            ) as pool:
+                en_curso = set()
+                archivos: Dict[Future, Tuple[int, str]] = {}
+                try:
+                    while True:
+                        while (pendientes and not reciclar and len(en_curso) < ventana
+                               and procesados + len(en_curso) < self.tamaño_lote
+                               and (not ordenado or pendientes[-1][0] < siguiente + ventana * 2)):
+                            indice, ruta = pendientes.pop()
+                            try:
+                                futuro = pool.submit(_ejecutar_en_trabajador, indice, ruta)
+                            except BrokenProcessPool:
+                                # Se rompió antes de recibirlo: queda para la próxima generación
+                                pendientes.append((indice, ruta))
+                                reciclar = caida = True
+                                break
+                            archivos[futuro] = (indice, ruta)
+                            en_curso.add(futuro)
+                        
+                        if not en_curso:
+                            break
+                        
+                        hechos, en_curso = wait(en_curso, return_when=FIRST_COMPLETED)
+                        for futuro in hechos:
+                            indice, ruta = archivos.pop(futuro)
+                            try:
+                                resultado, rss_mb = futuro.result()
+                            except BrokenProcessPool as e:
+                                # Los demás archivos en curso fallan igual; no se envían más a este pool
+                                resultado, rss_mb = (indice, ruta, None, f"{ERROR_PROCESO_CAIDO}: {e}"), 0.0
+                                reciclar = caida = True
+                            procesados += 1
+                            if self.limite_rss_mb and rss_mb > self.limite_rss_mb:
+                                reciclar = True
+                            
+                            if ordenado:
+                                listos[resultado[0]] = resultado
+                            else:
+                                yield resultado
+                        
+                        while siguiente in listos:
+                            yield listos.pop(siguiente)
+                            siguiente += 1
+                finally:
+                    # Si el consumidor se detiene, no seguir con archivos pendientes
+                    for futuro in en_curso:
+                        futuro.cancel()
+            
+            if caida:
+                self.caidas += 1
+            
+            # Liberar memoria entre lotes, como el convertidor legacy
+            gc.collect()
+            if pendientes:
+                self.reciclajes += 1
\ No newline at end of file
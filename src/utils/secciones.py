@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Seguimiento de secciones del reporte DataCrédito a partir de sus encabezados
+Permite dejar de leer páginas cuando las secciones solicitadas ya terminaron
+"""
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from config.field_mappings import SECCIONES, ENCABEZADOS_SECCIONES, ENCABEZADOS_DELIMITADORES
+
+# Un solo patrón con un grupo nombrado por encabezado; cada coincidencia indica su sección
+PATRON_ENCABEZADOS = re.compile(
+    "|".join(
+        f"^(?P<{clave}>{patron})"
+        for clave, patron in {**ENCABEZADOS_SECCIONES, **ENCABEZADOS_DELIMITADORES}.items()
+    ),
+    re.MULTILINE
+)
+
+# Clave del texto anterior al primer encabezado (consulta y consultante)
+PREAMBULO = 'preambulo'
+
+def encontrar_encabezados(texto: str) -> Iterator[Tuple[str, int]]:
+    """
+    Recorre los encabezados de sección presentes en un texto
+    
+    Args:
+        texto: Texto de una o más páginas
+        
+    Yields:
+        Pares (clave de sección, posición del encabezado en el texto)
+    """
+    for match in PATRON_ENCABEZADOS.finditer(texto):
+        yield match.lastgroup, match.start()
+
+def validar_secciones(secciones: Iterable[str]) -> Set[str]:
+    """
+    Valida nombres de secciones contra config.field_mappings.SECCIONES
+    
+    Args:
+        secciones: Nombres de secciones
+        
+    Returns:
+        Conjunto de secciones válidas
+    """
+    solicitadas = set(secciones)
+    desconocidas = solicitadas - set(SECCIONES)
+    if desconocidas:
+        raise ValueError(
+            f"Secciones desconocidas: {', '.join(sorted(desconocidas))}. "
+            f"Opciones: {', '.join(SECCIONES)}"
+        )
+    return solicitadas
+
+class RastreadorSecciones:
+    """Sigue qué secciones se han abierto y cerrado mientras se leen páginas"""
+    
+    def __init__(self, secciones: Iterable[str]):
+        """
+        Args:
+            secciones: Secciones requeridas (nombres de SECCIONES)
+        """
+        self.solicitadas = validar_secciones(secciones)
+        self.vistas: Set[str] = set()
+        self.cerradas: Set[str] = set()
+        self.actual: Optional[str] = None
+    
+    def procesar_texto(self, texto: str) -> bool:
+        """
+        Registra los encabezados de una página
+        
+        Una sección queda cerrada cuando aparece el encabezado de otra.
+        Encabezados repetidos seguidos (p.ej. hábito de pago abiertas y
+        cerradas) continúan la misma sección.
+        
+        Args:
+            texto: Texto de la página
+            
+        Returns:
+            True si todas las secciones solicitadas ya se cerraron
+        """
+        for clave, _ in encontrar_encabezados(texto):
+            if clave == self.actual:
+                continue
+            if self.actual is not None:
+                self.cerradas.add(self.actual)
+            self.actual = clave
+            self.vistas.add(clave)
+        
+        return self.completo
+    
+    @property
+    def completo(self) -> bool:
+        """True si todas las secciones solicitadas se vieron y se cerraron"""
+        return self.solicitadas <= self.cerradas
+
+class IndiceSecciones:
+    """Posiciones de las secciones de un reporte, calculadas una sola vez"""
+    
+    def __init__(self, texto: str):
+        """
+        Args:
+            texto: Texto completo del reporte
+        """
+        self.texto = texto
+        self.tramos: List[Tuple[str, int, int]] = []  # (clave, inicio, fin) en orden
+        self._secciones: Dict[Tuple[str, ...], str] = {}
+        
+        clave_actual, inicio_actual = PREAMBULO, 0
+        for clave, inicio in encontrar_encabezados(texto):
+            if clave == clave_actual:
+                continue  # Encabezado repetido: la sección continúa
+            self._agregar(clave_actual, inicio_actual, inicio)
+            clave_actual, inicio_actual = clave, inicio
+        self._agregar(clave_actual, inicio_actual, len(texto))
+    
+    def _agregar(self, clave: str, inicio: int, fin: int):
+        if fin > inicio:
+            self.tramos.append((clave, inicio, fin))
+    
+    @property
+    def claves(self) -> Set[str]:
+        """Secciones presentes en el reporte"""
+        return {clave for clave, _, _ in self.tramos}
+    
+    def __contains__(self, clave: str) -> bool:
+        return any(actual == clave for actual, _, _ in self.tramos)
+    
+    def seccion(self, *claves: str) -> str:
+        """
+        Texto de una o más secciones, en el orden del reporte
+        
+        Una sección puede aparecer en varios tramos (p.ej. INFORMACIÓN BÁSICA
+        se repite al final); se unen todos.
+        
+        Args:
+            claves: Claves de ENCABEZADOS_SECCIONES, ENCABEZADOS_DELIMITADORES o PREAMBULO
+            
+        Returns:
+            Texto de las secciones ("" si ninguna está en el reporte)
+        """
+        texto = self._secciones.get(claves)
+        if texto is None:
+            buscadas = set(claves)
+            texto = self._secciones[claves] = "".join(
+                self.texto[inicio:fin] for clave, inicio, fin in self.tramos if clave in buscadas
+            )
+        return texto
\ No newline at end of file
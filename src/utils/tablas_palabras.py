@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""
+Tablas de DataCrédito reconstruidas a partir de las coordenadas de las palabras
+
+extract_tables() de pdfplumber es la operación más costosa del pipeline y en
+estos reportes entrega filas aplanadas que luego hay que volver a unir. Las
+tablas conocidas (Endeudamiento Actual, ENDEUDAMIENTO GLOBAL CLASIFICADO por
+TRIMESTRE y la Tendencia de endeudamiento de 12 meses) tienen columnas en
+posiciones fijas, así que basta agrupar las palabras por renglón y asignar
+cada una a su columna según su centro en x.
+
+Las filas salen tipadas: enteros para cantidades, miles de pesos como enteros,
+porcentajes como float y None para las celdas vacías o con '-'.
+"""
+import re
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .pdf_backends import Palabra, agrupar_renglones
+from .secciones import encontrar_encabezados
+
+# Fila tipada: nombre de columna -> valor, más 'tipo', 'sector' y 'pagina'
+Fila = Dict[str, Any]
+
+# Pie de página del reporte: "DELAGRO SAS 2025/08/26 16:01:48 Página 1 de 6"
+PATRON_PIE_PAGINA = re.compile(r"Página \d+ de \d+$")
+
+PATRON_SECTOR = re.compile(r"^Sector (\w+)$")
+PATRON_TRIMESTRE = re.compile(r"^TRIMESTRE (\d{4}/\d{2})$")
+
+# Entidad informante de ENDEUDAMIENTO GLOBAL: nombre, tipo y código de la
+# entidad ("BOGOTA - BC 0"); algunas no traen el tipo ("BANCAMIA 0") o ninguno
+ENTIDAD_INFORMANTE = r"(?P<entidad>.+?)(?: - (?P<tipo_entidad>[A-Z]{2}))?(?: (?P<codigo_entidad>\d+))?"
+PATRON_ENTIDAD = re.compile(rf"^{ENTIDAD_INFORMANTE}$")
+
+# Versión de las disposiciones: cambia cuando cambian las tablas leídas, para
+# que no se usen filas guardadas en caché con las disposiciones anteriores
+VERSION_DISPOSICIONES = 3
+
+# Meses de la Tendencia de endeudamiento (del más reciente al más antiguo)
+MESES_TENDENCIA = 12
+
+def _vacio(texto: str) -> bool:
+    return not texto or texto == '-'
+
+def a_texto(texto: str) -> Optional[str]:
+    """Celda de texto (None si está vacía)"""
+    return None if _vacio(texto) else texto
+
+def a_entero(texto: str) -> Optional[int]:
+    """Cantidad entera: '12' -> 12"""
+    return None if _vacio(texto) else int(texto)
+
+def a_miles(texto: str) -> Optional[int]:
+    """Valor en miles de pesos: '$38,459' o '38,459' -> 38459"""
+    return None if _vacio(texto) else int(texto.replace('$', '').replace(',', ''))
+
+def a_porcentaje(texto: str) -> Optional[float]:
+    """Porcentaje: '27.7%' -> 27.7"""
+    return None if _vacio(texto) else float(texto.rstrip('%'))
+
+def separar_entidad(texto: Optional[str]) -> Dict[str, Optional[str]]:
+    """'BOGOTA - BC 0' -> {'entidad': 'BOGOTA', 'tipo_entidad': 'BC', 'codigo_entidad': '0'}"""
+    match = PATRON_ENTIDAD.match(texto or '')
+    if match is None:
+        return {'entidad': a_texto(texto or ''), 'tipo_entidad': None, 'codigo_entidad': None}
+    return {nombre: a_texto(valor or '') for nombre, valor in match.groupdict().items()}
+
+def a_nivel_mora(texto: str) -> Optional[int]:
+    """Mora máxima del mes: 'N' (al día) -> 0, '4' -> 4"""
+    return 0 if texto == 'N' else a_entero(texto)
+
+class DisposicionTabla:
+    """Columnas en posición fija de una tabla conocida del reporte"""
+    
+    def __init__(self, seccion: str, columnas: List[Tuple[str, float, Callable[[str], Any]]],
+                 encabezados: str, totales: Dict[str, str]):
+        """
+        Args:
+            seccion: Clave de la sección (ENCABEZADOS_SECCIONES) donde está la tabla
+            columnas: (nombre, x donde empieza, conversor) de izquierda a derecha;
+                la primera columna es la etiqueta de la fila
+            encabezados: Patrón de los renglones de encabezado a ignorar
+            totales: Patrón de la etiqueta -> tipo de fila ('total_sector', 'total',
+                'meses' para el renglón con los meses de la tendencia)
+        """
+        self.seccion = seccion
+        self.columnas = columnas
+        self.inicios = [inicio for _, inicio, _ in columnas]
+        self.patron_encabezados = re.compile(encabezados)
+        self.totales = [(re.compile(patron), tipo) for patron, tipo in totales.items()]
+    
+    @property
+    def etiqueta(self) -> str:
+        """Nombre de la primera columna (etiqueta de la fila)"""
+        return self.columnas[0][0]
+    
+    def celdas(self, renglon: List[Palabra]) -> Dict[str, str]:
+        """Texto de cada columna de un renglón (solo columnas con palabras)"""
+        celdas: Dict[str, List[str]] = {}
+        for palabra in renglon:
+            centro = (palabra[0] + palabra[2]) / 2
+            indice = max(0, bisect_right(self.inicios, centro) - 1)
+            celdas.setdefault(self.columnas[indice][0], []).append(palabra[4])
+        return {nombre: " ".join(textos) for nombre, textos in celdas.items()}
+    
+    def fila(self, celdas: Dict[str, str]) -> Fila:
+        """Convierte las celdas de un renglón en una fila tipada"""
+        fila = {}
+        for nombre, _, conversor in self.columnas:
+            try:
+                fila[nombre] = conversor(celdas.get(nombre, ''))
+            except ValueError:
+                fila[nombre] = a_texto(celdas[nombre])  # Valor fuera de formato: se conserva el texto
+        
+        etiqueta = celdas.get(self.etiqueta, '')
+        fila['tipo'] = next((tipo for patron, tipo in self.totales if patron.match(etiqueta)), 'detalle')
+        return fila
+
+# Disposiciones de las tablas conocidas (puntos PDF, página de 1008 de ancho)
+DISPOSICIONES = {
+    'endeudamiento_actual': DisposicionTabla(
+        seccion='endeudamiento_actual',
+        columnas=[
+            ('cartera', 0, a_texto),
+            ('calidad', 235, a_texto),
+            ('num', 295, a_entero),
+            ('estado_actual', 340, a_texto),
+            ('calf', 450, a_texto),
+            ('valor_inicial', 485, a_miles),
+            ('saldo_actual', 570, a_miles),
+            ('saldo_mora', 650, a_miles),
+            ('valor_cuota', 735, a_miles),
+            ('participacion', 815, a_porcentaje),
+            ('porcentaje_deuda', 895, a_porcentaje)
+        ],
+        encabezados=r"^Carteras Calidad",
+        totales={r"Total Sector": 'total_sector', r"TOTAL$": 'total'}
+    ),
+    'endeudamiento_global': DisposicionTabla(
+        seccion='endeudamiento_global',
+        columnas=[
+            ('entidad', 0, a_texto),
+            ('calf', 170, a_texto),
+            ('num', 194, a_entero),
+            ('saldo_total', 222, a_miles),
+            ('comercial_nro', 280, a_entero),
+            ('comercial_miles', 320, a_miles),
+            ('hipotecario_nro', 385, a_entero),
+            ('hipotecario_miles', 430, a_miles),
+            ('consumo_nro', 490, a_entero),
+            ('consumo_miles', 525, a_miles),
+            ('microcredito_nro', 600, a_entero),
+            ('microcredito_miles', 635, a_miles),
+            ('garantia_tipo', 705, a_texto),
+            ('garantia_fecha_avaluo', 770, a_texto),
+            ('garantia_valor', 840, a_miles),
+            ('moneda', 895, a_texto),
+            ('fuente', 935, a_texto)
+        ],
+        encabezados=r"^(?:Consumo y Tarjeta|Comercial Hipotecario|Crédito$|Entidad Informante|Nro Miles)",
+        totales={r"TOTAL$": 'total_sector'}
+    ),
+    # Un concepto por renglón y una columna por mes; cada concepto tiene su
+    # propio tipo, así que las celdas se convierten en serie_tendencia()
+    'tendencia_endeudamiento': DisposicionTabla(
+        seccion='tendencia_endeudamiento',
+        columnas=[('concepto', 0, a_texto)] + [
+            (f'mes_{numero}', 312 + 55 * (numero - 1), a_texto) for numero in range(1, MESES_TENDENCIA + 1)
+        ],
+        encabezados=r"^Tendencia de endeudamiento$",
+        totales={r"Saldos y Moras$": 'meses'}
+    )
+}
+
+# Conceptos de la Tendencia de endeudamiento: patrón -> (serie, conversor);
+# '{}' en el nombre se reemplaza con el sector ("Moras máx Sector Real")
+CONCEPTOS_TENDENCIA = [
+    (re.compile(r"^Saldo Deuda Total en Mora"), 'saldo_mora', a_miles),
+    (re.compile(r"^Saldo Deuda Total"), 'saldo_total', a_miles),
+    (re.compile(r"^Moras máx Sector (\w+)"), 'mora_maxima_{}', a_nivel_mora),
+    (re.compile(r"^Total Moras Máximas"), 'mora_maxima_total', a_nivel_mora),
+    (re.compile(r"^Núm créditos con mora =\s*30"), 'creditos_mora_30', a_entero),
+    (re.compile(r"^Núm créditos con mora >=\s*60"), 'creditos_mora_60', a_entero)
+]
+
+class LectorTablas:
+    """Recorre las páginas y arma las filas de las tablas conocidas"""
+    
+    def __init__(self, disposiciones: Optional[Dict[str, DisposicionTabla]] = None):
+        """
+        Args:
+            disposiciones: Tablas a leer por clave de sección (por defecto DISPOSICIONES)
+        """
+        self.disposiciones = disposiciones or DISPOSICIONES
+        self.tablas: Dict[str, List[Fila]] = {seccion: [] for seccion in self.disposiciones}
+        self.seccion: Optional[str] = None
+        self.sector: Optional[str] = None
+        self.trimestre: Optional[str] = None
+    
+    def procesar_pagina(self, palabras: List[Palabra], numero_pagina: int):
+        """
+        Procesa las palabras de una página; la sección y el trimestre
+        continúan de una página a la siguiente
+        
+        Args:
+            palabras: Palabras de la página con sus coordenadas
+            numero_pagina: Número de página (base 0)
+        """
+        for renglon in agrupar_renglones(palabras):
+            texto = " ".join(p[4] for p in renglon)
+            
+            encabezados = list(encontrar_encabezados(texto))
+            if encabezados:
+                self.seccion = encabezados[-1][0]
+                self.sector = self.trimestre = None
+                continue
+            
+            disposicion = self.disposiciones.get(self.seccion)
+            if disposicion is None or PATRON_PIE_PAGINA.search(texto):
+                continue
+            
+            match = PATRON_TRIMESTRE.match(texto)
+            if match:
+                self.trimestre = match.group(1)
+                continue
+            
+            match = PATRON_SECTOR.match(texto)
+            if match:
+                self.sector = match.group(1)
+                continue
+            
+            if disposicion.patron_encabezados.match(texto):
+                continue
+            
+            fila = disposicion.fila(disposicion.celdas(renglon))
+            fila['sector'] = None if fila['tipo'] == 'total' else self.sector
+            if self.seccion == 'endeudamiento_global':
+                fila = {**separar_entidad(fila.pop('entidad')), **fila}
+                fila['trimestre'] = self.trimestre
+            fila['pagina'] = numero_pagina
+            self.tablas[self.seccion].append(fila)
+    
+    def resultado(self) -> Dict[str, List[Fila]]:
+        """Filas por tabla, con las sub-filas de Endeudamiento Actual ya asignadas a su cartera"""
+        if 'endeudamiento_actual' in self.tablas:
+            completar_carteras(self.tablas['endeudamiento_actual'])
+            # La etiqueta de una cartera con varias sub-filas puede venir sola en su renglón
+            self.tablas['endeudamiento_actual'] = [
+                fila for fila in self.tablas['endeudamiento_actual']
+                if fila['tipo'] != 'detalle' or fila['estado_actual'] is not None
+            ]
+        return self.tablas
+
+def completar_carteras(filas: List[Fila]):
+    """
+    Asigna cartera, calidad y número a las sub-filas de Endeudamiento Actual
+    
+    Una cartera con varias obligaciones ocupa un renglón por estado y su
+    etiqueta queda centrada verticalmente entre ellos, así que hay sub-filas
+    sin etiqueta antes y después. La columna 'Núm' indica cuántas son.
+    """
+    anterior: Optional[Fila] = None
+    restantes = 0
+    huerfanas: List[Fila] = []
+    
+    def asignar(fila: Fila, cartera: Fila):
+        for columna in ('cartera', 'calidad', 'num'):
+            fila[columna] = cartera[columna]
+    
+    for fila in filas:
+        if fila['tipo'] != 'detalle':
+            anterior, restantes, huerfanas = None, 0, []
+        elif fila['cartera'] is not None:
+            con_valores = 1 if fila['estado_actual'] is not None else 0
+            restantes = max(0, (fila['num'] or 1) - con_valores - len(huerfanas))
+            for huerfana in huerfanas:
+                asignar(huerfana, fila)
+            anterior, huerfanas = fila, []
+        elif anterior is not None and restantes > 0:
+            asignar(fila, anterior)
+            restantes -= 1
+        else:
+            huerfanas.append(fila)
+
+def serie_tendencia(filas: List[Fila]) -> Dict[str, List[Any]]:
+    """
+    Tendencia de endeudamiento como columnas tipadas de largo fijo
+    
+    Args:
+        filas: Filas de la tabla 'tendencia_endeudamiento'
+        
+    Returns:
+        Dict con 'mes' (etiquetas, p.ej. 'Jul 25') y una serie por concepto
+        ('saldo_total', 'saldo_mora', 'mora_maxima_financiero', ...), todas de
+        MESES_TENDENCIA valores del mes más reciente al más antiguo; None en los
+        meses sin dato. Vacío si el reporte no trae la tabla.
+    """
+    columnas = [f'mes_{numero}' for numero in range(1, MESES_TENDENCIA + 1)]
+    serie: Dict[str, List[Any]] = {}
+    
+    for fila in filas:
+        concepto = fila['concepto'] or ''
+        if fila['tipo'] == 'meses':
+            serie['mes'] = [fila[columna] for columna in columnas]
+            continue
+        
+        for patron, nombre, conversor in CONCEPTOS_TENDENCIA:
+            match = patron.match(concepto)
+            if match:
+                if match.groups():
+                    nombre = nombre.format(match.group(1).lower())
+                valores = []
+                for columna in columnas:
+                    try:
+                        valores.append(conversor(fila[columna] or ''))
+                    except ValueError:
+                        valores.append(None)
+                serie.setdefault(nombre, valores)
+                break
+    
+    return serie
+
+def paginas_relevantes(textos: Iterable[str], secciones: Iterable[str]) -> Iterator[int]:
+    """
+    Páginas que contienen alguna de las secciones, a partir del texto ya extraído
+    
+    Args:
+        textos: Texto de cada página, en orden
+        secciones: Claves de sección buscadas
+        
+    Yields:
+        Números de página (base 0)
+    """
+    secciones = set(secciones)
+    actual = None
+    
+    for numero, texto in enumerate(textos):
+        relevante = actual in secciones
+        for clave, _ in encontrar_encabezados(texto):
+            actual = clave
+            relevante = relevante or clave in secciones
+        if relevante:
+            yield numero
+
+def extraer_tablas(paginas: Iterable[Tuple[int, List[Palabra]]],
+                   disposiciones: Optional[Dict[str, DisposicionTabla]] = None) -> Dict[str, List[Fila]]:
+    """
+    Arma las tablas conocidas a partir de las palabras de cada página
+    
+    Args:
+        paginas: Pares (número de página base 0, palabras) en orden
+        disposiciones: Tablas a leer (por defecto DISPOSICIONES)
+        
+    Returns:
+        Dict por clave de sección con la lista de filas tipadas
+    """
+    lector = LectorTablas(disposiciones)
+    for numero, palabras in paginas:
+        lector.procesar_pagina(palabras, numero)
+    return lector.resultado()
\ No newline at end of file
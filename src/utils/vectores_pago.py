@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+Vectores de comportamiento de pago como arreglos NumPy
+
+Cada obligación trae 48 meses (del más reciente al más antiguo) con un carácter
+por mes: 'N' al día, '-' sin información y un dígito por nivel de mora
+(1 = 30 días ... 6 = 180 o más). Los vectores se decodifican a int8 con una
+tabla de búsqueda y las estadísticas se calculan para todo el lote de
+obligaciones a la vez, sin recorrer los meses en Python.
+"""
+from typing import Dict, Iterable
+
+import numpy as np
+
+MESES = 48
+
+# Códigos de cada mes
+AL_DIA = 0
+SIN_INFORMACION = -1  # '-' o cualquier carácter que no sea 'N' ni un dígito
+
+# Carácter (byte) -> código
+TABLA_CODIGOS = np.full(256, SIN_INFORMACION, dtype=np.int8)
+TABLA_CODIGOS[ord('N')] = AL_DIA
+TABLA_CODIGOS[ord('0'):ord('9') + 1] = np.arange(10, dtype=np.int8)
+
+def decodificar_vector(vector: str, meses: int = MESES) -> np.ndarray:
+    """
+    Decodifica un vector de pago
+    
+    Args:
+        vector: Caracteres del vector ('NNNN-NNN4...')
+        meses: Largo del arreglo (se completa con '-' o se recorta)
+        
+    Returns:
+        Arreglo int8 de `meses` códigos
+    """
+    return decodificar_lote([vector], meses)[0]
+
+def decodificar_lote(vectores: Iterable[str], meses: int = MESES) -> np.ndarray:
+    """
+    Decodifica varios vectores en una matriz (una fila por obligación)
+    
+    Args:
+        vectores: Vectores de pago; None o vacío cuenta como sin información
+        meses: Columnas de la matriz
+        
+    Returns:
+        Matriz int8 de forma (obligaciones, meses)
+    """
+    texto = "".join((vector or "")[:meses].ljust(meses, '-') for vector in vectores)
+    crudo = np.frombuffer(texto.encode('latin-1', errors='replace'), dtype=np.uint8)
+    return TABLA_CODIGOS[crudo].reshape(-1, meses)
+
+def racha_maxima(marcas: np.ndarray) -> np.ndarray:
+    """Racha más larga de valores True en cada fila de una matriz booleana"""
+    # Se avanza mes a mes sobre todas las filas a la vez: 48 operaciones
+    # vectoriales en lugar de una acumulación por fila
+    columnas = np.ascontiguousarray(marcas.T).view(np.int8)
+    racha = np.zeros(marcas.shape[0], dtype=np.int8)
+    mejor = np.zeros(marcas.shape[0], dtype=np.int8)
+    for columna in columnas:
+        np.add(racha, 1, out=racha)
+        np.multiply(racha, columna, out=racha)
+        np.maximum(mejor, racha, out=mejor)
+    return mejor
+
+def estadisticas_lote(matriz: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Estadísticas de comportamiento de un lote de obligaciones
+    
+    Args:
+        matriz: Códigos de decodificar_lote (columna 0 = mes más reciente)
+        
+    Returns:
+        Dict de arreglos con un valor por obligación:
+        - meses_mora: meses con algún nivel de mora
+        - mora_maxima: nivel de mora más alto (0 si nunca estuvo en mora)
+        - racha_al_dia: meses seguidos al día más larga
+        - mora_ultimos_12 / mora_previos_12: meses en mora en los 12 meses más
+          recientes y en los 12 anteriores
+        - tendencia_12: mora_ultimos_12 - mora_previos_12 (positivo = empeora)
+    """
+    en_mora = matriz > AL_DIA
+    ultimos = en_mora[:, :12].sum(axis=1, dtype=np.int16)
+    previos = en_mora[:, 12:24].sum(axis=1, dtype=np.int16)
+    return {
+        'meses_mora': en_mora.sum(axis=1, dtype=np.int16),
+        'mora_maxima': np.maximum(matriz.max(axis=1, initial=AL_DIA), AL_DIA),
+        'racha_al_dia': racha_maxima(matriz == AL_DIA),
+        'mora_ultimos_12': ultimos,
+        'mora_previos_12': previos,
+        'tendencia_12': ultimos - previos
+    }
\ No newline at end of file